@@ -0,0 +1,107 @@
+"""
+Compares decoding reader pages the old way, with QImage on the calling thread followed
+by a smooth scale, with the image pipeline, which decodes straight to the shown size
+with QImageReader on a thread pool. Run from the repository root:
+
+    python -m benchmarks.decode_throughput [page count] [format]
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QBuffer, QEventLoop, QRect, Qt
+from PyQt6.QtGui import QColor, QImage, QPainter
+from PyQt6.QtWidgets import QApplication
+
+from yomu.core.imagepipeline import ImagePipeline, ImageSpec
+
+PAGE_WIDTH, PAGE_HEIGHT = 1600, 2400
+SHOWN_WIDTH = 922
+
+
+def make_page(seed: int, format: str) -> bytes:
+    # Enough shapes that the encoder can't cheat, like a scanned page
+    rng = random.Random(seed)
+    image = QImage(PAGE_WIDTH, PAGE_HEIGHT, QImage.Format.Format_RGB32)
+    image.fill(QColor("white"))
+    painter = QPainter(image)
+    for _ in range(400):
+        painter.fillRect(
+            QRect(
+                rng.randrange(PAGE_WIDTH),
+                rng.randrange(PAGE_HEIGHT),
+                rng.randrange(20, 300),
+                rng.randrange(20, 300),
+            ),
+            QColor(rng.randrange(256), rng.randrange(256), rng.randrange(256)),
+        )
+    painter.end()
+
+    buffer = QBuffer()
+    buffer.open(QBuffer.OpenModeFlag.WriteOnly)
+    image.save(buffer, format, 90)
+    return buffer.data().data()
+
+
+def decode_synchronously(pages: list[bytes]) -> tuple[float, float]:
+    start = time.perf_counter()
+    for data in pages:
+        image = QImage.fromData(data)
+        image.scaledToWidth(SHOWN_WIDTH, Qt.TransformationMode.SmoothTransformation)
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed
+
+
+def decode_with_pipeline(app: QApplication, pages: list[bytes]) -> tuple[float, float]:
+    # Returns the total time and the time the gui thread spent queueing the pages
+    pipeline = ImagePipeline(app)
+    spec = ImageSpec(width=SHOWN_WIDTH, upscale=False)
+    remaining = len(pages)
+    # Sleeps until the last page is done so the gui thread doesn't take cpu time from the pool
+    loop = QEventLoop()
+
+    def done(*_) -> None:
+        nonlocal remaining
+        remaining -= 1
+        if not remaining:
+            loop.quit()
+
+    start = time.perf_counter()
+    for data in pages:
+        task = pipeline.process(data, spec)
+        task.finished.connect(done)
+        task.failed.connect(done)
+    queued = time.perf_counter() - start
+    loop.exec()
+    elapsed = time.perf_counter() - start
+
+    pipeline.stop()
+    return elapsed, queued
+
+
+def main() -> None:
+    app = QApplication(sys.argv[:1])
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    format = sys.argv[2] if len(sys.argv) > 2 else "JPG"
+    pages = [make_page(i, format) for i in range(count)]
+
+    threads = ImagePipeline(app).thread_pool.maxThreadCount()
+    print(
+        f"{count} {format} pages of {PAGE_WIDTH}x{PAGE_HEIGHT}, {threads} pool threads"
+    )
+    for name, (elapsed, blocked) in (
+        ("QImage + scale", decode_synchronously(pages)),
+        ("ImagePipeline", decode_with_pipeline(app, pages)),
+    ):
+        print(
+            f"{name:>14}: {count / elapsed:6.1f} pages/s, {elapsed * 1000:6.0f} ms total, "
+            f"{blocked * 1000:6.0f} ms on the gui thread"
+        )
+
+
+if __name__ == "__main__":
+    main()
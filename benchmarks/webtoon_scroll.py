@@ -0,0 +1,53 @@
+"""
+Times scrolling through a long chapter in the webtoon view.
+
+Every scroll works out which pages stay decoded and the page loader then fetches the missing
+ones, so the time per scroll should stay the same whatever the page count. Pages are served
+from a page cache that always hits so only the scheduling is timed. Run from the repository
+root:
+
+    python -m benchmarks.webtoon_scroll [page counts...]
+"""
+
+import sys
+import time
+
+from PyQt6.QtWidgets import QApplication
+
+from tests.conftest import ReaderWindow, make_chapter
+
+SCROLL_STEP = 120
+SCROLLS = 500
+
+
+def run(count: int) -> tuple[float, float]:
+    window = ReaderWindow()
+    window.show()
+    window.open_chapter(make_chapter(), count)
+
+    scrollbar = window.reader.verticalScrollBar()
+    times = []
+    # Long chapters are scrolled just as far so only the page count differs
+    end = min(scrollbar.maximum(), SCROLL_STEP * SCROLLS)
+    for value in range(0, end, SCROLL_STEP):
+        start = time.perf_counter()
+        scrollbar.setValue(value)
+        window.settle()
+        times.append(time.perf_counter() - start)
+
+    window.close()
+    window.deleteLater()
+    return sum(times) / len(times) * 1000, max(times) * 1000
+
+
+def main() -> None:
+    app = QApplication(sys.argv[:1])
+    counts = [int(count) for count in sys.argv[1:]] or [50, 500, 2000]
+    for count in counts:
+        mean, worst = run(count)
+        print(f"{count:>5} pages: {mean:.3f} ms per scroll, {worst:.3f} ms worst")
+        app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt6.QtCore import QCoreApplication, QObject
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QApplication, QScrollArea, QWidget
+
+from yomu.core.models import Chapter, Manga, Page
+from yomu.core.pagecache import PageKey
+from yomu.ui.reader.loader import PageLoader
+from yomu.ui.reader.page import PageView
+from yomu.ui.reader.view.webtoon import WebtoonView
+
+PAGE_WIDTH, PAGE_HEIGHT = 800, 1200
+
+
+class FakeSettings:
+    def __init__(self) -> None:
+        self.values: dict[str, object] = {}
+
+    def value(self, key: str, default: object = None, type: type | None = None):
+        return self.values.get(key, default)
+
+
+class FakePageCache:
+    # Every page is a cache hit so the pages the loader fetches are shown straight away
+    def get(self, key: PageKey) -> QPixmap:
+        width, height = key[3], key[4]
+        if height <= 0:
+            height = width * PAGE_HEIGHT // PAGE_WIDTH
+        return QPixmap(width, height)
+
+
+class FakeApp(QObject):
+    def __init__(self) -> None:
+        super().__init__()
+        self.settings = FakeSettings()
+        self.page_cache = FakePageCache()
+
+
+class FakeReader(QScrollArea):
+    def __init__(self, parent: QWidget) -> None:
+        super().__init__(parent)
+        self.pages: list[PageView] = []
+        self.page_loader = PageLoader(self)
+        self.current_view = WebtoonView(self)
+        self.current_view.page_changed.connect(self.page_loader.update)
+        self.setWidget(self.current_view)
+        self.setWidgetResizable(True)
+
+    def mark_chapter_as_read(self) -> None: ...
+
+
+class ReaderWindow(QWidget):
+    """A webtoon reader with the real page loader whose pages all come from the page cache"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.app = FakeApp()
+        self.reader = FakeReader(self)
+        self.resize(1000, 900)
+        self.reader.resize(1000, 900)
+
+    def open_chapter(self, chapter: Chapter, count: int) -> None:
+        reader, view = self.reader, self.reader.current_view
+        reader.pages = [
+            PageView(
+                view,
+                Page(i, chapter, str(i), True, width=PAGE_WIDTH, height=PAGE_HEIGHT),
+            )
+            for i in range(count)
+        ]
+        view.set_page_views(reader.pages)
+        view.current_index = 0
+        reader.page_loader.set_pages(reader.pages)
+        self.settle()
+
+    def settle(self) -> None:
+        # Runs the coalesced resident page and page loader updates until nothing is left to load
+        view = self.reader.current_view
+        QApplication.processEvents()
+        while (
+            view._resident_timer.isActive() or self.reader.page_loader._timer.isActive()
+        ):
+            QApplication.processEvents()
+
+
+def make_chapter() -> Chapter:
+    manga = Manga(
+        id=1,
+        title="Manga",
+        url="/manga",
+        source=None,
+        description=None,
+        author=None,
+        artist=None,
+        thumbnail="",
+        library=False,
+        initialized=True,
+    )
+    return Chapter(
+        id=2,
+        title="Chapter 1",
+        url="/chapter",
+        number=0,
+        manga=manga,
+        uploaded=None,
+        downloaded=True,
+        read=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def qapp() -> QCoreApplication:
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def chapter() -> Chapter:
+    return make_chapter()
+
+
+@pytest.fixture
+def reader_window(qapp):
+    window = ReaderWindow()
+    window.show()
+    yield window
+    window.close()
+    window.deleteLater()
@@ -0,0 +1,84 @@
+import pytest
+from PyQt6.QtCore import pyqtSignal, QEventLoop, QObject, QSize
+from PyQt6.QtGui import QColor, QImage
+
+from yomu.core import utils
+from yomu.core.bitmapcache import BitmapCache
+from yomu.core.diskwriter import DiskWriter
+from yomu.core.imagepipeline import ImagePipeline
+from yomu.core.models import Chapter, Page
+
+
+class FakeSettings(QObject):
+    value_changed = pyqtSignal((str, object))
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.values = {}
+
+    def value(self, key: str, default: object = None, type: type | None = None):
+        return self.values.get(key, default)
+
+    def setValue(self, key: str, value: object) -> None:
+        self.values[key] = value
+        self.value_changed.emit(key, value)
+
+
+class FakeDownloader(QObject):
+    chapter_deleted = pyqtSignal(Chapter)
+
+
+class FakeApp(QObject):
+    aboutToQuit = pyqtSignal()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.settings = FakeSettings()
+        self.downloader = FakeDownloader()
+        self.image_pipeline = ImagePipeline(self)
+
+
+@pytest.fixture
+def app(qapp, tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "cache_dir_path", lambda: str(tmp_path))
+    app = FakeApp()
+    yield app
+    app.aboutToQuit.emit()
+    app.image_pipeline.stop()
+
+
+def writers(cache: BitmapCache) -> list[DiskWriter]:
+    return cache.findChildren(DiskWriter)
+
+
+def test_writer_is_started_once_enabled(qapp, app, chapter):
+    cache = BitmapCache(app)
+    assert not writers(cache)
+
+    page, size = Page(0, chapter, "0.png", False), QSize(400, 600)
+    image = QImage(size, QImage.Format.Format_RGB32)
+    image.fill(QColor("red"))
+    cache.put(page, size, image)
+    assert cache.load(page, size, cache) is None
+    assert not writers(cache)
+
+    app.settings.setValue("bitmap_cache_size", 64)
+    assert len(writers(cache)) == 1
+    app.settings.setValue("bitmap_cache_size", 128)
+    assert len(writers(cache)) == 1
+
+    cache.put(page, size, image)
+    writer = writers(cache)[0]
+    done = []
+    writer.submit(lambda: None, finished=done.append)
+    while not done:
+        qapp.processEvents()
+
+    task = cache.load(page, size, cache)
+    assert task is not None
+    images = []
+    loop = QEventLoop()
+    task.finished.connect(lambda image, _: (images.append(image), loop.quit()))
+    task.failed.connect(loop.quit)
+    loop.exec()
+    assert images and images[0].size() == size
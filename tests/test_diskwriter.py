@@ -0,0 +1,83 @@
+import os
+import threading
+
+from PyQt6.QtCore import QObject
+
+from yomu.core.diskwriter import DiskWriter
+
+
+def test_submit_never_blocks(qapp):
+    parent = QObject()
+    writer = DiskWriter(parent)
+    release = threading.Event()
+    writer.submit(release.wait)
+
+    # the writer thread is stuck on the first job so a bounded queue would block
+    results = []
+    for i in range(1000):
+        writer.submit(lambda i=i: i, finished=results.append)
+
+    release.set()
+    writer.stop()
+    qapp.processEvents()
+    assert results == list(range(1000))
+
+
+def test_remove_directory(qapp, tmp_path):
+    parent = QObject()
+    writer = DiskWriter(parent)
+    path = tmp_path / "chapter"
+    path.mkdir()
+    (path / "0.png").write_bytes(b"page")
+
+    removed = []
+    writer.removed.connect(removed.append)
+    writer.remove(str(path))
+    writer.stop()
+    qapp.processEvents()
+
+    assert not os.path.exists(path)
+    assert removed == [str(path)]
+
+
+def test_consecutive_removals_share_a_job(qapp, tmp_path):
+    parent = QObject()
+    writer = DiskWriter(parent)
+    release = threading.Event()
+    writer.submit(release.wait)
+
+    paths = []
+    for i in range(100):
+        path = tmp_path / f"{i}.png"
+        path.write_bytes(b"page")
+        paths.append(str(path))
+    removed = []
+    writer.removed.connect(removed.append)
+    for path in paths:
+        writer.remove(path)
+    assert not writer.busy
+
+    # a job in between keeps the removals after it from running before it
+    writer.submit(lambda: None)
+    writer.remove(paths[0])
+    assert writer._pending == 4
+
+    release.set()
+    writer.stop()
+    qapp.processEvents()
+    assert not any(os.path.exists(path) for path in paths)
+    assert removed == [*paths, paths[0]]
+
+
+def test_busy_once_jobs_pile_up(qapp):
+    parent = QObject()
+    writer = DiskWriter(parent)
+    release = threading.Event()
+    for _ in range(writer.max_pending):
+        writer.submit(release.wait)
+    assert writer.busy
+
+    release.set()
+    writer.stop()
+    qapp.processEvents()
+    assert not writer.busy
@@ -0,0 +1,161 @@
+import os
+
+import pytest
+from PyQt6.QtCore import pyqtSignal, QObject
+
+from yomu.core import utils
+from yomu.core.diskwriter import DiskWriter
+from yomu.core.downloader import Downloader
+from yomu.core.models import Chapter, Manga
+
+
+class FakeSettings:
+    def __init__(self) -> None:
+        self.values: dict[str, object] = {}
+
+    def value(self, key: str, default: object = None, type: type | None = None):
+        return self.values.get(key, default)
+
+
+class FakeNetwork(QObject):
+    network_status_changed = pyqtSignal(object)
+    metered_changed = pyqtSignal(bool)
+
+
+class FakeSql:
+    def __init__(self) -> None:
+        self.unmeasured: list[tuple[int, int]] = []
+        self.sizes: dict[int, int] = {}
+
+    def get_unmeasured_chapters(self) -> list[tuple[int, int]]:
+        return self.unmeasured
+
+    def set_chapter_sizes(self, sizes: list[tuple[int, int]]) -> None:
+        self.sizes.update(sizes)
+        self.unmeasured = []
+
+    def get_download_usage(self) -> int:
+        return sum(self.sizes.values())
+
+    def get_eviction_candidates(self) -> list[tuple[int, int]]:
+        return list(self.sizes.items())
+
+    def is_chapter_prefetched(self, chapter: Chapter) -> bool:
+        return True
+
+    def mark_chapters_download_status(
+        self, chapter: Chapter, downloaded: bool, **kwargs
+    ) -> bool:
+        changed = chapter.downloaded != downloaded
+        chapter.downloaded = downloaded
+        return changed
+
+
+class FakeApp(QObject):
+    aboutToStart = pyqtSignal()
+    aboutToQuit = pyqtSignal()
+    chapter_read_status_changed = pyqtSignal(Chapter)
+    manga_library_status_changed = pyqtSignal(Manga)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.settings = FakeSettings()
+        self.network = FakeNetwork()
+        self.sql = FakeSql()
+
+
+def wait_for_disk(qapp, writer: DiskWriter) -> None:
+    done = []
+    writer.submit(lambda: None, finished=done.append)
+    while not done:
+        qapp.processEvents()
+
+
+@pytest.fixture
+def downloader(qapp, tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "app_data_path", lambda: str(tmp_path))
+    app = FakeApp()
+    downloader = Downloader(app)
+    yield downloader
+    downloader.disk_writer.stop()
+
+
+def download(chapter: Chapter) -> str:
+    path = Downloader.resolve_path(chapter)
+    os.makedirs(path)
+    with open(os.path.join(path, "0.png"), "wb") as f:
+        f.write(b"page")
+    return path
+
+
+def test_read_chapter_is_deleted(qapp, downloader, chapter):
+    path = download(chapter)
+
+    chapter.read = True
+    downloader.app.chapter_read_status_changed.emit(chapter)
+    wait_for_disk(qapp, downloader.disk_writer)
+
+    assert not os.path.exists(path)
+    assert not chapter.downloaded
+
+
+def test_open_chapter_is_deleted_once_closed(qapp, downloader, chapter):
+    path = download(chapter)
+    downloader.open_chapter(chapter)
+
+    chapter.read = True
+    downloader.app.chapter_read_status_changed.emit(chapter)
+    wait_for_disk(qapp, downloader.disk_writer)
+
+    assert os.path.exists(os.path.join(path, "0.png"))
+    assert chapter.downloaded
+
+    downloader.close_chapter(chapter)
+    wait_for_disk(qapp, downloader.disk_writer)
+
+    assert not os.path.exists(path)
+    assert not chapter.downloaded
+
+
+def test_chapter_open_in_two_readers(qapp, downloader, chapter):
+    path = download(chapter)
+    downloader.open_chapter(chapter)
+    downloader.open_chapter(chapter)
+
+    chapter.read = True
+    downloader.app.chapter_read_status_changed.emit(chapter)
+    downloader.close_chapter(chapter)
+    wait_for_disk(qapp, downloader.disk_writer)
+    assert os.path.exists(path)
+
+    downloader.close_chapter(chapter)
+    wait_for_disk(qapp, downloader.disk_writer)
+    assert not os.path.exists(path)
+
+
+def test_marked_unread_before_closing(qapp, downloader, chapter):
+    path = download(chapter)
+    downloader.open_chapter(chapter)
+
+    chapter.read = True
+    downloader.app.chapter_read_status_changed.emit(chapter)
+    chapter.read = False
+    downloader.app.chapter_read_status_changed.emit(chapter)
+    downloader.close_chapter(chapter)
+    wait_for_disk(qapp, downloader.disk_writer)
+
+    assert os.path.exists(os.path.join(path, "0.png"))
+    assert chapter.downloaded
+
+
+def test_chapters_without_a_size_are_measured(qapp, downloader, chapter):
+    download(chapter)
+    sql = downloader.app.sql
+    sql.unmeasured = [(chapter.id, chapter.manga.id)]
+    downloader.app.settings.values["download_quota"] = 1
+
+    downloader.enforce_quota()
+    wait_for_disk(qapp, downloader.disk_writer)
+
+    assert sql.sizes == {chapter.id: len(b"page")}
+    assert chapter.downloaded
@@ -0,0 +1,76 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from yomu.ui.reader.loader import PageLoader
+from yomu.ui.reader.page import PageView
+
+
+class FakePage(QObject):
+    status_changed = pyqtSignal(PageView.Status)
+    reads = 0
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._status = PageView.Status.NULL
+
+    @property
+    def status(self) -> PageView.Status:
+        FakePage.reads += 1
+        return self._status
+
+    @status.setter
+    def status(self, status: PageView.Status) -> None:
+        self._status = status
+        self.status_changed.emit(status)
+
+    def fetch_page(self, priority) -> None:
+        self.status = PageView.Status.LOADING
+
+    def set_priority(self, priority) -> None: ...
+
+    def rescale(self) -> None: ...
+
+    def release(self) -> None:
+        self.status = PageView.Status.NULL
+
+
+class FakeView:
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.current = 0
+
+    def visible_pages(self) -> range:
+        return range(self.current, self.current + 1)
+
+    def loadable_pages(self) -> range:
+        return range(self.count)
+
+
+class FakeReader(QObject):
+    def __init__(self, count: int) -> None:
+        super().__init__()
+        self.current_view = FakeView(count)
+
+
+def test_schedule_only_looks_near_the_visible_pages(qapp) -> None:
+    reader = FakeReader(2000)
+    loader = PageLoader(reader)
+    pages = [FakePage() for _ in range(2000)]
+    loader.set_pages(pages)
+
+    reader.current_view.current = 1000
+    FakePage.reads = 0
+    loader._schedule()
+    assert FakePage.reads < 5 * loader.cancel_distance
+    loading = [
+        i for i, page in enumerate(pages) if page._status == PageView.Status.LOADING
+    ]
+    assert loading == [998, 999, 1000, 1001, 1002, 1003]
+
+    reader.current_view.current = 1500
+    FakePage.reads = 0
+    loader._schedule()
+    assert FakePage.reads < 5 * loader.cancel_distance
+    loading = [
+        i for i, page in enumerate(pages) if page._status == PageView.Status.LOADING
+    ]
+    assert loading == [1498, 1499, 1500, 1501, 1502, 1503]
@@ -0,0 +1,112 @@
+import pytest
+from PyQt6.QtCore import QBuffer, QObject, QRect, QSize
+from PyQt6.QtGui import QColor, QImage
+from PyQt6.QtWidgets import QWidget
+
+from yomu.core.imagepipeline import ImagePipeline, probe_image
+from yomu.core.models import Page
+from yomu.ui.reader.page import PageView
+
+
+def encode(image: QImage, format: str) -> bytes:
+    buffer = QBuffer()
+    buffer.open(QBuffer.OpenModeFlag.WriteOnly)
+    image.save(buffer, format)
+    return buffer.data().data()
+
+
+def tall_image(format: str) -> bytes:
+    image = QImage(400, PageView.TILE_HEIGHT * 5, QImage.Format.Format_RGB32)
+    image.fill(QColor("white"))
+    return encode(image, format)
+
+
+class CountingPipeline(ImagePipeline):
+    def __init__(self, parent: QObject) -> None:
+        super().__init__(parent)
+        self.clips = []
+
+    def process(self, data, spec, owner=None, *, priority=0):
+        self.clips.append(spec.clip)
+        return super().process(data, spec, owner, priority=priority)
+
+
+class FakeCache:
+    def add(self, *args) -> None: ...
+
+
+class FakeView(QWidget):
+    def page_size(self) -> QSize:
+        return QSize(400, 0)
+
+
+class FakeApp(QObject):
+    def __init__(self) -> None:
+        super().__init__()
+        self.image_pipeline = CountingPipeline(self)
+        self.preview_cache = FakeCache()
+
+
+class FakeWindow(QWidget):
+    def __init__(self) -> None:
+        super().__init__()
+        self.app = FakeApp()
+        self.reader = QObject()
+        self.reader.current_view = FakeView(self)
+
+
+def wait_for(qapp, pipeline: ImagePipeline) -> None:
+    pipeline.thread_pool.waitForDone()
+    qapp.processEvents()
+
+
+@pytest.fixture
+def page_view(qapp, chapter):
+    window = FakeWindow()
+    view = PageView(window.reader.current_view, Page(0, chapter, "0", False))
+    view.resize(400, PageView.TILE_HEIGHT * 5)
+    yield view
+    window.app.image_pipeline.stop()
+    window.deleteLater()
+
+
+def test_probe_partial_decode():
+    assert probe_image(tall_image("JPG")).partial_decode
+    assert not probe_image(tall_image("PNG")).partial_decode
+
+
+def test_png_tiles_are_cut_from_one_decode(qapp, page_view):
+    pipeline = page_view.window().app.image_pipeline
+    page_view._decoded_size = page_view.target_size
+    page_view._load_image(tall_image("PNG"))
+    wait_for(qapp, pipeline)
+
+    assert page_view.tiled
+    assert pipeline.clips == [None]
+    assert len(page_view._tiles) == 5
+    # The decoded image isn't kept once the tiles are cut from it
+    assert page_view.image().isNull()
+
+    page_view.set_exposed(QRect(0, 0, 400, PageView.TILE_HEIGHT))
+    assert list(page_view._tiles) == [0]
+    page_view.set_exposed(QRect(0, PageView.TILE_HEIGHT * 3, 400, PageView.TILE_HEIGHT))
+    wait_for(qapp, pipeline)
+    assert pipeline.clips == [None, None]
+    assert list(page_view._tiles) == [3]
+
+
+def test_jpeg_tiles_are_decoded_separately(qapp, page_view):
+    pipeline = page_view.window().app.image_pipeline
+    page_view._decoded_size = page_view.target_size
+    page_view._load_image(tall_image("JPG"))
+    wait_for(qapp, pipeline)
+
+    assert page_view.tiled
+    assert len(pipeline.clips) == 5
+    assert all(clip is not None for clip in pipeline.clips)
+    assert page_view.image().isNull()
+
+    images = []
+    page_view.request_image(images.append)
+    wait_for(qapp, pipeline)
+    assert images[0].size() == page_view.image_size
@@ -0,0 +1,76 @@
+import pytest
+from PyQt6.QtCore import pyqtSignal, QObject
+from PyQt6.QtWidgets import QWidget
+
+from yomu.core.models import Chapter
+from yomu.core.network import Response
+from yomu.ui.reader.preload import ChapterPreloader
+
+
+class FakeRequest:
+    def setPriority(self, priority) -> None: ...
+
+
+class FakeSource:
+    name = "Source"
+
+    def parse_chapter_pages(self, response, chapter) -> list:
+        return []
+
+
+class FakeResponse(QObject):
+    finished = pyqtSignal()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._error = Response.Error.NoError
+
+    def error(self) -> Response.Error:
+        return self._error
+
+
+class FakeNetwork:
+    is_online = True
+
+    def __init__(self) -> None:
+        self.responses: list[FakeResponse] = []
+
+    def handle_request(self, request: FakeRequest) -> FakeResponse:
+        self.responses.append(FakeResponse())
+        return self.responses[-1]
+
+
+class FakeWindow(QWidget):
+    def __init__(self) -> None:
+        super().__init__()
+        self.network = FakeNetwork()
+        self.reader = QWidget(self)
+
+
+@pytest.fixture
+def preloader(qapp, chapter, monkeypatch):
+    monkeypatch.setattr(Chapter, "get_pages", lambda self: FakeRequest())
+    chapter.downloaded = False
+    chapter.manga.source = FakeSource()
+    window = FakeWindow()
+    preloader = ChapterPreloader(window.reader)
+    yield preloader
+    window.deleteLater()
+
+
+@pytest.mark.parametrize(
+    "error", [Response.Error.ContentNotFoundError, Response.Error.NoError]
+)
+def test_failed_preload_is_cleared(preloader, chapter, error):
+    # Without an error the source doesn't find any pages
+    failed = []
+    preloader.failed.connect(failed.append)
+    preloader.preload(chapter)
+    assert preloader.is_preloading(chapter)
+
+    response = preloader.reader.window().network.responses[0]
+    response._error = error
+    response.finished.emit()
+
+    assert not preloader.is_preloading(chapter)
+    assert failed == [chapter]
@@ -0,0 +1,85 @@
+import builtins
+
+import pytest
+from PyQt6.QtCore import pyqtSignal, QEventLoop, QObject
+from PyQt6.QtGui import QColor, QImage
+
+from yomu.core import utils
+from yomu.core.imagepipeline import ImagePipeline
+from yomu.core.models import Page
+from yomu.core.previewcache import PreviewCache
+
+
+class FakeApp(QObject):
+    aboutToQuit = pyqtSignal()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.image_pipeline = ImagePipeline(self)
+
+
+@pytest.fixture
+def app(qapp, tmp_path, monkeypatch):
+    monkeypatch.setattr(utils, "cache_dir_path", lambda: str(tmp_path))
+    app = FakeApp()
+    yield app
+    app.aboutToQuit.emit()
+    app.image_pipeline.stop()
+
+
+def page_image() -> QImage:
+    image = QImage(400, 600, QImage.Format.Format_RGB32)
+    image.fill(QColor("red"))
+    return image
+
+
+def wait_for_disk(qapp, cache: PreviewCache) -> None:
+    done = []
+    cache._writer.submit(lambda: None, finished=done.append)
+    while not done:
+        qapp.processEvents()
+
+
+def load(cache: PreviewCache, page: Page, **kwargs) -> QImage | None:
+    task = cache.load(page, cache, **kwargs)
+    if task is None:
+        return None
+
+    images = []
+    loop = QEventLoop()
+    task.finished.connect(lambda image, _: (images.append(image), loop.quit()))
+    task.failed.connect(loop.quit)
+    loop.exec()
+    return images[0] if images else None
+
+
+def test_previews_are_found_after_restart(qapp, app, chapter):
+    page = Page(0, chapter, "0.png", False)
+    cache = PreviewCache(app)
+    cache.add(page, page_image())
+    app.image_pipeline.thread_pool.waitForDone()
+    qapp.processEvents()
+    wait_for_disk(qapp, cache)
+
+    cache = PreviewCache(app)
+    wait_for_disk(qapp, cache)
+    assert cache.get(page) is None
+    image = load(cache, page)
+    assert image is not None and image.width() == PreviewCache.WIDTH
+    assert load(cache, Page(1, chapter, "1.png", False)) is None
+
+
+def test_preview_is_made_from_saved_page(qapp, app, chapter, tmp_path, monkeypatch):
+    path = tmp_path / "0.png"
+    page_image().save(str(path))
+    page = Page(0, chapter, str(path), True)
+    cache = PreviewCache(app)
+    wait_for_disk(qapp, cache)
+
+    def forbidden(*args, **kwargs):
+        raise AssertionError("read a file on the gui thread")
+
+    monkeypatch.setattr(builtins, "open", forbidden)
+    assert load(cache, page) is None
+    image = load(cache, page, create=True)
+    assert image is not None and image.width() == PreviewCache.WIDTH
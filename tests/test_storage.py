@@ -0,0 +1,90 @@
+import mmap
+import os
+import weakref
+import zipfile
+
+import pytest
+
+from yomu.core.storage import (
+    ArchiveChapterWriter,
+    ChapterArchive,
+    ChapterManifest,
+    FolderChapterWriter,
+)
+
+
+@pytest.fixture
+def archive_path(tmp_path) -> str:
+    path = str(tmp_path / "chapter.cbz")
+    writer = ArchiveChapterWriter(path)
+    for i in range(3):
+        writer.write_page(f"{i}.png", f"page {i}".encode(), page_count=3)
+    writer.finish()
+    return path
+
+
+def test_read_pages(archive_path):
+    archive = ChapterArchive(archive_path)
+    assert archive.verify()
+    assert bytes(archive.read("1.png")) == b"page 1"
+    assert archive.read("3.png") is None
+    archive.close()
+
+
+def test_close_keeps_pages_being_read(archive_path):
+    archive = ChapterArchive(archive_path)
+    page = archive.read("0.png")
+    archive.close()
+
+    assert archive.closed
+    assert archive.read("0.png") is None
+    # A page queued for decoding is still readable and the map goes with it
+    assert bytes(page) == b"page 0"
+    mapped = weakref.ref(page.obj)
+    del page
+    assert mapped() is None
+
+
+def test_failed_open_closes_map(tmp_path, monkeypatch):
+    path = str(tmp_path / "chapter.cbz")
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("0.png", b"page 0")
+
+    maps = []
+    original = mmap.mmap
+
+    def track(*args, **kwargs):
+        maps.append(original(*args, **kwargs))
+        return maps[-1]
+
+    monkeypatch.setattr(mmap, "mmap", track)
+    with pytest.raises(FileNotFoundError):
+        ChapterArchive(path)
+    assert maps and maps[0].closed
+
+
+def test_folder_manifest_is_written_on_finish(tmp_path):
+    path = str(tmp_path / "chapter")
+    writer = FolderChapterWriter(path)
+    for i in range(3):
+        writer.write_page(f"{i}.png", f"page {i}".encode(), page_count=3)
+    assert ChapterManifest.load(path) is None
+
+    writer.finish()
+    manifest = ChapterManifest.load(path)
+    assert manifest is not None and manifest.verify(path)
+    assert [page.name for page in manifest.pages] == ["0.png", "1.png", "2.png"]
+
+
+def test_folder_discard_removes_directory(tmp_path):
+    path = str(tmp_path / "chapter")
+    writer = FolderChapterWriter(path)
+    writer.write_page("0.png", b"page 0", page_count=2)
+    writer.discard()
+    assert not os.path.exists(path)
+
+    # the directory is made again if the chapter is downloaded again
+    writer = FolderChapterWriter(path)
+    writer.write_page("0.png", b"page 0", page_count=1)
+    writer.finish()
+    assert ChapterManifest.load(path) is not None
@@ -0,0 +1,44 @@
+import pytest
+
+from yomu.ui.reader.page import PageView
+
+BUDGET = 32
+
+
+@pytest.fixture
+def reader(reader_window, chapter):
+    reader_window.app.settings.values["reader_memory_budget"] = BUDGET
+    reader_window.open_chapter(chapter, 120)
+    return reader_window.reader
+
+
+def resident_bytes(reader) -> int:
+    return sum(page.pixmap_bytes for page in reader.pages)
+
+
+def test_resident_pages_stay_within_budget(reader):
+    scrollbar = reader.verticalScrollBar()
+    peak = 0
+    for value in range(0, scrollbar.maximum(), 600):
+        scrollbar.setValue(value)
+        reader.window().settle()
+        peak = max(peak, resident_bytes(reader))
+
+    assert 0 < peak <= BUDGET * 1024 * 1024
+    assert reader.pages[-1].status == PageView.Status.LOADED
+    assert reader.pages[0].status == PageView.Status.NULL
+
+
+def test_scrolling_is_coalesced(reader):
+    scrollbar = reader.verticalScrollBar()
+    for value in range(0, 20000, 100):
+        scrollbar.setValue(value)
+    # Nothing is loaded until the scroll events settle
+    view = reader.current_view
+    visible = view.pages_between(value, value + reader.viewport().height())
+    assert visible
+    assert all(reader.pages[i].status == PageView.Status.NULL for i in visible)
+
+    reader.window().settle()
+    assert view.visible_pages() == visible
+    assert all(reader.pages[i].status == PageView.Status.LOADED for i in visible)
@@ -176,15 +176,23 @@ class YomuApp(QApplication):
 
         self._windows: list[ReaderWindow] = []
 
+        from .bitmapcache import BitmapCache
         from .downloader import Downloader
+        from .imagepipeline import ImagePipeline
         from .network import Network
+        from .pagecache import PageCache
+        from .previewcache import PreviewCache
         from .sourcemanager import SourceManager
         from .sql import Sql
         from .updater import Updater
 
         self.settings = AppSettings(self)
         self.network = Network(self)
+        self.image_pipeline = ImagePipeline(self)
+        self.page_cache = PageCache(self)
+        self.preview_cache = PreviewCache(self)
         self.downloader = Downloader(self)
+        self.bitmap_cache = BitmapCache(self)
         self.updater = Updater(self)
         self.source_manager = SourceManager(self)
         self.sql = Sql(self)
@@ -297,6 +305,7 @@ class YomuApp(QApplication):
         exit_code = super().exec()
 
         self.sql.commit()
+        self.image_pipeline.stop()
         self.ipc_server.close()
         QDir(utils.temp_dir_path()).removeRecursively()
 
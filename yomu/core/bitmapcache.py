@@ -0,0 +1,181 @@
+import mmap
+import os
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QObject, QSize
+from PyQt6.QtGui import QImage
+
+from .diskwriter import DiskWriter
+from .imagepipeline import encode_raw, ImageSpec, ImageTask
+from .pagecache import PageCache, PageKey
+from .storage import atomic_write
+from . import utils
+
+if TYPE_CHECKING:
+    from .app import YomuApp
+    from .models import Chapter, Page
+
+__all__ = ("BitmapCache",)
+
+
+class BitmapCache(QObject):
+    """
+    Pages decoded at the size the reader shows them, saved to disk uncompressed so reopening
+    a chapter only has to read them instead of decoding them again.
+
+    Files are memory mapped when they're read. The budget is read from the `bitmap_cache_size`
+    setting in megabytes and the cache is off while it's 0. The least recently used pages are
+    deleted once it's full. The cache doesn't touch the disk until it's turned on.
+    """
+
+    EXTENSION = ".raw"
+
+    def __init__(self, app: YomuApp) -> None:
+        super().__init__(app)
+        self.app = app
+        self.path = os.path.join(utils.cache_dir_path(), "bitmaps")
+        self._files: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._max_size = app.settings.value("bitmap_cache_size", 0, int) * 1024 * 1024
+        self._writer: DiskWriter | None = None
+        if self.enabled:
+            self._start_writer()
+
+        app.settings.value_changed.connect(self._settings_changed)
+        app.downloader.chapter_deleted.connect(self.remove_chapter)
+
+    def _start_writer(self) -> None:
+        # Pages are only ever read, written or deleted once the cache has been turned on
+        if self._writer is not None:
+            return
+
+        self._writer = DiskWriter(self)
+        self._writer.submit(self._scan, finished=self._scanned)
+        self.app.aboutToQuit.connect(self._writer.stop)
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _name(key: PageKey) -> str:
+        return "_".join(str(int(value)) for value in key) + BitmapCache.EXTENSION
+
+    def load(self, page: Page, size: QSize, owner: QObject) -> ImageTask | None:
+        """
+        Reads a page decoded at a size from disk
+
+        Parameters
+        ----------
+        page : Page
+            The page
+        size : QSize
+            The size it was decoded to, see `PageCache.key`
+        owner : QObject
+            The object the page is for. Reading it is cancelled once it's deleted
+
+        Returns
+        -------
+        ImageTask | None
+            The task the page is read by, or None if it isn't cached
+        """
+        name = BitmapCache._name(PageCache.key(page, size))
+        if not self.enabled or name not in self._files:
+            return None
+
+        path = os.path.join(self.path, name)
+        try:
+            with open(path, "rb") as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self._size -= self._files.pop(name)
+            return None
+
+        # The modification time keeps the order pages were used in across restarts
+        self._files.move_to_end(name)
+        self._writer.submit(os.utime, path)
+
+        task = self.app.image_pipeline.process(memoryview(mapping), ImageSpec(), owner)
+        task.failed.connect(lambda: self._remove(name))
+        return task
+
+    def put(self, page: Page, size: QSize, image: QImage) -> None:
+        """
+        Saves a decoded page
+
+        Parameters
+        ----------
+        page : Page
+            The page
+        size : QSize
+            The size it was decoded to, see `PageCache.key`
+        image : QImage
+            The decoded page
+        """
+        name = BitmapCache._name(PageCache.key(page, size))
+        if not self.enabled or name in self._files:
+            return
+        if self._writer.busy:
+            # The page can always be decoded again, it's not worth queueing up memory for
+            return
+
+        self._files[name] = image.sizeInBytes()
+        self._size += image.sizeInBytes()
+        self._writer.submit(self._write, os.path.join(self.path, name), image)
+        self._evict()
+
+    def remove_chapter(self, chapter: Chapter) -> None:
+        # The pages of a deleted chapter might not be the same if it's downloaded again
+        prefix = f"{chapter.id}_"
+        for name in [name for name in self._files if name.startswith(prefix)]:
+            if name.split("_")[2] == "1":
+                self._remove(name)
+
+    def _remove(self, name: str) -> None:
+        if (size := self._files.pop(name, None)) is not None:
+            self._size -= size
+            self._writer.remove(os.path.join(self.path, name))
+
+    def _evict(self) -> None:
+        while self._size > self._max_size and self._files:
+            self._remove(next(iter(self._files)))
+
+    @staticmethod
+    def _write(path: str, image: QImage) -> None:
+        atomic_write(path, encode_raw(image))
+
+    def _scan(self) -> list[tuple[str, int]]:
+        try:
+            entries = list(os.scandir(self.path))
+        except FileNotFoundError:
+            return []
+
+        files = []
+        for entry in entries:
+            if not entry.name.endswith(BitmapCache.EXTENSION):
+                # Left behind by a write that didn't finish
+                os.remove(entry.path)
+                continue
+            stat = entry.stat()
+            files.append((stat.st_mtime, entry.name, stat.st_size))
+        return [(name, size) for _, name, size in sorted(files)]
+
+    def _scanned(self, files: list[tuple[str, int]]) -> None:
+        # Pages saved before the directory was read are the most recent ones
+        saved = self._files
+        self._files = OrderedDict(files)
+        self._files.update(saved)
+        self._size = sum(self._files.values())
+        self._evict()
+
+    def _settings_changed(self, key: str, value: object) -> None:
+        if key == "bitmap_cache_size":
+            self._max_size = int(value) * 1024 * 1024
+            if self.enabled:
+                self._start_writer()
+            self._evict()
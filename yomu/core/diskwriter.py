@@ -0,0 +1,205 @@
+import os
+import shutil
+import threading
+from collections.abc import Callable
+from logging import getLogger
+from queue import Queue
+
+from PyQt6.QtCore import pyqtSignal, QObject, QThread
+
+from .storage import atomic_write, forget_directories
+
+__all__ = ("DiskWriter",)
+
+logger = getLogger(__name__)
+
+
+class _Job:
+    __slots__ = ("fn", "args", "finished", "failed", "result", "error")
+
+    def __init__(
+        self,
+        fn: Callable[..., object],
+        args: tuple,
+        finished: Callable[[object], None] | None,
+        failed: Callable[[Exception], None] | None,
+    ) -> None:
+        self.fn = fn
+        self.args = args
+        self.finished = finished
+        self.failed = failed
+        self.result: object = None
+        self.error: Exception | None = None
+
+
+class _WriterThread(QThread):
+    job_done = pyqtSignal(object)
+
+    def __init__(self, parent: QObject, queue: Queue[_Job | None]) -> None:
+        super().__init__(parent)
+        self.queue = queue
+
+    def run(self) -> None:
+        while (job := self.queue.get()) is not None:
+            try:
+                job.result = job.fn(*job.args)
+            except Exception as e:
+                job.error = e
+            self.job_done.emit(job)
+
+
+def _remove(path: str) -> None:
+    forget_directories(path)
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    else:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            ...
+
+
+_Removal = tuple[str, Callable[[object], None] | None]
+
+
+def _read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class DiskWriter(QObject):
+    """
+    Runs file writes and deletes on a dedicated thread so slow disks never block the gui.
+
+    Jobs run one at a time in the order they were submitted. Their callbacks
+    are called on the gui thread once they're done. Submitting never blocks so
+    callers producing a lot of data should wait for their jobs to finish, or skip
+    writes they can do without while the writer is `busy`. Removals queued one
+    after the other are done by a single job.
+    """
+
+    # Jobs queued or running before the writer counts as busy
+    max_pending = 32
+
+    removed = pyqtSignal(str)
+
+    def __init__(self, parent: QObject) -> None:
+        super().__init__(parent)
+        self._queue: Queue[_Job | None] = Queue()
+        self._pending = 0
+        # The removals of the last job queued, if it's a removal job that hasn't started yet
+        self._removals: list[_Removal] | None = None
+        self._removals_lock = threading.Lock()
+        self._thread = _WriterThread(self, self._queue)
+        self._thread.job_done.connect(self._job_done)
+        self._thread.start(QThread.Priority.LowPriority)
+
+    @property
+    def busy(self) -> bool:
+        return self._pending >= self.max_pending
+
+    def _job_done(self, job: _Job) -> None:
+        self._pending -= 1
+        if job.error is not None:
+            logger.error(f"Disk job {job.fn.__name__} failed", exc_info=job.error)
+            if job.failed is not None:
+                job.failed(job.error)
+        elif job.finished is not None:
+            job.finished(job.result)
+
+    def submit(
+        self,
+        fn: Callable[..., object],
+        *args: object,
+        finished: Callable[[object], None] | None = None,
+        failed: Callable[[Exception], None] | None = None,
+    ) -> None:
+        """
+        Queues a function to run on the writer thread
+
+        Parameters
+        ----------
+        fn : Callable[..., object]
+            The function to run
+        *args : object
+            Arguments passed to the function
+        finished : Callable[[object], None] | None
+            Called with the return value of the function
+        failed : Callable[[Exception], None] | None
+            Called with the exception raised by the function
+        """
+        with self._removals_lock:
+            self._removals = None
+        self._put(_Job(fn, args, finished, failed))
+
+    def _put(self, job: _Job) -> None:
+        self._pending += 1
+        self._queue.put(job)
+
+    def write(
+        self,
+        path: str,
+        data: bytes,
+        *,
+        finished: Callable[[object], None] | None = None,
+        failed: Callable[[Exception], None] | None = None,
+    ) -> None:
+        self.submit(atomic_write, path, data, finished=finished, failed=failed)
+
+    def read(
+        self,
+        path: str,
+        *,
+        finished: Callable[[bytes], None],
+        failed: Callable[[Exception], None] | None = None,
+    ) -> None:
+        self.submit(_read, path, finished=finished, failed=failed)
+
+    def remove(
+        self, path: str, *, finished: Callable[[object], None] | None = None
+    ) -> None:
+        """
+        Queues a file or directory to be deleted. `removed` is emitted once it's gone.
+        Paths removed right after one another are deleted by the same job
+
+        Parameters
+        ----------
+        path : str
+            The file or directory. Directories are deleted recursively
+        finished : Callable[[object], None] | None
+            Called once the path is deleted
+        """
+        with self._removals_lock:
+            if self._removals is not None:
+                self._removals.append((path, finished))
+                return
+            self._removals = removals = [(path, finished)]
+        self._put(_Job(self._remove_all, (removals,), self._removed, None))
+
+    def _remove_all(self, removals: list[_Removal]) -> list[_Removal]:
+        # Runs on the writer thread, later removals go to a new job from here on
+        with self._removals_lock:
+            if self._removals is removals:
+                self._removals = None
+
+        done = []
+        for path, finished in removals:
+            try:
+                _remove(path)
+            except Exception as e:
+                logger.error(f"Failed to remove {path}", exc_info=e)
+                continue
+            done.append((path, finished))
+        return done
+
+    def _removed(self, removals: list[_Removal]) -> None:
+        for path, finished in removals:
+            self.removed.emit(path)
+            if finished is not None:
+                finished(None)
+
+    def stop(self) -> None:
+        """Waits for every queued job to finish and stops the writer thread"""
+        if self._thread.isRunning():
+            self._queue.put(None)
+            self._thread.wait()
@@ -1,16 +1,31 @@
 import os
+import shutil
 from copy import copy
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from email.utils import format_datetime
+from functools import partial
 from logging import getLogger
 from typing import overload, Sequence, TYPE_CHECKING
 
-from PyQt6.QtCore import pyqtSignal, QBuffer, QDir, QObject, Qt, QTimer, QFile
+from PyQt6.QtCore import pyqtSignal, QObject, Qt, QTimer
 from PyQt6.QtGui import QImage
 from PyQt6.QtNetwork import QNetworkInformation
 
+from .diskwriter import DiskWriter
+from .imagepipeline import ImagePipeline, probe_image
 from .models import Chapter, Manga
 from .network import Network, Request, Response, Url
+from .storage import (
+    LEGACY_THUMBNAIL_FILENAME,
+    ArchiveChapterWriter,
+    ChapterWriter,
+    FolderChapterWriter,
+    PageFormat,
+    PageStorageOptions,
+    StorageBackend,
+    ThumbnailSize,
+    ensure_directory,
+)
 from . import utils
 
 from yomu.source import Source, Page as SourcePage
@@ -22,17 +37,30 @@ logger = getLogger(__name__)
 
 
 class DownloadChapter(QObject):
-    page_downloaded = pyqtSignal((Chapter, int, int, bytes))
+    page_downloaded = pyqtSignal((Chapter, int, int, bytes, str))
     download_finished = pyqtSignal(Chapter)
     download_failed = pyqtSignal((Chapter, bool))
     aborted = pyqtSignal()
 
-    def __init__(self, parent: QObject, network: Network, chapter: Chapter) -> None:
+    def __init__(
+        self,
+        parent: QObject,
+        network: Network,
+        image_pipeline: ImagePipeline,
+        chapter: Chapter,
+        options: PageStorageOptions,
+        start: int = 0,
+    ) -> None:
         super().__init__(parent)
         self.network = network
+        self.image_pipeline = image_pipeline
         self.chapter = chapter
+        self.options = options
         self._pages: list[SourcePage] = []
-        self._index = -1
+        self._index = start - 1
+        self._extension = ""
+        # set while the last page is being written. the next one is requested after
+        self._saving = False
         self.cancelled = False
 
         self.get_pages()
@@ -87,7 +115,11 @@ class DownloadChapter(QObject):
         if not pages:
             return self._request_failed()
 
-        self.pages = sorted(pages, key=lambda page: page.number)
+        self._pages = sorted(pages, key=lambda page: page.number)
+        if self._index >= len(self._pages) - 1:
+            # resumed after the last page was saved
+            self.download_finished.emit(self.chapter)
+            return self.deleteLater()
         self.next_page()
 
     def next_page(self) -> None:
@@ -125,26 +157,41 @@ class DownloadChapter(QObject):
         except Exception:
             return self._request_failed()
 
-        image = QImage()
-        if not image.loadFromData(data):
+        info = probe_image(data)
+        if info is None:
             return self._request_failed()
-        image = image.scaledToWidth(900, Qt.TransformationMode.SmoothTransformation)
 
-        buffer = QBuffer(self)
-        buffer.open(QBuffer.OpenModeFlag.WriteOnly)
-        if not image.save(buffer, "JPG"):
-            return self._request_failed()
+        spec = self.options.image_spec(info)
+        if spec is None:
+            return self._page_ready(data, info.extension)
 
-        data = buffer.buffer().data()
-        buffer.deleteLater()
+        self._extension = spec.extension
+        task = self.image_pipeline.process(data, spec, self)
+        task.finished.connect(self._page_image_processed)
+        task.failed.connect(self._request_failed)
+
+    def _page_image_processed(self, _: QImage, data: bytes) -> None:
+        self._page_ready(data, self._extension)
+
+    def _page_ready(self, data: bytes, extension: str) -> None:
+        if self.cancelled:
+            return self._request_failed()
 
         length = len(self._pages)
-        self.page_downloaded.emit(self.chapter, self._index, length, data)
+        self.page_downloaded.emit(self.chapter, self._index, length, data, extension)
 
         if self._index >= length - 1:
             self.download_finished.emit(self.chapter)
             return self.deleteLater()
 
+        self._saving = True
+
+    def page_saved(self) -> None:
+        # a slow disk holds the download back instead of pages piling up in memory
+        if not self._saving:
+            return
+        self._saving = False
+
         timer = QTimer(self)
         timer.setInterval(1000)
         timer.setSingleShot(True)
@@ -169,17 +216,35 @@ class DownloadChapter(QObject):
     def abort(self) -> None:
         self.cancelled = True
         self.aborted.emit()
+        if self._saving:
+            # nothing is running that would notice the abort
+            self._saving = False
+            self._request_failed()
 
 
 class DownloadThumbnail(QObject):
-    thumbnail_downloaded = pyqtSignal((Manga, bytes))
-
-    def __init__(self, parent: QObject, network: Network, manga: Manga) -> None:
+    thumbnail_downloaded = pyqtSignal((Manga, ThumbnailSize, bytes))
+    finished = pyqtSignal(Manga)
+
+    def __init__(
+        self,
+        parent: QObject,
+        network: Network,
+        image_pipeline: ImagePipeline,
+        manga: Manga,
+        data: bytes | None = None,
+    ) -> None:
         super().__init__(parent)
         self.network = network
+        self.image_pipeline = image_pipeline
         self.manga = manga
+        self._remaining = 0
+        self._failed = False
 
-        self.send_request()
+        if data is None:
+            self.send_request()
+        else:
+            self._process(data)
 
     def send_request(self) -> None:
         try:
@@ -214,42 +279,84 @@ class DownloadThumbnail(QObject):
         except Exception:
             return self.deleteLater()
 
-        image = QImage()
-        if not image.loadFromData(data):
-            return self.deleteLater()
-        image = image.scaledToWidth(900, Qt.TransformationMode.SmoothTransformation)
+        self._process(data)
 
-        buffer = QBuffer(self)
-        buffer.open(QBuffer.OpenModeFlag.WriteOnly)
-        if not image.save(buffer, "PNG"):
+    def _process(self, data: bytes) -> None:
+        info = probe_image(data)
+        if info is None:
             return self.deleteLater()
 
-        data = buffer.buffer().data()
-        self.thumbnail_downloaded.emit(self.manga, data)
-        self.deleteLater()
+        for size in ThumbnailSize:
+            task = self.image_pipeline.process(data, size.image_spec(info), self)
+            task.finished.connect(
+                lambda _, data, size=size: self._thumbnail_processed(size, data)
+            )
+            task.failed.connect(self._thumbnail_failed)
+            self._remaining += 1
+
+    def _thumbnail_processed(self, size: ThumbnailSize, data: bytes) -> None:
+        self.thumbnail_downloaded.emit(self.manga, size, data)
+        self._task_done()
+
+    def _thumbnail_failed(self) -> None:
+        self._failed = True
+        self._task_done()
+
+    def _task_done(self) -> None:
+        self._remaining -= 1
+        if self._remaining == 0:
+            if not self._failed:
+                self.finished.emit(self.manga)
+            self.deleteLater()
 
 
 class Downloader(QObject):
     chapter_deleted = pyqtSignal(Chapter)
     download_started = pyqtSignal(Chapter)
     download_update = pyqtSignal((Chapter, int, int))
+    download_paused = pyqtSignal(Chapter)
     download_finished = pyqtSignal(Chapter)
     download_failed = pyqtSignal((Chapter, bool))
 
     def __init__(self, app: YomuApp) -> None:
         super().__init__(app)
         self.app = app
-
+        self._writers: dict[Chapter, ChapterWriter] = {}
+        self._prefetching: set[Chapter] = set()
+        self._paused: set[Chapter] = set()
+        # Chapters shown by a reader, by id, and how many readers show them. Deleting one
+        # waits until every reader has left it since its pages are still read from disk
+        self._open_chapters: dict[int, int] = {}
+        self._pending_deletes: dict[int, Chapter] = {}
+        # Whether chapters downloaded before their size was recorded are being measured
+        self._measuring = False
+        self.disk_writer = DiskWriter(self)
+
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setInterval(60 * 60 * 1000)
+        self._prefetch_timer.timeout.connect(self.drop_expired_prefetches)
+
+        app.aboutToStart.connect(self.drop_expired_prefetches)
+        app.aboutToStart.connect(self._prefetch_timer.start)
+        app.aboutToStart.connect(self.enforce_quota)
+        app.aboutToStart.connect(self._migrate_thumbnails)
+        app.aboutToQuit.connect(self._discard_unfinished_downloads)
+        app.aboutToQuit.connect(self.disk_writer.stop)
         app.chapter_read_status_changed.connect(self._auto_delete_chapter)
         app.manga_library_status_changed.connect(
             self._manga_library_changed, Qt.ConnectionType.QueuedConnection
         )
         self.network.network_status_changed.connect(self._network_status_changed)
+        self.network.metered_changed.connect(self._metered_changed)
 
     @property
     def network(self) -> Network:
         return self.app.network
 
+    @property
+    def image_pipeline(self) -> ImagePipeline:
+        return self.app.image_pipeline
+
     def _manga_library_changed(self, manga: Manga) -> None:
         if manga.library:
             self.download_thumbnail(manga)
@@ -261,14 +368,48 @@ class Downloader(QObject):
             QNetworkInformation.Reachability.Site,
             QNetworkInformation.Reachability.Online,
         ):
-            for download in self.findChildren(DownloadChapter):
+            for chapter in tuple(self._paused):
+                self._resume_chapter(chapter)
+        else:
+            for download in self.findChildren(
+                DownloadChapter, options=Qt.FindChildOption.FindDirectChildrenOnly
+            ):
+                self._paused.add(download.chapter)
                 download.abort()
 
+    def _metered_changed(self, metered: bool) -> None:
+        if metered and not self.app.settings.value(
+            "smart_download_metered", False, bool
+        ):
+            for chapter in tuple(self._prefetching):
+                self.cancel_chapter(chapter)
+
+    @property
+    def storage_options(self) -> PageStorageOptions:
+        settings = self.app.settings
+        return PageStorageOptions(
+            format=PageFormat(
+                settings.value("download_format", PageFormat.ORIGINAL.value, int)
+            ),
+            quality=settings.value("download_quality", 90, int),
+            max_width=settings.value("download_max_width", 0, int),
+        )
+
+    @property
+    def storage_backend(self) -> StorageBackend:
+        return StorageBackend(
+            self.app.settings.value(
+                "download_storage", StorageBackend.FOLDER.value, int
+            )
+        )
+
     def _auto_delete_chapter(self, chapter: Chapter) -> None:
-        if (
-            chapter.read
-            and chapter.downloaded
-            and self.app.settings.value("autodelete_chapter", False, bool)
+        if not chapter.read:
+            # marked unread again before the reader left it
+            self._pending_deletes.pop(chapter.id, None)
+        elif chapter.downloaded and (
+            self.app.settings.value("autodelete_chapter", False, bool)
+            or self.app.sql.is_chapter_prefetched(chapter)
         ):
             self.delete_chapter(chapter)
 
@@ -293,7 +434,8 @@ class Downloader(QObject):
         if response.error() == Response.Error.NoError:
             image = QImage()
             if image.loadFromData(response.read_all()):
-                image.save(Downloader.resolve_path(source))
+                ensure_directory(os.path.dirname(path))
+                image.save(path)
 
         response.deleteLater()
 
@@ -304,7 +446,9 @@ class Downloader(QObject):
             if download.chapter == chapter:
                 return download
 
-    def download_chapter(self, chapter: Chapter) -> DownloadChapter | None:
+    def download_chapter(
+        self, chapter: Chapter, *, prefetch: bool = False
+    ) -> DownloadChapter | None:
         if (
             not self.network.network_online
             or chapter.downloaded
@@ -312,7 +456,27 @@ class Downloader(QObject):
         ):
             return None
 
-        download = DownloadChapter(self, self.network, copy(chapter))
+        if self.storage_backend == StorageBackend.ARCHIVE:
+            writer = ArchiveChapterWriter(Downloader.resolve_archive_path(chapter))
+        else:
+            writer = FolderChapterWriter(Downloader.resolve_path(chapter))
+
+        self._writers[chapter] = writer
+        if prefetch:
+            self._prefetching.add(chapter)
+        download = self._start_download(chapter)
+        self.download_started.emit(chapter)
+        return download
+
+    def _start_download(self, chapter: Chapter, start: int = 0) -> DownloadChapter:
+        download = DownloadChapter(
+            self,
+            self.network,
+            self.image_pipeline,
+            copy(chapter),
+            self.storage_options,
+            start,
+        )
         download.page_downloaded.connect(
             self._save_chapter_page, Qt.ConnectionType.QueuedConnection
         )
@@ -322,53 +486,277 @@ class Downloader(QObject):
         download.download_finished.connect(
             self._chapter_finished, Qt.ConnectionType.QueuedConnection
         )
-        self.download_started.emit(chapter)
         return download
 
+    def _discard_unfinished_downloads(self) -> None:
+        for writer in self._writers.values():
+            self.disk_writer.submit(writer.discard)
+        self._writers.clear()
+        self._paused.clear()
+
+    def _resume_chapter(self, chapter: Chapter) -> None:
+        self._paused.discard(chapter)
+        if (writer := self._writers.get(chapter)) is None:
+            return
+
+        # runs after the pages queued before the pause are written
+        self.disk_writer.submit(
+            lambda: writer.next_page,
+            finished=lambda start: self._start_download(chapter, start),
+        )
+
     def _save_chapter_page(
-        self, chapter: Chapter, index: int, total: int, data: bytes
+        self, chapter: Chapter, index: int, total: int, data: bytes, extension: str
     ) -> None:
-        path = os.path.join(Downloader.resolve_path(chapter), f"{index}.png")
+        if (writer := self._writers.get(chapter)) is None:
+            return
 
-        with open(path, "wb") as f:
-            f.write(data)
+        self.disk_writer.submit(
+            partial(writer.write_page, page_count=total),
+            f"{index}.{extension}",
+            data,
+            finished=lambda _: self._chapter_page_saved(chapter, index, total),
+            failed=lambda _: self.cancel_chapter(chapter),
+        )
 
+    def _chapter_page_saved(self, chapter: Chapter, index: int, total: int) -> None:
         self.download_update.emit(chapter, index, total)
+        if (download := self.find_download_request(chapter)) is not None:
+            download.page_saved()
 
     def _chapter_failed(self, chapter: Chapter, aborted: bool) -> None:
-        if aborted:
-            QDir(Downloader.resolve_path(chapter)).removeRecursively()
+        connection_lost = not aborted and not self.network.network_online
+        if chapter in self._writers and (chapter in self._paused or connection_lost):
+            # the connection dropped. keep what's been saved so far
+            self._paused.add(chapter)
+            return self.download_paused.emit(chapter)
+
+        self._prefetching.discard(chapter)
+        if (writer := self._writers.pop(chapter, None)) is not None:
+            if isinstance(writer, ArchiveChapterWriter):
+                # a partial archive has no central directory so it can't be resumed
+                self.disk_writer.submit(writer.discard)
+            elif aborted:
+                self.disk_writer.remove(writer.path)
 
         self.download_failed.emit(chapter, aborted)
 
     def _chapter_finished(self, chapter: Chapter) -> None:
-        if self.app.sql.mark_chapters_download_status(chapter, downloaded=True):
+        writer = self._writers[chapter]
+
+        def failed(_: Exception) -> None:
+            self._writers.pop(chapter, None)
+            self._prefetching.discard(chapter)
+            self.disk_writer.submit(writer.discard)
+            self.download_failed.emit(chapter, False)
+
+        self.disk_writer.submit(
+            writer.finish,
+            finished=lambda _: self._chapter_written(chapter, writer),
+            failed=failed,
+        )
+
+    def _chapter_written(self, chapter: Chapter, writer: ChapterWriter) -> None:
+        self._writers.pop(chapter, None)
+        prefetched = chapter in self._prefetching
+        self._prefetching.discard(chapter)
+
+        if self.app.sql.mark_chapters_download_status(
+            chapter, downloaded=True, prefetched=prefetched, size=writer.size
+        ):
             self.download_finished.emit(chapter)
+            self.enforce_quota(keep=chapter)
+
+    @property
+    def can_prefetch(self) -> bool:
+        settings = self.app.settings
+        if not settings.value("smart_download", False, bool):
+            return False
+
+        if self.network.is_metered and not settings.value(
+            "smart_download_metered", False, bool
+        ):
+            return False
+
+        min_free_space = settings.value("smart_download_min_free_space", 1024, int)
+        free_space = shutil.disk_usage(utils.app_data_path()).free
+        return free_space >= min_free_space * 1024 * 1024
+
+    def prefetch_chapters(self, chapters: Sequence[Chapter]) -> None:
+        if not self.can_prefetch:
+            return
+
+        count = self.app.settings.value("smart_download_chapters", 2, int)
+        for chapter in chapters[:count]:
+            if not chapter.downloaded and not self.is_downloading(chapter):
+                self.download_chapter(chapter, prefetch=True)
+
+    def drop_expired_prefetches(self) -> None:
+        ttl = self.app.settings.value("smart_download_ttl", 72, int)
+        before = datetime.now() - timedelta(hours=ttl)
+        for chapter in self.app.sql.get_expired_prefetched_chapters(before):
+            logger.info(f"Deleting unopened prefetched chapter {chapter.title}")
+            self.delete_chapter(chapter)
+
+    def enforce_quota(self, *, keep: Chapter | None = None) -> None:
+        quota = self.app.settings.value("download_quota", 0, int) * 1024 * 1024
+        if quota <= 0:
+            return
+
+        sql = self.app.sql
+        if self._measuring:
+            # enforced again once the sizes are known
+            return
+        if unmeasured := sql.get_unmeasured_chapters():
+            self._measuring = True
+            self.disk_writer.submit(
+                Downloader._measure_chapters,
+                unmeasured,
+                finished=partial(self._chapters_measured, keep),
+            )
+            return
+
+        usage = sql.get_download_usage()
+        if usage <= quota:
+            return
+
+        for chapter_id, size in sql.get_eviction_candidates():
+            if usage <= quota:
+                break
+            if keep is not None and chapter_id == keep.id:
+                continue
+            if chapter_id in self._open_chapters:
+                # deleting it wouldn't free anything until the reader leaves it
+                continue
+            if (chapter := sql.get_chapter_by_id(chapter_id)) is None:
+                continue
+
+            logger.info(f"Download quota exceeded. Deleting {chapter.title}")
+            self.delete_chapter(chapter)
+            usage -= size
+
+    @staticmethod
+    def _measure_chapters(chapters: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        # runs on the disk writer. Chapters that can't be found take up no space
+        downloads = os.path.join(utils.app_data_path(), "downloads")
+        sizes = []
+        for chapter_id, manga_id in chapters:
+            path = os.path.join(downloads, str(manga_id), str(chapter_id))
+            size = 0
+            try:
+                if os.path.isfile(archive := f"{path}.cbz"):
+                    size = os.path.getsize(archive)
+                elif os.path.isdir(path):
+                    size = sum(
+                        entry.stat().st_size
+                        for entry in os.scandir(path)
+                        if entry.is_file()
+                    )
+            except OSError:
+                ...
+            sizes.append((chapter_id, size))
+        return sizes
+
+    def _chapters_measured(
+        self, keep: Chapter | None, sizes: list[tuple[int, int]]
+    ) -> None:
+        self._measuring = False
+        self.app.sql.set_chapter_sizes(sizes)
+        self.enforce_quota(keep=keep)
 
     def cancel_chapter(self, chapter: Chapter) -> None:
+        if chapter in self._paused:
+            self._paused.discard(chapter)
+            return self._chapter_failed(chapter, True)
+
         if (download := self.find_download_request(chapter)) is not None:
             download.abort()
 
+    def open_chapter(self, chapter: Chapter) -> None:
+        # the chapter's files are kept until close_chapter is called for it
+        self._open_chapters[chapter.id] = self._open_chapters.get(chapter.id, 0) + 1
+
+    def close_chapter(self, chapter: Chapter) -> None:
+        if (count := self._open_chapters.get(chapter.id)) is None:
+            return
+        if count > 1:
+            self._open_chapters[chapter.id] = count - 1
+            return
+
+        del self._open_chapters[chapter.id]
+        if (pending := self._pending_deletes.pop(chapter.id, None)) is not None:
+            self.delete_chapter(pending)
+
+    def is_chapter_open(self, chapter: Chapter) -> bool:
+        return chapter.id in self._open_chapters
+
     def delete_chapter(self, chapter: Chapter) -> None:
         if not chapter.downloaded:
             return
 
-        QDir(Downloader.resolve_path(chapter)).removeRecursively()
+        if chapter.id in self._open_chapters:
+            # a reader still shows it. deleted once it's closed
+            self._pending_deletes[chapter.id] = chapter
+            return
+
         if self.app.sql.mark_chapters_download_status(chapter, downloaded=False):
-            self.chapter_deleted.emit(chapter)
+            # only one of them exists. the chapter is deleted once both are gone
+            self.disk_writer.remove(Downloader.resolve_archive_path(chapter))
+            self.disk_writer.remove(
+                Downloader.resolve_path(chapter),
+                finished=lambda _: self.chapter_deleted.emit(chapter),
+            )
 
     def download_thumbnail(self, manga: Manga) -> None:
-        request = DownloadThumbnail(self, self.network, manga)
+        request = DownloadThumbnail(self, self.network, self.image_pipeline, manga)
         request.thumbnail_downloaded.connect(self._thumbnail_downloaded)
+        request.finished.connect(self._remove_legacy_thumbnail)
 
-    def _thumbnail_downloaded(self, manga: Manga, data: bytes) -> None:
-        with open(
-            os.path.join(Downloader.resolve_path(manga), "thumbnail.png"), "wb"
-        ) as f:
-            f.write(data)
+    def _migrate_thumbnails(self) -> None:
+        for manga in self.app.sql.get_library():
+            path = os.path.join(
+                Downloader.resolve_path(manga), LEGACY_THUMBNAIL_FILENAME
+            )
+            if os.path.exists(path):
+                self.disk_writer.read(
+                    path, finished=partial(self._migrate_thumbnail, manga)
+                )
+
+    def _migrate_thumbnail(self, manga: Manga, data: bytes) -> None:
+        request = DownloadThumbnail(
+            self, self.network, self.image_pipeline, manga, data
+        )
+        request.thumbnail_downloaded.connect(self._thumbnail_downloaded)
+        request.finished.connect(self._remove_legacy_thumbnail)
+
+    def _thumbnail_downloaded(
+        self, manga: Manga, size: ThumbnailSize, data: bytes
+    ) -> None:
+        path = Downloader.resolve_path(manga)
+        for filename in size.filenames:
+            if filename not in (size.filename, LEGACY_THUMBNAIL_FILENAME):
+                self.disk_writer.remove(os.path.join(path, filename))
+
+        self.disk_writer.write(os.path.join(path, size.filename), data)
+
+    def _remove_legacy_thumbnail(self, manga: Manga) -> None:
+        self.disk_writer.remove(
+            os.path.join(Downloader.resolve_path(manga), LEGACY_THUMBNAIL_FILENAME)
+        )
 
     def delete_thumbnail(self, manga: Manga) -> None:
-        QFile.remove(os.path.join(Downloader.resolve_path(manga), "thumbnail.png"))
+        path = Downloader.resolve_path(manga)
+        for size in ThumbnailSize:
+            for filename in size.filenames:
+                self.disk_writer.remove(os.path.join(path, filename))
+
+    @staticmethod
+    def resolve_thumbnail_path(manga: Manga, size: ThumbnailSize) -> str | None:
+        path = Downloader.resolve_path(manga)
+        for filename in size.filenames:
+            if os.path.exists(thumbnail := os.path.join(path, filename)):
+                return thumbnail
+        return None
 
     @overload
     @staticmethod
@@ -386,7 +774,6 @@ class Downloader(QObject):
     def resolve_path(arg: Source | Manga | Chapter) -> str:
         if isinstance(arg, Source):
             path = os.path.join(utils.app_data_path(), "downloads", "sources")
-            os.makedirs(path, exist_ok=True)
             return os.path.join(path, f"{arg.id}.png")
 
         is_chapter = isinstance(arg, Chapter)
@@ -395,8 +782,12 @@ class Downloader(QObject):
         path = os.path.join(utils.app_data_path(), "downloads", str(manga.id))
         if is_chapter:
             path = os.path.join(path, str(arg.id))
-        os.makedirs(path, exist_ok=True)
         return path
 
+    @staticmethod
+    def resolve_archive_path(chapter: Chapter) -> str:
+        return os.path.join(Downloader.resolve_path(chapter.manga), f"{chapter.id}.cbz")
+
     def is_downloading(self, chapter: Chapter) -> bool:
-        return bool(self.find_download_request(chapter))
+        # the writer is kept until the last page is on disk
+        return chapter in self._writers
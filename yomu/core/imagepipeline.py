@@ -0,0 +1,512 @@
+import struct
+from dataclasses import dataclass
+from logging import getLogger
+
+from PyQt6.QtCore import (
+    pyqtSignal,
+    QBuffer,
+    QByteArray,
+    QObject,
+    QRect,
+    QRunnable,
+    QSize,
+    Qt,
+    QThread,
+    QThreadPool,
+)
+from PyQt6.QtGui import QImage, QImageIOHandler, QImageReader
+
+__all__ = (
+    "CancellationToken",
+    "ImageInfo",
+    "ImagePipeline",
+    "ImageSpec",
+    "ImageTask",
+    "encode_raw",
+    "probe_image",
+    "read_image_size",
+)
+
+logger = getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImageSpec:
+    """
+    Describes what an image should look like once it leaves the pipeline.
+
+    Attributes
+    ----------
+    width : int | None
+        Scale the image to this width, keeping the aspect ratio.
+    height : int | None
+        Scale the image to this height, keeping the aspect ratio. Ignored if width is set.
+    format : str | None
+        Encode the image to this format (e.g. "JPG", "PNG"). No encoding is done if None.
+    quality : int
+        Quality passed to the encoder. -1 uses the encoder's default.
+    smooth : bool
+        Whether to use smooth or fast transformation when scaling.
+    upscale : bool
+        Whether images smaller than the width or height are scaled up to it.
+    clip : QRect | None
+        Only keep this part of the scaled image. Decoders that support it skip the rest
+        of the image, see `ImageInfo.partial_decode`. Other images are decoded in full.
+    """
+
+    width: int | None = None
+    height: int | None = None
+    format: str | None = None
+    quality: int = -1
+    smooth: bool = True
+    upscale: bool = True
+    clip: QRect | None = None
+
+    @property
+    def extension(self) -> str | None:
+        if self.format is None:
+            return None
+        format = self.format.lower()
+        return "jpg" if format == "jpeg" else format
+
+    @property
+    def transformation(self) -> Qt.TransformationMode:
+        if self.smooth:
+            return Qt.TransformationMode.SmoothTransformation
+        return Qt.TransformationMode.FastTransformation
+
+    def scaled_size(self, size: QSize) -> QSize:
+        """
+        Works out the size an image ends up as, ignoring `clip`
+
+        Parameters
+        ----------
+        size : QSize
+            The size of the image
+
+        Returns
+        -------
+        QSize
+            The size once scaled
+        """
+        if size.isEmpty():
+            return size
+
+        if self.width is not None:
+            if self.upscale or self.width < size.width():
+                height = round(size.height() * self.width / size.width())
+                return QSize(self.width, max(height, 1))
+        elif self.height is not None:
+            if self.upscale or self.height < size.height():
+                width = round(size.width() * self.height / size.height())
+                return QSize(max(width, 1), self.height)
+        return size
+
+
+class CancellationToken:
+    __slots__ = ("_cancelled", "__weakref__")
+
+    def __init__(self) -> None:
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+
+class _JobSignals(QObject):
+    finished = pyqtSignal((QImage, bytes))
+    failed = pyqtSignal()
+
+
+class _ImageJob(QRunnable):
+    def __init__(
+        self,
+        data: bytes | memoryview | QImage | str,
+        spec: ImageSpec,
+        token: CancellationToken,
+    ) -> None:
+        super().__init__()
+        self.data = data
+        self.spec = spec
+        self.token = token
+        self.signals = _JobSignals()
+
+    def run(self) -> None:
+        try:
+            result = self._process()
+        except Exception as e:
+            logger.error("Failed to process image", exc_info=e)
+            result = None
+
+        if self.token.cancelled:
+            return
+        if result is None:
+            return self.signals.failed.emit()
+        self.signals.finished.emit(*result)
+
+    def _process(self) -> tuple[QImage, bytes] | None:
+        if self.token.cancelled:
+            return None
+
+        if isinstance(self.data, QImage):
+            return self._finish(self.data, self.spec.clip)
+        if isinstance(self.data, str):
+            # A file, read here so the thread that asked for it never touches the disk
+            return self._decode(QImageReader(self.data))
+        try:
+            if raw := self.data[:4] == _RAW_MAGIC:
+                image = _decode_raw(self.data)
+            else:
+                data = QByteArray(self.data)
+        except ValueError:
+            # A view that was released before it could be copied
+            return None
+
+        if raw:
+            if image is None:
+                return None
+            return self._finish(image, self.spec.clip)
+
+        buffer = QBuffer()
+        buffer.setData(data)
+        buffer.open(QBuffer.OpenModeFlag.ReadOnly)
+        return self._decode(QImageReader(buffer))
+
+    def _decode(self, reader: QImageReader) -> tuple[QImage, bytes] | None:
+        spec = self.spec
+        reader.setAutoTransform(True)
+        # Decoding straight to the final size is much cheaper than decoding the whole image and scaling it
+        if (size := self._scaled_size(reader)) is not None:
+            reader.setScaledSize(size)
+
+        # The clip rect is applied before the image is rotated so rotated images are cropped afterwards
+        clip = spec.clip
+        if (
+            clip is not None
+            and reader.transformation()
+            == QImageIOHandler.Transformation.TransformationNone
+        ):
+            reader.setScaledClipRect(clip)
+            clip = None
+
+        image = reader.read()
+        if image.isNull():
+            return None
+
+        if self.token.cancelled:
+            return None
+        return self._finish(image, clip)
+
+    def _finish(self, image: QImage, clip: QRect | None) -> tuple[QImage, bytes] | None:
+        # Scales what the reader didn't, crops what it couldn't and encodes the result
+        spec = self.spec
+        if spec.clip is None or clip is not None:
+            target = spec.scaled_size(image.size())
+            if target.width() != image.width() and spec.width is not None:
+                image = image.scaledToWidth(spec.width, spec.transformation)
+            elif target.height() != image.height() and spec.height is not None:
+                image = image.scaledToHeight(spec.height, spec.transformation)
+        if clip is not None:
+            image = image.copy(clip)
+
+        if spec.format is None:
+            return image, b""
+
+        if self.token.cancelled:
+            return None
+
+        output = QBuffer()
+        output.open(QBuffer.OpenModeFlag.WriteOnly)
+        if not image.save(output, spec.format, spec.quality):
+            return None
+        return image, output.data().data()
+
+    def _scaled_size(self, reader: QImageReader) -> QSize | None:
+        size, spec = reader.size(), self.spec
+        if size.isEmpty():
+            return None
+
+        # The scaled size is applied before the image is rotated
+        transposed = bool(
+            reader.transformation()
+            & QImageIOHandler.Transformation.TransformationRotate90
+        )
+        if transposed:
+            size = size.transposed()
+
+        if (scaled := spec.scaled_size(size)) == size:
+            return None
+        return scaled.transposed() if transposed else scaled
+
+
+class ImageTask(QObject):
+    """
+    Handle for an image submitted to the `ImagePipeline`.
+
+    The task is parented to the object that requested it. Deleting that object
+    (or calling `cancel`) cancels the task and none of its signals will be emitted.
+    """
+
+    finished = pyqtSignal((QImage, bytes))
+    failed = pyqtSignal()
+
+    def __init__(self, parent: QObject, pool: QThreadPool, job: _ImageJob) -> None:
+        super().__init__(parent)
+        self._pool = pool
+        self._job = job
+        self.token = job.token
+
+        job.signals.finished.connect(self._job_finished)
+        job.signals.failed.connect(self._job_failed)
+        self.destroyed.connect(job.token.cancel)
+
+    @property
+    def cancelled(self) -> bool:
+        return self.token.cancelled
+
+    def _job_finished(self, image: QImage, data: bytes) -> None:
+        if not self.cancelled:
+            self.finished.emit(image, data)
+        self.deleteLater()
+
+    def _job_failed(self) -> None:
+        if not self.cancelled:
+            self.failed.emit()
+        self.deleteLater()
+
+    def cancel(self) -> None:
+        if self.cancelled:
+            return
+
+        self.token.cancel()
+        try:
+            self._pool.tryTake(self._job)
+        except RuntimeError:
+            ...
+        self.deleteLater()
+
+
+class ImagePipeline(QObject):
+    """
+    Decodes, scales and encodes images on a thread pool so the gui thread never has to.
+    """
+
+    def __init__(self, parent: QObject) -> None:
+        super().__init__(parent)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max(QThread.idealThreadCount() - 1, 1))
+
+    def process(
+        self,
+        data: bytes | memoryview | QByteArray | QImage | str,
+        spec: ImageSpec,
+        owner: QObject | None = None,
+        *,
+        priority: int = 0,
+    ) -> ImageTask:
+        """
+        Queue image data to be processed
+
+        Parameters
+        ----------
+        data : bytes | memoryview | QByteArray | QImage | str
+            The encoded image data. Memoryviews aren't copied until the image is decoded.
+            Images that are already decoded are only scaled and encoded. Strings are the
+            path of an image file, which is read on the thread pool
+        spec : ImageSpec
+            What the resulting image should look like
+        owner : QObject | None
+            The object requesting the image. The task is cancelled once it's deleted
+        priority : int
+            Higher priority tasks are started first
+
+        Returns
+        -------
+        ImageTask
+            The task. Connect to its `finished` and `failed` signals for the result
+        """
+        if isinstance(data, QByteArray):
+            data = data.data()
+
+        job = _ImageJob(data, spec, CancellationToken())
+        task = ImageTask(owner if owner is not None else self, self.thread_pool, job)
+        self.thread_pool.start(job, priority)
+        return task
+
+    def stop(self) -> None:
+        self.thread_pool.clear()
+        self.thread_pool.waitForDone()
+
+
+@dataclass(frozen=True, slots=True)
+class ImageInfo:
+    format: str
+    size: QSize
+    # Whether the image is rotated or flipped by its EXIF orientation
+    transformed: bool = False
+
+    @property
+    def extension(self) -> str:
+        return "jpg" if self.format == "jpeg" else self.format
+
+    @property
+    def partial_decode(self) -> bool:
+        """Whether clipping the image skips decoding the rest of it, see `ImageSpec.clip`"""
+        return self.format == "jpeg" and not self.transformed
+
+
+def probe_image(data: bytes | QByteArray) -> ImageInfo | None:
+    """
+    Reads the format and size of an image from its header without decoding it
+
+    Parameters
+    ----------
+    data : bytes | QByteArray
+        The encoded image data
+
+    Returns
+    -------
+    ImageInfo | None
+        The image info or None if Qt can't read the image
+    """
+    buffer = QBuffer()
+    buffer.setData(QByteArray(data))
+    buffer.open(QBuffer.OpenModeFlag.ReadOnly)
+
+    reader = QImageReader(buffer)
+    if not reader.canRead():
+        return None
+    return ImageInfo(
+        bytes(reader.format()).decode().lower(),
+        reader.size(),
+        reader.transformation() != QImageIOHandler.Transformation.TransformationNone,
+    )
+
+
+# JPEG start of frame markers, the ones left out of 0xC0-0xCF are DHT, JPG and DAC
+_JPEG_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def read_image_size(data: bytes | memoryview) -> QSize | None:
+    """
+    Reads the size of a JPEG, PNG, WebP or GIF image from the first bytes of its header.
+    Works on partial data so the size is known before the rest of the image arrives.
+    The EXIF orientation of JPEG images isn't applied
+
+    Parameters
+    ----------
+    data : bytes | memoryview
+        The start of the encoded image
+
+    Returns
+    -------
+    QSize | None
+        The size or None if the format isn't known or more data is needed
+    """
+    length = len(data)
+    try:
+        if data[:8] == b"\x89PNG\r\n\x1a\n":
+            if data[12:16] != b"IHDR":
+                return None
+            width, height = struct.unpack_from(">II", data, 16)
+        elif data[:6] in (b"GIF87a", b"GIF89a"):
+            width, height = struct.unpack_from("<HH", data, 6)
+        elif data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+            chunk = data[12:16]
+            if chunk == b"VP8 ":
+                if data[23:26] != b"\x9d\x01\x2a":
+                    return None
+                width, height = struct.unpack_from("<HH", data, 26)
+                width, height = width & 0x3FFF, height & 0x3FFF
+            elif chunk == b"VP8L":
+                if data[20:21] != b"\x2f":
+                    return None
+                (bits,) = struct.unpack_from("<I", data, 21)
+                width, height = (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            elif chunk == b"VP8X":
+                if length < 30:
+                    return None
+                width = int.from_bytes(data[24:27], "little") + 1
+                height = int.from_bytes(data[27:30], "little") + 1
+            else:
+                return None
+        elif data[:2] == b"\xff\xd8":
+            # Walk the segments until the frame header, skipping the EXIF and other metadata
+            i = 2
+            while True:
+                if i + 4 > length or data[i] != 0xFF:
+                    return None
+                marker = data[i + 1]
+                if marker == 0xFF:
+                    i += 1
+                    continue
+                if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+                    i += 2
+                    continue
+                if marker in _JPEG_SOF:
+                    height, width = struct.unpack_from(">HH", data, i + 5)
+                    break
+                (size,) = struct.unpack_from(">H", data, i + 2)
+                i += 2 + size
+        else:
+            return None
+    except struct.error:
+        return None
+
+    if width <= 0 or height <= 0:
+        return None
+    return QSize(width, height)
+
+
+# Raw images start with this followed by their width, height, bytes per line and QImage.Format
+_RAW_MAGIC = b"YRAW"
+_RAW_HEADER = struct.Struct("<4sIIII")
+
+
+def encode_raw(image: QImage) -> bytes:
+    """
+    Stores an image's pixels the way they're laid out in memory. The pipeline reads them
+    back with a single copy instead of decoding them
+
+    Parameters
+    ----------
+    image : QImage
+        The image
+
+    Returns
+    -------
+    bytes
+        The raw image
+    """
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    header = _RAW_HEADER.pack(
+        _RAW_MAGIC,
+        image.width(),
+        image.height(),
+        image.bytesPerLine(),
+        image.format().value,
+    )
+    return header + bits.asstring()
+
+
+def _decode_raw(data: bytes | memoryview) -> QImage | None:
+    try:
+        _, width, height, bytes_per_line, format = _RAW_HEADER.unpack_from(data)
+        image = QImage(width, height, QImage.Format(format))
+    except (struct.error, ValueError):
+        return None
+
+    size = image.sizeInBytes()
+    start = _RAW_HEADER.size
+    if image.bytesPerLine() != bytes_per_line or len(data) - start != size:
+        return None
+
+    bits = image.bits()
+    bits.setsize(size)
+    memoryview(bits)[:] = data[start:]
+    return image
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -11,6 +11,7 @@ from yomu.source import (
 
 if TYPE_CHECKING:
     from .network import Request
+    from .storage import ChapterArchive
 
 __all__ = ("Manga", "Chapter", "Page")
 
@@ -104,6 +105,10 @@ class Page:
     chapter: Chapter
     url: str
     downloaded: bool
+    archive: ChapterArchive | None = field(default=None, repr=False, compare=False)
+    # The image's dimensions if they're known before it's fetched, 0 otherwise
+    width: int = field(default=0, compare=False)
+    height: int = field(default=0, compare=False)
 
     @property
     def source(self) -> Source:
@@ -115,7 +120,7 @@ class Page:
             number=source_page.number,
             chapter=chapter,
             url=source_page.url,
-            downloaded=chapter.downloaded,
+            downloaded=False,
         )
 
     def to_source_page(self) -> SourcePage:
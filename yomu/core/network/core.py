@@ -23,6 +23,7 @@ from .response import Response
 
 if TYPE_CHECKING:
     from yomu.core.app import YomuApp
+    from yomu.source import Source
     from .ratelimit import RateLimit
 
 
@@ -87,6 +88,7 @@ class Network(QNetworkAccessManager):
     online_changed = pyqtSignal((bool, bool))
     offline_mode_changed = pyqtSignal(bool)
     network_status_changed = pyqtSignal(QNetworkInformation.Reachability)
+    metered_changed = pyqtSignal(bool)
 
     response_sent = pyqtSignal(Response)
     response_finished = pyqtSignal(Response)
@@ -100,6 +102,7 @@ class Network(QNetworkAccessManager):
         QNetworkInformation.loadBackendByName(QNetworkInformation.availableBackends()[0])  # fmt: skip
         self.network_info = QNetworkInformation.instance()
         self.network_info.reachabilityChanged.connect(self._reachability_changed)  # fmt: skip
+        self.network_info.isMeteredChanged.connect(self.metered_changed.emit)
         self._app.settings.value_changed.connect(self._settings_changed)
 
         self._online = not self.offline_mode and self.network_online
@@ -128,6 +131,10 @@ class Network(QNetworkAccessManager):
             QNetworkInformation.Reachability.Online,
         )
 
+    @property
+    def is_metered(self) -> bool:
+        return self.network_info.isMetered()
+
     def _response_finished(self) -> None:
         response: Response = self.sender()
         error = response.error()
@@ -185,6 +192,10 @@ class Network(QNetworkAccessManager):
         if rate_limit.url is not None:
             self._limit_handler.add_rate_limit(rate_limit)
 
+    def queued_requests(self, source: Source | None = None) -> int:
+        # Requests waiting on a rate limit, only the source's if one is given
+        return self._limit_handler.queued(source)
+
     def handle_request(self, request: Request) -> Response:
         response = Response(self, request)
         self._limit_handler.handle(response)
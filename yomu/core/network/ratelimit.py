@@ -11,6 +11,8 @@ from .response import Response
 
 
 if TYPE_CHECKING:
+    from yomu.source import Source
+
     from .core import Network
 
 
@@ -84,6 +86,14 @@ class RateLimiter(QObject):
     def should_rate_limit(self) -> bool:
         return self.count >= self.rate_limit.rate
 
+    def queued(self, source: Source | None = None) -> int:
+        return sum(
+            1
+            for responses in self.to_send
+            for response in responses
+            if source is None or response.source is source
+        )
+
     def append(self, response: Response) -> None:
         response.cancelled.connect(self.remove)
         index: int = response.priority.value // 2
@@ -115,6 +125,9 @@ class RateLimitHandler(QObject):
     def add_rate_limit(self, rate_limit: RateLimit) -> None:
         self.rate_limiters[QUrl(rate_limit.url).host()] = RateLimiter(self, rate_limit)
 
+    def queued(self, source: Source | None = None) -> int:
+        return sum(limiter.queued(source) for limiter in self.rate_limiters.values())
+
     def handle(self, response: Response) -> None:
         request = response.request
         if request.is_local_file():
@@ -16,6 +16,7 @@ __all__ = ("Response",)
 
 class Response(QObject):
     started = pyqtSignal()
+    ready_read = pyqtSignal()
     finished = pyqtSignal()
     cancelled = pyqtSignal()
     failed = pyqtSignal()
@@ -28,12 +29,14 @@ class Response(QObject):
         self._url = request.url()
 
         self._data = QByteArray()
+        self._reply: QNetworkReply | None = None
         self._error_string = ""
 
         self._error = Response.Error.NoError
         self._attributes = {}
         self._headers: QHttpHeaders = QHttpHeaders()
         self._is_finished = False
+        self._is_sent = False
 
     @property
     def request(self) -> Request:
@@ -58,11 +61,16 @@ class Response(QObject):
     operation = route
 
     def _connect_reply(self, reply: QNetworkReply) -> None:
+        self._reply = reply
         reply.finished.connect(self._reply_finished)
+        reply.readyRead.connect(self.ready_read)
         self.cancelled.connect(reply.abort)
+        self._is_sent = True
+        self.started.emit()
 
     def _reply_finished(self) -> None:
         reply: QNetworkReply = self.sender()
+        self._reply = None
         self._url = Url(reply.url())
         self._headers = reply.headers()
         self._attributes = {
@@ -94,6 +102,9 @@ class Response(QObject):
     def is_finished(self) -> bool:
         return self._is_finished
 
+    def is_sent(self) -> bool:
+        return self._is_sent
+
     def url(self) -> Url:
         return self._url
 
@@ -107,6 +118,12 @@ class Response(QObject):
         max_size = self._data.size()
         return self._data[start : min(size, max_size)]
 
+    def peek(self, size: int) -> QByteArray:
+        # The start of the body received so far, used to look at a file's header before it's done downloading
+        if self._reply is not None:
+            return self._reply.peek(size)
+        return self._data.first(min(size, self._data.size()))
+
     def read_all(self) -> QByteArray:
         return QByteArray(self._data)
 
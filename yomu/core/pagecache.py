@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QObject, QSize
+from PyQt6.QtGui import QPixmap
+
+if TYPE_CHECKING:
+    from .app import YomuApp
+    from .models import Page
+
+__all__ = ("PageCache",)
+
+
+PageKey = tuple[int, int, bool, int, int]
+
+
+class PageCache(QObject):
+    """
+    Least recently used cache of decoded pages shared by every reader.
+
+    Pixmaps are implicitly shared so a cached page shown by a reader doesn't take up any
+    extra memory. The budget is read from the `page_cache_size` setting in megabytes.
+    """
+
+    def __init__(self, app: YomuApp) -> None:
+        super().__init__(app)
+        self._pixmaps: OrderedDict[PageKey, QPixmap] = OrderedDict()
+        self._size = 0
+        self._max_size = app.settings.value("page_cache_size", 256, int) * 1024 * 1024
+        app.settings.value_changed.connect(self._settings_changed)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @staticmethod
+    def key(page: Page, size: QSize) -> PageKey:
+        """
+        Builds the key a page is cached under
+
+        Parameters
+        ----------
+        page : Page
+            The page
+        size : QSize
+            The size the page was decoded to. Either dimension may be -1 if the page was
+            only fitted to the other one
+
+        Returns
+        -------
+        PageKey
+            The key. Downloaded pages are kept apart from online ones since sources don't
+            always number their pages from zero
+        """
+        return (
+            page.chapter.id,
+            page.number,
+            page.downloaded,
+            size.width(),
+            size.height(),
+        )
+
+    def get(self, key: PageKey) -> QPixmap | None:
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def put(self, key: PageKey, pixmap: QPixmap) -> None:
+        size = PageCache.pixmap_size(pixmap)
+        if size > self._max_size:
+            return
+
+        if (old := self._pixmaps.pop(key, None)) is not None:
+            self._size -= PageCache.pixmap_size(old)
+
+        self._pixmaps[key] = pixmap
+        self._size += size
+        self._evict()
+
+    def clear(self) -> None:
+        self._pixmaps.clear()
+        self._size = 0
+
+    @staticmethod
+    def pixmap_size(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def _evict(self) -> None:
+        while self._size > self._max_size and self._pixmaps:
+            _, pixmap = self._pixmaps.popitem(last=False)
+            self._size -= PageCache.pixmap_size(pixmap)
+
+    def _settings_changed(self, key: str, value: object) -> None:
+        if key == "page_cache_size":
+            self._max_size = int(value) * 1024 * 1024
+            self._evict()
@@ -0,0 +1,189 @@
+import os
+import shutil
+from collections import OrderedDict
+from functools import partial
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtGui import QImage, QPixmap
+
+from .diskwriter import DiskWriter
+from .imagepipeline import ImageSpec, ImageTask
+from .storage import forget_directories
+from . import utils
+
+if TYPE_CHECKING:
+    from .app import YomuApp
+    from .models import Page
+
+__all__ = ("PreviewCache",)
+
+
+PreviewKey = tuple[int, int, bool]
+
+
+class PreviewCache(QObject):
+    """
+    Small previews of reader pages, shown while the full page loads and when scrubbing
+    through a chapter.
+
+    Previews are made from pages as they're decoded or, for downloaded chapters, from
+    the saved pages when one is asked for. They're saved to disk one directory per chapter
+    and only the `max_chapters` chapters that got a preview most recently are kept. The last
+    `max_count` previews used are also kept in memory. Files are only read and written off the
+    gui thread, which keeps track of the previews on disk itself.
+    """
+
+    WIDTH = 120
+    max_count = 512
+    max_chapters = 256
+
+    spec = ImageSpec(width=WIDTH, format="JPG", quality=80)
+
+    def __init__(self, app: YomuApp) -> None:
+        super().__init__(app)
+        self.app = app
+        self.path = os.path.join(utils.cache_dir_path(), "previews")
+        self._pixmaps: OrderedDict[PreviewKey, QPixmap] = OrderedDict()
+        self._creating: set[PreviewKey] = set()
+        self._saved: set[PreviewKey] = set()
+
+        self._writer = DiskWriter(self)
+        self._writer.submit(self._prune, finished=self._saved.update)
+        app.aboutToQuit.connect(self._writer.stop)
+
+    @staticmethod
+    def key(page: Page) -> PreviewKey:
+        # Downloaded pages are kept apart from online ones for the same reason as in `PageCache`
+        return page.chapter.id, page.number, page.downloaded
+
+    def _file_path(self, page: Page) -> str:
+        name = (
+            f"{page.number}-downloaded.jpg" if page.downloaded else f"{page.number}.jpg"
+        )
+        return os.path.join(self.path, str(page.chapter.id), name)
+
+    def get(self, page: Page) -> QPixmap | None:
+        """
+        Returns the page's preview if it's in memory
+
+        Parameters
+        ----------
+        page : Page
+            The page
+
+        Returns
+        -------
+        QPixmap | None
+            The preview or None if it has to be loaded first
+        """
+        key = PreviewCache.key(page)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def load(
+        self, page: Page, owner: QObject, *, create: bool = False
+    ) -> ImageTask | None:
+        """
+        Loads the page's preview from disk
+
+        Parameters
+        ----------
+        page : Page
+            The page
+        owner : QObject
+            The object the preview is for. Loading it is cancelled once it's deleted
+        create : bool
+            Whether the preview of a downloaded page is made from the saved page if it
+            doesn't have one yet
+
+        Returns
+        -------
+        ImageTask | None
+            The task the preview is decoded by, or None if there's no preview
+        """
+        key = PreviewCache.key(page)
+        pipeline = self.app.image_pipeline
+        if key in self._saved:
+            task = pipeline.process(
+                self._file_path(page), ImageSpec(), owner, priority=-1
+            )
+            task.finished.connect(partial(self._loaded, key))
+            task.failed.connect(partial(self._saved.discard, key))
+            return task
+
+        if not create or not page.downloaded:
+            return None
+
+        if page.archive is not None:
+            if (data := page.archive.read(page.url)) is None:
+                return None
+        else:
+            data = page.url
+
+        task = pipeline.process(data, PreviewCache.spec, owner, priority=-1)
+        task.finished.connect(partial(self._created, page))
+        return task
+
+    def add(self, page: Page, data: bytes | memoryview | QImage) -> None:
+        """
+        Makes the page's preview if it doesn't have one
+
+        Parameters
+        ----------
+        page : Page
+            The page
+        data : bytes | memoryview | QImage
+            The page's image, either encoded or decoded at any size
+        """
+        key = PreviewCache.key(page)
+        if key in self._pixmaps or key in self._creating or key in self._saved:
+            return
+
+        self._creating.add(key)
+        task = self.app.image_pipeline.process(
+            data, PreviewCache.spec, self, priority=-2
+        )
+        task.finished.connect(partial(self._created, page))
+        task.failed.connect(partial(self._creating.discard, key))
+
+    def _loaded(self, key: PreviewKey, image: QImage, _: bytes) -> None:
+        self._pixmaps[key] = QPixmap.fromImage(image)
+        self._pixmaps.move_to_end(key)
+        while len(self._pixmaps) > self.max_count:
+            self._pixmaps.popitem(last=False)
+
+    def _created(self, page: Page, image: QImage, data: bytes) -> None:
+        key = PreviewCache.key(page)
+        self._creating.discard(key)
+        self._loaded(key, image, data)
+        self._writer.write(
+            self._file_path(page), data, finished=lambda _: self._saved.add(key)
+        )
+
+    def _prune(self) -> list[PreviewKey]:
+        # Returns the previews that are kept
+        try:
+            chapters = [entry for entry in os.scandir(self.path) if entry.is_dir()]
+        except FileNotFoundError:
+            return []
+
+        # Adding a preview to a chapter's directory updates its modification time
+        chapters.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in chapters[self.max_chapters :]:
+            forget_directories(entry.path)
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+        keys = []
+        for entry in chapters[: self.max_chapters]:
+            if not entry.name.isdigit():
+                continue
+            for file in os.scandir(entry.path):
+                number, _, downloaded = file.name.removesuffix(".jpg").partition("-")
+                if file.name.endswith(".jpg") and number.isdigit():
+                    keys.append(
+                        (int(entry.name), int(number), downloaded == "downloaded")
+                    )
+        return keys
@@ -26,6 +26,7 @@ class Sql:
             raise FileNotFoundError("Failed to open sql file")
 
         self._create_tables()
+        self._migrate()
 
     def _create_tables(self) -> None:
         query = self.create_query()
@@ -81,6 +82,37 @@ class Sql:
             """
         )
 
+    def _migrate(self) -> None:
+        query = self.create_query()
+        query.exec("PRAGMA user_version;")
+        current_version = query.value(0) if query.first() else 0
+
+        migrations = (
+            # prefetched holds the time a prefetched chapter was downloaded or
+            # last opened. NULL for chapters downloaded by the user
+            ("ALTER TABLE chapters ADD COLUMN prefetched INTEGER DEFAULT NULL;",),
+            # size is the number of bytes a downloaded chapter takes on disk.
+            # Chapters downloaded before are measured by the downloader.
+            # last_read is the last time the chapter was opened in the reader
+            (
+                "ALTER TABLE chapters ADD COLUMN size INTEGER DEFAULT NULL;",
+                "ALTER TABLE chapters ADD COLUMN last_read INTEGER DEFAULT NULL;",
+                "CREATE INDEX IF NOT EXISTS chapters_last_read_index ON chapters(last_read) WHERE downloaded = TRUE;",
+            ),
+        )
+        for version, statements in enumerate(
+            migrations[current_version:], start=current_version + 1
+        ):
+            self._conn.transaction()
+            for statement in statements:
+                if not query.exec(statement):
+                    self._conn.rollback()
+                    return logger.error(
+                        f"Failed to migrate database to version {version} - {query.lastError().text()}"
+                    )
+            query.exec(f"PRAGMA user_version = {version};")
+            self._conn.commit()
+
     def create_query(self) -> QSqlQuery:
         query = QSqlQuery(self._conn)
         query.exec("PRAGMA foreign_keys=ON;")
@@ -580,13 +612,25 @@ class Sql:
                 )
 
     def mark_chapters_download_status(
-        self, chapter: Chapter, *, downloaded: bool
+        self,
+        chapter: Chapter,
+        *,
+        downloaded: bool,
+        prefetched: bool = False,
+        size: int = 0,
     ) -> bool:
         query = self.create_query()
-        query.prepare("UPDATE chapters SET downloaded = :downloaded WHERE id = :id;")
+        query.prepare(
+            "UPDATE chapters SET downloaded = :downloaded, prefetched = :prefetched, size = :size WHERE id = :id;"
+        )
 
         query.bindValue(":id", chapter.id)
         query.bindValue(":downloaded", downloaded)
+        query.bindValue(
+            ":prefetched",
+            int(datetime.now().timestamp()) if downloaded and prefetched else None,
+        )
+        query.bindValue(":size", size if downloaded else None)
 
         if ret := query.exec():
             chapter.downloaded = downloaded
@@ -597,5 +641,176 @@ class Sql:
             )
         return ret
 
+    def is_chapter_prefetched(self, chapter: Chapter) -> bool:
+        query = self.create_query()
+        query.prepare(
+            "SELECT 1 FROM chapters WHERE id = :id AND prefetched IS NOT NULL;"
+        )
+        query.bindValue(":id", chapter.id)
+        return query.exec() and query.first()
+
+    def mark_chapter_opened(self, chapter: Chapter) -> None:
+        query = self.create_query()
+        query.prepare(
+            """UPDATE chapters
+               SET last_read = :now,
+                   prefetched = CASE WHEN prefetched IS NULL THEN NULL ELSE :now END
+               WHERE id = :id;"""
+        )
+        query.bindValue(":id", chapter.id)
+        query.bindValue(":now", int(datetime.now().timestamp()))
+        if not query.exec():
+            logger.error(
+                f"Failed to mark chapter ({chapter.title}) as opened - {query.lastError().text()}"
+            )
+
+    def get_expired_prefetched_chapters(self, before: datetime) -> list[Chapter]:
+        query = self.create_query()
+        query.prepare(
+            "SELECT id FROM chapters WHERE downloaded = TRUE AND prefetched < :before;"
+        )
+        query.bindValue(":before", int(before.timestamp()))
+        if not query.exec():
+            logger.error(
+                f"Failed to get expired prefetched chapters - {query.lastError().text()}"
+            )
+            return []
+
+        ids = []
+        while query.next():
+            ids.append(query.value("id"))
+
+        return [
+            chapter
+            for chapter in map(self.get_chapter_by_id, ids)
+            if chapter is not None
+        ]
+
+    def get_download_usage(self) -> int:
+        query = self.create_query()
+        if not query.exec(
+            "SELECT COALESCE(SUM(size), 0) FROM chapters WHERE downloaded = TRUE;"
+        ):
+            logger.error(f"Failed to get download usage - {query.lastError().text()}")
+            return 0
+        return query.value(0) if query.first() else 0
+
+    def get_source_download_usage(self) -> dict[Source, int]:
+        query = self.create_query()
+        query.setForwardOnly(True)
+        if not query.exec(
+            """SELECT mangas.source AS source, SUM(chapters.size) AS size
+               FROM chapters
+               INNER JOIN mangas ON mangas.id = chapters.manga_id
+               WHERE chapters.downloaded = TRUE
+               GROUP BY mangas.source
+               ORDER BY size DESC;"""
+        ):
+            logger.error(
+                f"Failed to get source download usage - {query.lastError().text()}"
+            )
+            return {}
+
+        usage: dict[Source, int] = {}
+        while query.next():
+            source = self.app.source_manager.get_source(query.value("source"))
+            if source is not None:
+                usage[source] = query.value("size") or 0
+        return usage
+
+    def get_manga_download_usage(self) -> dict[Manga, int]:
+        source_manager = self.app.source_manager
+
+        query = self.create_query()
+        query.setForwardOnly(True)
+        if not query.exec(
+            """SELECT mangas.*, SUM(chapters.size) AS size
+               FROM chapters
+               INNER JOIN mangas ON mangas.id = chapters.manga_id
+               WHERE chapters.downloaded = TRUE
+               GROUP BY mangas.id
+               ORDER BY size DESC;"""
+        ):
+            logger.error(
+                f"Failed to get manga download usage - {query.lastError().text()}"
+            )
+            return {}
+
+        usage: dict[Manga, int] = {}
+        while query.next():
+            source = source_manager.get_source(query.value("source"))
+            if source is None:
+                continue
+
+            manga = Manga(
+                id=query.value("id"),
+                source=source,
+                title=query.value("title"),
+                description=query.value("description"),
+                author=query.value("author"),
+                artist=query.value("artist"),
+                thumbnail=query.value("thumbnail"),
+                url=query.value("url"),
+                library=bool(query.value("library")),
+                initialized=bool(query.value("initialized")),
+            )
+            usage[manga] = query.value("size") or 0
+        return usage
+
+    def get_unmeasured_chapters(self) -> list[tuple[int, int]]:
+        # (id, manga_id) of downloaded chapters without a size,
+        # which were downloaded before sizes were recorded
+        query = self.create_query()
+        query.setForwardOnly(True)
+        if not query.exec(
+            "SELECT id, manga_id FROM chapters WHERE downloaded = TRUE AND size IS NULL;"
+        ):
+            logger.error(
+                f"Failed to get unmeasured chapters - {query.lastError().text()}"
+            )
+            return []
+
+        chapters = []
+        while query.next():
+            chapters.append((query.value("id"), query.value("manga_id")))
+        return chapters
+
+    def set_chapter_sizes(self, sizes: list[tuple[int, int]]) -> None:
+        query = self.create_query()
+        query.prepare(
+            "UPDATE chapters SET size = :size WHERE id = :id AND downloaded = TRUE;"
+        )
+
+        self._conn.transaction()
+        for chapter_id, size in sizes:
+            query.bindValue(":id", chapter_id)
+            query.bindValue(":size", size)
+            if not query.exec():
+                logger.error(
+                    f"Failed to set the size of chapter {chapter_id} - {query.lastError().text()}"
+                )
+        self._conn.commit()
+
+    def get_eviction_candidates(self) -> list[tuple[int, int]]:
+        # (id, size) of downloaded chapters, least recently read first
+        # and never opened chapters last
+        query = self.create_query()
+        query.setForwardOnly(True)
+        if not query.exec(
+            """SELECT id, COALESCE(size, 0) AS size
+               FROM chapters
+               WHERE downloaded = TRUE
+               ORDER BY last_read IS NULL, last_read;"""
+        ):
+            logger.error(
+                f"Failed to get downloaded chapters - {query.lastError().text()}"
+            )
+            return []
+
+        chapters = []
+        while query.next():
+            chapters.append((query.value("id"), query.value("size")))
+        return chapters
+
     def commit(self) -> None:
         self._conn.commit()
@@ -0,0 +1,561 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import zipfile
+from dataclasses import asdict, dataclass, field
+from enum import IntEnum
+from logging import getLogger
+from threading import Lock
+from typing import BinaryIO
+
+from PyQt6.QtGui import QImageWriter
+
+from .imagepipeline import ImageInfo, ImageSpec, read_image_size
+
+__all__ = (
+    "ArchiveChapterWriter",
+    "ChapterArchive",
+    "ChapterManifest",
+    "ChapterWriter",
+    "FolderChapterWriter",
+    "ManifestPage",
+    "PageFormat",
+    "PageStorageOptions",
+    "StorageBackend",
+    "ThumbnailSize",
+    "atomic_write",
+    "ensure_directory",
+    "forget_directories",
+)
+
+logger = getLogger(__name__)
+
+# the single 900px png thumbnail saved by older versions
+LEGACY_THUMBNAIL_FILENAME = "thumbnail.png"
+
+_created_directories: set[str] = set()
+_directories_lock = Lock()
+
+
+def ensure_directory(path: str) -> None:
+    """
+    Creates a directory and its parents if they don't exist
+
+    Directories created through this function are remembered so
+    repeated calls don't touch the disk.
+
+    Parameters
+    ----------
+    path : str
+        The directory
+    """
+    with _directories_lock:
+        if path in _created_directories:
+            return
+        os.makedirs(path, exist_ok=True)
+        _created_directories.add(path)
+
+
+def forget_directories(path: str) -> None:
+    """
+    Makes `ensure_directory` check the disk again for a path and everything
+    under it. Has to be called before the directory is deleted.
+
+    Parameters
+    ----------
+    path : str
+        The directory being deleted
+    """
+    prefix = os.path.join(path, "")
+    with _directories_lock:
+        _created_directories.difference_update(
+            directory
+            for directory in tuple(_created_directories)
+            if directory == path or directory.startswith(prefix)
+        )
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """
+    Writes a file through a temporary file so readers never see it half written
+
+    Parameters
+    ----------
+    path : str
+        The file
+    data : bytes
+        The contents of the file
+    """
+    ensure_directory(os.path.dirname(path))
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+class StorageBackend(IntEnum):
+    FOLDER, ARCHIVE = range(2)
+
+
+class ThumbnailSize(IntEnum):
+    """
+    Variants library thumbnails are stored in.
+
+    `GRID` is used by the manga grids and is sized for the grid cells on
+    high dpi screens. `LARGE` is used by the manga card and when a
+    thumbnail is opened full screen.
+    """
+
+    GRID, LARGE = range(2)
+
+    @property
+    def height(self) -> int:
+        return 558 if self == ThumbnailSize.GRID else 1350
+
+    @property
+    def filename(self) -> str:
+        return f"thumbnail-{self.name.lower()}.{ThumbnailSize.extension()}"
+
+    @property
+    def filenames(self) -> tuple[str, ...]:
+        # every name the variant might be saved under, best match first
+        name = f"thumbnail-{self.name.lower()}"
+        return (f"{name}.webp", f"{name}.jpg", LEGACY_THUMBNAIL_FILENAME)
+
+    @staticmethod
+    def encoder() -> str:
+        supported = QImageWriter.supportedImageFormats()
+        return "WEBP" if b"webp" in (bytes(fmt) for fmt in supported) else "JPG"
+
+    @staticmethod
+    def extension() -> str:
+        return ThumbnailSize.encoder().lower()
+
+    def image_spec(self, info: ImageInfo | None) -> ImageSpec:
+        height = self.height
+        if info is not None and info.size.height() > 0:
+            height = min(height, info.size.height())
+        return ImageSpec(height=height, format=ThumbnailSize.encoder(), quality=85)
+
+
+class PageFormat(IntEnum):
+    ORIGINAL, JPEG, WEBP = range(3)
+
+    @property
+    def encoder(self) -> str | None:
+        match self:
+            case PageFormat.JPEG:
+                return "JPG"
+            case PageFormat.WEBP:
+                return "WEBP"
+        return None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PageStorageOptions:
+    """
+    How downloaded pages are written to disk.
+
+    Attributes
+    ----------
+    format : PageFormat
+        The format pages are saved as. `PageFormat.ORIGINAL` keeps the bytes sent by the source.
+    quality : int
+        Encoder quality for `PageFormat.JPEG` and `PageFormat.WEBP`.
+    max_width : int
+        Pages wider than this are scaled down. 0 disables scaling.
+    """
+
+    format: PageFormat = PageFormat.ORIGINAL
+    quality: int = 90
+    max_width: int = 0
+
+    def image_spec(self, info: ImageInfo) -> ImageSpec | None:
+        """
+        Returns the spec a page has to be processed with before being saved
+
+        Parameters
+        ----------
+        info : ImageInfo
+            The format and size of the downloaded page
+
+        Returns
+        -------
+        ImageSpec | None
+            The spec or None if the page can be saved as is
+        """
+        width = self.max_width if 0 < self.max_width < info.size.width() else None
+
+        if self.format == PageFormat.ORIGINAL:
+            if width is None:
+                return None
+
+            supported = {
+                bytes(fmt).decode().lower()
+                for fmt in QImageWriter.supportedImageFormats()
+            }
+            encoder = info.format if info.format in supported else "png"
+            return ImageSpec(width=width, format=encoder)
+
+        return ImageSpec(width=width, format=self.format.encoder, quality=self.quality)
+
+
+@dataclass(slots=True, kw_only=True)
+class ManifestPage:
+    name: str
+    size: int = 0
+    sha1: str = ""
+    width: int = 0
+    height: int = 0
+
+
+@dataclass(slots=True, kw_only=True)
+class ChapterManifest:
+    """
+    Index of the pages saved for a downloaded chapter.
+
+    The reader uses this to find the pages of a chapter instead of
+    guessing file names from the contents of the chapter directory.
+    Manifests written before version 2 have no page count, sizes or hashes
+    and the ones written before version 3 have no page dimensions.
+    """
+
+    FILENAME = "manifest.json"
+    VERSION = 3
+
+    page_count: int = 0
+    pages: list[ManifestPage] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return len(self.pages) == self.page_count
+
+    def add_page(self, name: str, data: bytes) -> None:
+        # The dimensions let the reader lay out the pages before decoding them
+        image_size = read_image_size(data)
+        self.pages.append(
+            ManifestPage(
+                name=name,
+                size=len(data),
+                sha1=hashlib.sha1(data).hexdigest(),
+                width=image_size.width() if image_size is not None else 0,
+                height=image_size.height() if image_size is not None else 0,
+            )
+        )
+
+    def to_json(self) -> dict:
+        return {
+            "version": ChapterManifest.VERSION,
+            "page_count": self.page_count,
+            "pages": [asdict(page) for page in self.pages],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> ChapterManifest:
+        pages = [ManifestPage(**page) for page in data["pages"]]
+        return cls(page_count=data.get("page_count", len(pages)), pages=pages)
+
+    def verify(self, directory: str) -> bool:
+        """
+        Checks that every page of the chapter is on disk with the size it was saved with.
+        Only stats the files, the pages aren't read.
+
+        Parameters
+        ----------
+        directory : str
+            The chapter directory
+
+        Returns
+        -------
+        bool
+            Whether the chapter is complete
+        """
+        if not self.complete:
+            return False
+
+        for page in self.pages:
+            try:
+                size = os.stat(os.path.join(directory, page.name)).st_size
+            except OSError:
+                return False
+            if page.size and size != page.size:
+                return False
+        return True
+
+    @classmethod
+    def load(cls, directory: str) -> ChapterManifest | None:
+        """
+        Loads the manifest saved in a chapter directory
+
+        Parameters
+        ----------
+        directory : str
+            The chapter directory
+
+        Returns
+        -------
+        ChapterManifest | None
+            The manifest or None if it's missing or invalid
+        """
+        path = os.path.join(directory, ChapterManifest.FILENAME)
+        try:
+            with open(path) as f:
+                return cls.from_json(json.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Failed to read chapter manifest {path}", exc_info=e)
+            return None
+
+    def save(self, directory: str) -> None:
+        atomic_write(
+            os.path.join(directory, ChapterManifest.FILENAME),
+            json.dumps(self.to_json()).encode(),
+        )
+
+
+class ChapterWriter:
+    """
+    Writes the pages of a chapter as they're downloaded.
+
+    Subclasses decide where the pages end up. The manifest is
+    written once `finish` is called, after which `size` holds
+    the number of bytes the chapter takes on disk. Nothing is
+    written until the first page arrives.
+
+    A writer can outlive the download that created it. When a download
+    is paused the writer is kept and the resumed download continues
+    from `next_page`.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.manifest = ChapterManifest()
+        self.size = 0
+        self._failed = False
+
+    @property
+    def next_page(self) -> int:
+        return len(self.manifest.pages)
+
+    def write_page(self, name: str, data: bytes, *, page_count: int) -> None:
+        try:
+            self._write(name, data)
+        except Exception:
+            self._failed = True
+            raise
+        self.manifest.page_count = page_count
+        self.manifest.add_page(name, data)
+        self.size += len(data)
+
+    def _write(self, name: str, data: bytes) -> None:
+        raise NotImplementedError
+
+    def finish(self) -> None:
+        if self._failed:
+            raise OSError(f"{self.path} is missing pages that failed to write")
+        self._finish()
+
+    def _finish(self) -> None:
+        raise NotImplementedError
+
+    def discard(self) -> None:
+        raise NotImplementedError
+
+
+class FolderChapterWriter(ChapterWriter):
+    """Saves every page as a separate file in the chapter directory"""
+
+    def _write(self, name: str, data: bytes) -> None:
+        atomic_write(os.path.join(self.path, name), data)
+
+    def _finish(self) -> None:
+        # the manifest is only written here so a chapter without one is incomplete
+        self.manifest.save(self.path)
+        self.size += os.path.getsize(os.path.join(self.path, ChapterManifest.FILENAME))
+
+    def discard(self) -> None:
+        names = [page.name for page in self.manifest.pages]
+        for name in (*names, ChapterManifest.FILENAME):
+            try:
+                os.remove(os.path.join(self.path, name))
+            except FileNotFoundError:
+                ...
+
+        forget_directories(self.path)
+        try:
+            os.rmdir(self.path)
+        except OSError:
+            # never created, or holds files the writer didn't write
+            ...
+
+
+class ArchiveChapterWriter(ChapterWriter):
+    """
+    Streams every page into a single uncompressed zip (cbz) file
+
+    The archive is written under a temporary name and only moved
+    to its final path once it's complete.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+        self._temp_path = f"{path}.part"
+        self._archive: zipfile.ZipFile | None = None
+
+    def _open(self) -> zipfile.ZipFile:
+        if self._archive is None:
+            ensure_directory(os.path.dirname(self.path))
+            self._archive = zipfile.ZipFile(self._temp_path, "w", zipfile.ZIP_STORED)
+        return self._archive
+
+    def _write(self, name: str, data: bytes) -> None:
+        self._open().writestr(name, data)
+
+    def _finish(self) -> None:
+        archive = self._open()
+        archive.writestr(ChapterManifest.FILENAME, json.dumps(self.manifest.to_json()))
+        archive.close()
+        os.replace(self._temp_path, self.path)
+        self.size = os.path.getsize(self.path)
+
+    def discard(self) -> None:
+        if self._archive is not None:
+            self._archive.close()
+        try:
+            os.remove(self._temp_path)
+        except FileNotFoundError:
+            ...
+
+
+class ChapterArchive:
+    """
+    Read only view of a chapter archive.
+
+    The archive is memory mapped and pages are returned as slices
+    of the map so reading a page doesn't copy it. The archive has to
+    be closed once its pages aren't needed. Slices still being decoded
+    keep the map alive and it's unmapped once the last one is dropped.
+    """
+
+    _LOCAL_HEADER_SIZE = 30
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._entries: dict[str, tuple[int, int]] = {}
+
+        with open(path, "rb") as f:
+            self._mmap: mmap.mmap | None = mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            )
+            try:
+                self._read_entries(f)
+                if (manifest := self.read(ChapterManifest.FILENAME)) is None:
+                    raise FileNotFoundError(f"{path} has no manifest")
+                with manifest:
+                    self.manifest = ChapterManifest.from_json(
+                        json.loads(bytes(manifest))
+                    )
+            except BaseException:
+                self.close()
+                raise
+
+    def _read_entries(self, f: BinaryIO) -> None:
+        with zipfile.ZipFile(f) as archive:
+            for info in archive.infolist():
+                if info.compress_type != zipfile.ZIP_STORED:
+                    continue
+
+                name_length, extra_length = struct.unpack_from(
+                    "<HH", self._mmap, info.header_offset + 26
+                )
+                start = (
+                    info.header_offset
+                    + ChapterArchive._LOCAL_HEADER_SIZE
+                    + name_length
+                    + extra_length
+                )
+                self._entries[info.filename] = (start, info.file_size)
+
+    @classmethod
+    def open(cls, path: str) -> ChapterArchive | None:
+        """
+        Opens a chapter archive
+
+        Parameters
+        ----------
+        path : str
+            Path to the archive
+
+        Returns
+        -------
+        ChapterArchive | None
+            The archive or None if it couldn't be read
+        """
+        try:
+            return cls(path)
+        except Exception as e:
+            logger.error(f"Failed to open chapter archive {path}", exc_info=e)
+            return None
+
+    def verify(self) -> bool:
+        """
+        Checks that every page in the manifest is in the archive with the size it was saved with
+
+        Returns
+        -------
+        bool
+            Whether the chapter is complete
+        """
+        if not self.manifest.complete:
+            return False
+
+        for page in self.manifest.pages:
+            if (entry := self._entries.get(page.name)) is None:
+                return False
+            if page.size and entry[1] != page.size:
+                return False
+        return True
+
+    @property
+    def closed(self) -> bool:
+        return self._mmap is None
+
+    def read(self, name: str) -> memoryview | None:
+        """
+        Returns a file in the archive without copying it
+
+        Parameters
+        ----------
+        name : str
+            The name of the file
+
+        Returns
+        -------
+        memoryview | None
+            A slice of the map or None if the file isn't in the archive or the archive
+            is closed. The slice stays readable after the archive is closed
+        """
+        if self._mmap is None or (entry := self._entries.get(name)) is None:
+            return None
+
+        start, size = entry
+        return memoryview(self._mmap)[start : start + size]
+
+    def close(self) -> None:
+        """
+        Stops reading from the archive and unmaps it. Slices returned by `read` aren't
+        released since queued decodes may still hold them, the map is unmapped once
+        the last of them is dropped instead
+        """
+        if self._mmap is None:
+            return
+
+        try:
+            self._mmap.close()
+        except BufferError:
+            # the slices hold a reference to the map, dropping ours leaves it to them
+            ...
+        self._mmap = None
@@ -41,6 +41,22 @@ def temp_dir_path() -> str:
     return path
 
 
+def cache_dir_path() -> str:
+    """Returns the cache dir path
+
+    Returns
+    -------
+    str
+        The path
+    """
+    path = QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.CacheLocation
+    )
+    if not os.path.exists(path):
+        os.makedirs(path, exist_ok=True)
+    return path
+
+
 def resource_path() -> str:
     """Returns the resource dir path
 
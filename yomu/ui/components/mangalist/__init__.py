@@ -1,2 +1,2 @@
 from .core import MangaList
-from .mangaview import MangaView
+from .model import MangaModel, MangaRole
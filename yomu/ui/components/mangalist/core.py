@@ -1,139 +1,295 @@
+import os
+from collections.abc import Iterable
 from typing import Callable, TYPE_CHECKING
 
-from PyQt6.QtCore import pyqtSignal, QEvent, QObject, Qt
-from PyQt6.QtGui import QFocusEvent, QMouseEvent
-from PyQt6.QtWidgets import QMenu, QScrollArea, QScrollBar, QWidget
+from PyQt6.QtCore import QMimeData, QModelIndex, QPoint, QSize, Qt, QTimer, QUrl
+from PyQt6.QtGui import (
+    QContextMenuEvent,
+    QDrag,
+    QFocusEvent,
+    QKeyEvent,
+    QMouseEvent,
+    QMovie,
+    QPixmap,
+    QResizeEvent,
+)
+from PyQt6.QtWidgets import (
+    QApplication,
+    QFrame,
+    QListView,
+    QMenu,
+    QScrollBar,
+    QStyleOptionViewItem,
+    QWidget,
+)
 
 from yomu.core import utils
-from yomu.ui.components.iterator import LayoutIterator
+from yomu.core.models import Manga
 
+from .delegate import MangaDelegate
 from .find import Find
-from .layout import FlowLayout
-from .mangaview import MangaView
-from .selector import MangaSelector
+from .model import MangaModel, MangaRole
 
 if TYPE_CHECKING:
     from yomu.core.app import YomuApp
-    from yomu.core.models import Manga
     from yomu.ui import ReaderWindow
 
 
-class MangaList(QScrollArea, LayoutIterator[MangaView]):
-    view_added = pyqtSignal(MangaView)
-    view_removed = pyqtSignal((int, MangaView))
+class MangaList(QListView):
+    # The smallest gap between two cards on the same row and the gap between rows
+    HORIZONTAL_SPACING = 5
+    VERTICAL_SPACING = 10
+    # Covers still loading once scrolling stops for this long are cancelled if they're off screen
+    SCROLL_TIMEOUT = 150
 
     def __init__(self, parent: QWidget, app: YomuApp) -> None:
         super().__init__(parent)
         self.app = app
 
-        body = QWidget(self)
-        body.setLayout(FlowLayout(body))
-        body.setMouseTracking(True)
-        self.setContentsMargins(0, 0, 0, 0)
-        self.setWidgetResizable(True)
-        self.setWidget(body)
-
+        # Only the cells in view get painted and only their covers are kept decoded,
+        # so a large library costs about as much as a small one
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setViewMode(QListView.ViewMode.ListMode)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+
+        self.loading_movie = QMovie(
+            os.path.join(utils.resource_path(), "icons", "loading.gif"), parent=self
+        )
+        self.loading_movie.frameChanged.connect(self._loading_frame_changed)
+
+        self.manga_model = MangaModel(self, app)
+        self.manga_model.thumbnails.busy_changed.connect(self._thumbnails_busy)
+        self.setModel(self.manga_model)
+        self.setItemDelegate(MangaDelegate(self, self.loading_movie))
+
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(self.SCROLL_TIMEOUT)
+        self._scroll_timer.timeout.connect(self._cancel_hidden_thumbnails)
+        self.verticalScrollBar().valueChanged.connect(self._scroll_timer.start)
+
+        self._drag_start: QPoint | None = None
+
         self.addAction("Find").triggered.connect(self.find_manga)
         app.keybinds_changed.connect(self._set_keybinds)
         self._set_keybinds(utils.get_keybinds())
-        self.setMouseTracking(True)
-        self.selector = MangaSelector(self)
 
     window: Callable[[], ReaderWindow]
     verticalScrollBar: Callable[[], QScrollBar]
     horizontalScrollBar: Callable[[], QScrollBar]
-    widget: Callable[[], QWidget]
-
-    def layout(self) -> FlowLayout:
-        return self.widget().layout()
+    itemDelegate: Callable[[], MangaDelegate]
 
     def count(self, include_hidden: bool = True) -> int:
-        return self.layout().count(include_hidden=include_hidden)
-
-    def eventFilter(self, a0: QObject, a1: QEvent) -> bool:
-        if isinstance(a0, MangaView):
-            if (
-                a1.type() == QEvent.Type.MouseButtonRelease
-                and a1.button() == Qt.MouseButton.LeftButton
-            ):
-                self.window().mangacard.manga = a0.manga
-                return True
-
-            if a1.type() == QEvent.Type.ContextMenu:
-                menu = QMenu(self)
-                menu.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-
-                text = "Remove From Library" if a0.manga.library else "Add To Library"
-                library = menu.addAction(text)
-                copy = menu.addAction("Copy Title")
-
-                action = menu.exec(a1.globalPos())
-                if action == library:
-                    self.app.sql.set_library(a0.manga, library=not a0.manga.library)
-                elif action == copy:
-                    self.app.clipboard().setText(a0.manga.title)
-                return True
-
-        return super().eventFilter(a0, a1)
-
-    def mousePressEvent(self, event: QMouseEvent | None) -> None:
-        for i in range(self.count()):
-            self.manga_view_at(i).title_widget.setSelection(0, 0)
-        return super().mousePressEvent(event)
-
-    def focusInEvent(self, a0: QFocusEvent | None) -> None:
+        rows = self.manga_model.rowCount()
+        if include_hidden:
+            return rows
+        return sum(1 for row in range(rows) if not self.isRowHidden(row))
+
+    def manga_at(self, pos: QPoint) -> Manga | None:
+        """The manga whose card is at a position of the viewport"""
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return None
+        # Cells are wider than their cards so the gaps between cards don't count
+        option = QStyleOptionViewItem()
+        self.initViewItemOption(option)
+        option.rect = self.visualRect(index)
+        if not self.itemDelegate().card_rect(option).contains(pos):
+            return None
+        return index.data(MangaRole.MANGA)
+
+    def resizeEvent(self, e: QResizeEvent) -> None:
+        super().resizeEvent(e)
+        self._update_grid()
+
+    def _update_grid(self) -> None:
+        # Cards are spread evenly across each row, like the rows of a centered flow layout
+        delegate = self.itemDelegate()
+        card = delegate.card_size(self.fontMetrics())
+        width = self.viewport().width()
+        columns = max(
+            (width + self.HORIZONTAL_SPACING)
+            // (card.width() + self.HORIZONTAL_SPACING),
+            1,
+        )
+        grid = QSize(
+            max(width // columns, card.width()), card.height() + self.VERTICAL_SPACING
+        )
+        if grid != self.gridSize():
+            delegate.cell_size = QSize(grid.width(), card.height())
+            self.setGridSize(grid)
+
+    def contextMenuEvent(self, e: QContextMenuEvent) -> None:
+        if (manga := self.manga_at(e.pos())) is None:
+            # Left to whatever holds the list
+            return e.ignore()
+
+        menu = QMenu(self)
+        menu.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+        text = "Remove From Library" if manga.library else "Add To Library"
+        library = menu.addAction(text)
+        copy = menu.addAction("Copy Title")
+
+        action = menu.exec(e.globalPos())
+        if action == library:
+            self.app.sql.set_library(manga, library=not manga.library)
+        elif action == copy:
+            self.app.clipboard().setText(manga.title)
+
+    def keyPressEvent(self, e: QKeyEvent) -> None:
+        key = e.key()
+        if key in (Qt.Key.Key_Enter, Qt.Key.Key_Return):
+            index = self.currentIndex()
+            if not index.isValid() or self.isRowHidden(index.row()):
+                return
+            manga: Manga = index.data(MangaRole.MANGA)
+            if e.modifiers() == Qt.KeyboardModifier.ShiftModifier:
+                return self.app.sql.set_library(manga, library=not manga.library)
+            return self._open(manga)
+
+        if key == Qt.Key.Key_Escape and self.currentIndex().isValid():
+            return self.clear_selected()
+        return super().keyPressEvent(e)
+
+    def mousePressEvent(self, e: QMouseEvent) -> None:
+        if e.button() == Qt.MouseButton.BackButton:
+            return e.ignore()
+
+        self._drag_start = None
+        if e.button() == Qt.MouseButton.LeftButton:
+            self._drag_start = e.position().toPoint()
+        return super().mousePressEvent(e)
+
+    def mouseMoveEvent(self, e: QMouseEvent) -> None:
+        pos = e.position().toPoint()
+        self.viewport().setCursor(
+            Qt.CursorShape.PointingHandCursor
+            if self.manga_at(pos) is not None
+            else Qt.CursorShape.ArrowCursor
+        )
+
+        start = self._drag_start
+        if (
+            e.buttons() != Qt.MouseButton.LeftButton
+            or start is None
+            or (pos - start).manhattanLength() < QApplication.startDragDistance()
+        ):
+            return super().mouseMoveEvent(e)
+
+        self._drag_start = None
+        if (manga := self.manga_at(start)) is None:
+            return super().mouseMoveEvent(e)
+        if (pixmap := self.manga_model.thumbnails.get(manga)) is not None:
+            self._drag_thumbnail(pixmap)
+
+    def mouseReleaseEvent(self, e: QMouseEvent) -> None:
+        start, self._drag_start = self._drag_start, None
+        super().mouseReleaseEvent(e)
+        if e.button() != Qt.MouseButton.LeftButton or start is None:
+            return
+
+        manga = self.manga_at(e.position().toPoint())
+        if manga is not None and manga == self.manga_at(start):
+            self._open(manga)
+
+    def _drag_thumbnail(self, pixmap: QPixmap) -> None:
+        mimedata = QMimeData()
+        mimedata.setImageData(pixmap.toImage())
+        path = os.path.join(utils.temp_dir_path(), "dragged-image.jpg")
+        pixmap.save(path, "JPG")
+        mimedata.setUrls([QUrl.fromLocalFile(path)])
+
+        drag = QDrag(self)
+        drag.setMimeData(mimedata)
+        drag.setPixmap(pixmap)
+        drag.setHotSpot(pixmap.rect().center())
+        drag.exec(Qt.DropAction.CopyAction)
+
+    def focusInEvent(self, e: QFocusEvent) -> None:
         if not self.count(include_hidden=False):
             self.focusNextChild()
-        return super().focusInEvent(a0)
+        return super().focusInEvent(e)
+
+    def _open(self, manga: Manga) -> None:
+        self.window().mangacard.manga = manga
 
     def _set_keybinds(self, keybinds: dict[str, utils.Keybind]) -> None:
         for action in self.actions():
             data = keybinds.get(action.text(), {"keybinds": []})
             action.setShortcuts(data["keybinds"] if data is not None else [])
 
-    def item_at(self, index: int, *, include_hidden: bool = True):
-        return self.layout().itemAt(index, include_hidden=include_hidden)
+    def _thumbnails_busy(self, busy: bool) -> None:
+        if busy:
+            self.loading_movie.start()
+        else:
+            self.loading_movie.stop()
+
+    def _loading_frame_changed(self) -> None:
+        # Only the cards of covers being loaded show the animation
+        model = self.manga_model
+        for manga_id in model.thumbnails.loading:
+            if (row := model.row(manga_id)) is not None:
+                self.update(model.index(row))
 
-    def take_at(self, index: int):
-        return self.layout().takeAt(index)
+    def _visible_mangas(self) -> set[int]:
+        grid = self.gridSize()
+        rect = self.viewport().rect()
+        if grid.isEmpty():
+            return set()
 
-    def manga_view_at(
-        self, index: int, *, include_hidden: bool = True
-    ) -> MangaView | None:
-        if (item := self.item_at(index, include_hidden=include_hidden)) is not None:
-            widget = item.widget()
-            if isinstance(widget, MangaView):
-                return widget
+        # Every cell is the size of the grid, so probing the center of each one finds them all
+        ids = set()
+        offset = self.verticalScrollBar().value() % grid.height()
+        for y in range(
+            grid.height() // 2 - offset, rect.height() + grid.height(), grid.height()
+        ):
+            for x in range(grid.width() // 2, rect.width(), grid.width()):
+                index = self.indexAt(QPoint(x, y))
+                if index.isValid():
+                    ids.add(index.data(MangaRole.MANGA).id)
+        return ids
+
+    def _cancel_hidden_thumbnails(self) -> None:
+        self.manga_model.thumbnails.cancel_except(self._visible_mangas())
 
     def find_manga(self) -> None:
         Find(self).exec()
 
-    def add_manga(self, manga: Manga) -> MangaView:
-        view = MangaView(self, manga)
-        self.app.manga_library_status_changed.connect(view.library_status_changed)
-        self.app.manga_thumbnail_changed.connect(view.thumbnail_changed)
-        self.app.manga_details_updated.connect(view.detail_changed)
-        view.installEventFilter(self)
-        self.layout().addWidget(view)
-        self.view_added.emit(view)
-        return view
-
-    def insert_manga(self, index: int, manga: Manga) -> MangaView:
-        view = MangaView(self, manga)
-        self.app.manga_library_status_changed.connect(view.library_status_changed)
-        self.app.manga_thumbnail_changed.connect(view.thumbnail_changed)
-        self.app.manga_details_updated.connect(view.detail_changed)
-        view.installEventFilter(self)
-        self.layout().insertWidget(index, view)
-        return view
+    def select_row(self, row: int) -> None:
+        index = self.manga_model.index(row)
+        self.setCurrentIndex(index)
+        self.scrollTo(index, QListView.ScrollHint.PositionAtTop)
+
+    def clear_selected(self) -> None:
+        self.clearSelection()
+        self.setCurrentIndex(QModelIndex())
+
+    def add_manga(self, manga: Manga) -> None:
+        self.manga_model.add_mangas((manga,))
+
+    def add_mangas(self, mangas: Iterable[Manga]) -> None:
+        self.manga_model.add_mangas(mangas)
+
+    def insert_manga(self, row: int, manga: Manga) -> None:
+        self.manga_model.insert_manga(row, manga)
 
     def remove_manga(self, manga: Manga) -> None:
-        for i, view in enumerate(self):
-            if view is not None and view.manga == manga:
-                self.view_removed.emit(i, view)
-                return view.deleteLater()
+        self.manga_model.remove_manga(manga)
+
+    def set_manga_hidden(self, manga: Manga, hidden: bool) -> None:
+        if (row := self.manga_model.row(manga.id)) is not None:
+            self.setRowHidden(row, hidden)
 
     def clear(self) -> None:
-        self.layout().clear()
-        self.verticalScrollBar().setMaximum(0)
+        self.manga_model.clear()
@@ -0,0 +1,155 @@
+import os
+
+from PyQt6.QtCore import QModelIndex, QObject, QRect, QSize, Qt
+from PyQt6.QtGui import QFontMetrics, QMovie, QPainter, QPalette, QPixmap
+from PyQt6.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from yomu.core import utils
+from yomu.core.downloader import Downloader
+from yomu.core.models import Manga
+from yomu.source import Source
+
+from .model import MangaRole
+
+
+class MangaDelegate(QStyledItemDelegate):
+    """
+    Paints a manga's cover with its library and source badges and its title below it.
+    Cards are centered in the cells of the list's grid
+    """
+
+    WIDTH = 230
+    THUMBNAIL_SIZE = QSize(195, 279)
+    MARGIN = 9
+    TITLE_SPACING = 6
+    ICON_SIZE = 20
+    ICON_MARGIN = 2
+
+    def __init__(self, parent: QObject, movie: QMovie) -> None:
+        super().__init__(parent)
+        # The frame of the loading animation is painted in place of covers being loaded
+        self.movie = movie
+        # The size of the list's grid cells, which cards are centered in
+        self.cell_size = QSize()
+        self._library_icon = QPixmap(
+            os.path.join(utils.resource_path(), "icons", "book.png")
+        ).scaled(self.ICON_SIZE, self.ICON_SIZE)
+        self._source_icons: dict[Source, QPixmap] = {}
+
+    def card_size(self, metrics: QFontMetrics) -> QSize:
+        return QSize(
+            self.WIDTH,
+            self.MARGIN * 2
+            + self.THUMBNAIL_SIZE.height()
+            + self.TITLE_SPACING
+            + metrics.lineSpacing() * 2,
+        )
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return self.card_size(option.fontMetrics).expandedTo(self.cell_size)
+
+    def card_rect(self, option: QStyleOptionViewItem) -> QRect:
+        return QStyle.alignedRect(
+            option.direction,
+            Qt.AlignmentFlag.AlignCenter,
+            self.card_size(option.fontMetrics),
+            option.rect,
+        )
+
+    def thumbnail_rect(self, option: QStyleOptionViewItem) -> QRect:
+        card = self.card_rect(option)
+        size = self.THUMBNAIL_SIZE
+        return QRect(
+            card.x() + (card.width() - size.width()) // 2,
+            card.y() + self.MARGIN,
+            size.width(),
+            size.height(),
+        )
+
+    def _source_icon(self, source: Source) -> QPixmap:
+        if (icon := self._source_icons.get(source)) is not None:
+            return icon
+
+        path = Downloader.resolve_path(source)
+        if not os.path.exists(path):
+            path = os.path.join(utils.icon_path(), "webview.svg")
+        icon = self._source_icons[source] = QPixmap(path).scaled(
+            self.ICON_SIZE,
+            self.ICON_SIZE,
+            transformMode=Qt.TransformationMode.SmoothTransformation,
+        )
+        return icon
+
+    def paint(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex
+    ) -> None:
+        manga: Manga = index.data(MangaRole.MANGA)
+        widget = option.widget
+
+        panel = QStyleOptionViewItem(option)
+        panel.rect = card = self.card_rect(option)
+        widget.style().drawPrimitive(
+            QStyle.PrimitiveElement.PE_PanelItemViewItem, panel, painter, widget
+        )
+
+        painter.save()
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        thumbnail = self.thumbnail_rect(option)
+        pixmap = index.data(MangaRole.THUMBNAIL) if manga.thumbnail else None
+        if pixmap is not None:
+            painter.setClipRect(thumbnail)
+            painter.drawPixmap(
+                QStyle.alignedRect(
+                    option.direction,
+                    Qt.AlignmentFlag.AlignCenter,
+                    pixmap.size() / pixmap.devicePixelRatio(),
+                    thumbnail,
+                ),
+                pixmap,
+            )
+            painter.setClipping(False)
+        elif not manga.thumbnail or index.data(MangaRole.THUMBNAIL_FAILED):
+            text = "Failed to load image" if manga.thumbnail else "Thumbnail not found"
+            painter.drawText(
+                thumbnail,
+                Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap,
+                text,
+            )
+        else:
+            frame = self.movie.currentPixmap()
+            painter.drawPixmap(
+                QStyle.alignedRect(
+                    option.direction,
+                    Qt.AlignmentFlag.AlignCenter,
+                    frame.size(),
+                    thumbnail,
+                ),
+                frame,
+            )
+
+        margin = self.ICON_MARGIN
+        if manga.library:
+            painter.drawPixmap(
+                thumbnail.x() + margin, thumbnail.y() + margin, self._library_icon
+            )
+        painter.drawPixmap(
+            thumbnail.right() - margin - self.ICON_SIZE + 1,
+            thumbnail.y() + margin,
+            self._source_icon(manga.source),
+        )
+
+        title = QRect(
+            card.x(),
+            thumbnail.bottom() + 1 + self.TITLE_SPACING,
+            card.width(),
+            option.fontMetrics.lineSpacing() * 2,
+        )
+        painter.setFont(option.font)
+        painter.drawText(
+            title,
+            Qt.AlignmentFlag.AlignHCenter
+            | Qt.AlignmentFlag.AlignTop
+            | Qt.TextFlag.TextWordWrap,
+            manga.title,
+        )
+        painter.restore()
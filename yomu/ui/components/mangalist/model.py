@@ -0,0 +1,139 @@
+from collections.abc import Iterable
+from copy import copy
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt
+
+from yomu.core.models import Manga
+
+from .thumbnails import ThumbnailLoader
+
+if TYPE_CHECKING:
+    from yomu.core.app import YomuApp
+
+
+class MangaRole(IntEnum):
+    MANGA = Qt.ItemDataRole.UserRole
+    THUMBNAIL = Qt.ItemDataRole.UserRole + 1
+    THUMBNAIL_FAILED = Qt.ItemDataRole.UserRole + 2
+
+
+class MangaModel(QAbstractListModel):
+    def __init__(self, parent: QObject, app: YomuApp) -> None:
+        super().__init__(parent)
+        self._mangas: list[Manga] = []
+        # The row of every manga by id
+        self._rows: dict[int, int] = {}
+
+        self.thumbnails = ThumbnailLoader(self, app)
+        self.thumbnails.loaded.connect(self._thumbnail_loaded)
+
+        # Connected once here instead of once per manga
+        app.manga_library_status_changed.connect(self._manga_changed)
+        app.manga_details_updated.connect(self._manga_changed)
+        app.manga_thumbnail_changed.connect(self._thumbnail_changed)
+
+    @property
+    def mangas(self) -> list[Manga]:
+        return self._mangas
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._mangas)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        manga = self._mangas[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return manga.title
+        if role == MangaRole.MANGA:
+            return manga
+        if role == MangaRole.THUMBNAIL:
+            # Only asked for by cells being painted, so covers are loaded as they come into view
+            return self.thumbnails.get(manga)
+        if role == MangaRole.THUMBNAIL_FAILED:
+            return self.thumbnails.has_failed(manga)
+        return None
+
+    def manga(self, row: int) -> Manga | None:
+        if 0 <= row < len(self._mangas):
+            return self._mangas[row]
+        return None
+
+    def row(self, manga_id: int) -> int | None:
+        return self._rows.get(manga_id)
+
+    def add_mangas(self, mangas: Iterable[Manga]) -> None:
+        # A manga is only ever shown once
+        mangas = [
+            copy(manga) for manga in dict.fromkeys(mangas) if manga.id not in self._rows
+        ]
+        if not mangas:
+            return
+
+        first = len(self._mangas)
+        self.beginInsertRows(QModelIndex(), first, first + len(mangas) - 1)
+        for i, manga in enumerate(mangas, first):
+            self._mangas.append(manga)
+            self._rows[manga.id] = i
+        self.endInsertRows()
+
+    def insert_manga(self, row: int, manga: Manga) -> None:
+        if manga.id in self._rows:
+            return
+
+        row = min(max(row, 0), len(self._mangas))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._mangas.insert(row, copy(manga))
+        self._update_rows(row)
+        self.endInsertRows()
+
+    def remove_manga(self, manga: Manga) -> None:
+        if (row := self._rows.pop(manga.id, None)) is None:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._mangas[row]
+        self._update_rows(row)
+        self.endRemoveRows()
+        self.thumbnails.remove(manga.id)
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._mangas.clear()
+        self._rows.clear()
+        self.thumbnails.clear()
+        self.endResetModel()
+
+    def _update_rows(self, start: int) -> None:
+        for i in range(start, len(self._mangas)):
+            self._rows[self._mangas[i].id] = i
+
+    def _manga_changed(self, manga: Manga) -> None:
+        if (row := self._rows.get(manga.id)) is None:
+            return
+
+        self._mangas[row] = copy(manga)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def _thumbnail_changed(self, manga: Manga) -> None:
+        if (row := self._rows.get(manga.id)) is None:
+            return
+
+        self._mangas[row] = copy(manga)
+        # Loaded again the next time its cell is painted
+        self.thumbnails.remove(manga.id)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [MangaRole.THUMBNAIL])
+
+    def _thumbnail_loaded(self, manga_id: int) -> None:
+        if (row := self._rows.get(manga_id)) is None:
+            return
+
+        index = self.index(row)
+        self.dataChanged.emit(
+            index, index, [MangaRole.THUMBNAIL, MangaRole.THUMBNAIL_FAILED]
+        )
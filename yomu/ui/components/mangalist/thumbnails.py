@@ -0,0 +1,212 @@
+from collections import OrderedDict
+from functools import partial
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import pyqtSignal, QObject, QUrl
+from PyQt6.QtGui import QImage, QPixmap
+
+from yomu.core.downloader import Downloader
+from yomu.core.imagepipeline import ImageSpec
+from yomu.core.models import Manga
+from yomu.core.network import Request, Response
+from yomu.core.storage import ThumbnailSize
+
+if TYPE_CHECKING:
+    from yomu.core.app import YomuApp
+
+logger = getLogger(__name__)
+
+
+class ThumbnailLoader(QObject):
+    """
+    Loads the covers of a manga grid when their cells are painted. Only the last `max_count`
+    covers used stay decoded, so memory depends on how many cells are on screen rather than
+    on the size of the list.
+    """
+
+    HEIGHT = 279
+    max_count = 256
+
+    # Emitted with the manga's id once its cover is loaded or failed to load
+    loaded = pyqtSignal(int)
+    # Whether any cover is being loaded
+    busy_changed = pyqtSignal(bool)
+
+    def __init__(self, parent: QObject, app: YomuApp) -> None:
+        super().__init__(parent)
+        self.app = app
+        self._pixmaps: OrderedDict[int, QPixmap] = OrderedDict()
+        self._failed: set[int] = set()
+        # Deleting a load's owner aborts its request and decoding
+        self._loads: dict[int, QObject] = {}
+
+    @property
+    def loading(self) -> list[int]:
+        return list(self._loads)
+
+    def is_loading(self, manga: Manga) -> bool:
+        return manga.id in self._loads
+
+    def has_failed(self, manga: Manga) -> bool:
+        return manga.id in self._failed
+
+    def get(self, manga: Manga) -> QPixmap | None:
+        """
+        Returns the manga's cover, starting to load it if it isn't loaded yet
+
+        Parameters
+        ----------
+        manga : Manga
+            The manga
+
+        Returns
+        -------
+        QPixmap | None
+            The cover or None if it's still loading or failed to load
+        """
+        pixmap = self._pixmaps.get(manga.id)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(manga.id)
+        elif manga.id not in self._loads and manga.id not in self._failed:
+            self.load(manga)
+        return pixmap
+
+    def load(
+        self,
+        manga: Manga,
+        priority: Request.Priority = Request.Priority.NormalPriority,
+        *,
+        force_network: bool = False,
+    ) -> None:
+        self.cancel(manga.id)
+        self._failed.discard(manga.id)
+        if not manga.thumbnail:
+            return self._fail(manga)
+
+        network = self.app.network
+        path = (
+            Downloader.resolve_thumbnail_path(manga, ThumbnailSize.GRID)
+            if not force_network and manga.library
+            else None
+        )
+        if path is not None:
+            request = Request(QUrl.fromLocalFile(path))
+        else:
+            if not network.is_online:
+                return self._fail(manga)
+
+            try:
+                request = manga.get_thumbnail()
+            except Exception:
+                return self._fail(manga)
+
+        request.setPriority(priority)
+        request.setAttribute(
+            Request.Attribute.CacheLoadControlAttribute,
+            Request.CacheLoadControl.PreferCache,
+        )
+
+        owner = QObject(self)
+        response = network.handle_request(request)
+        response.finished.connect(
+            partial(self._received, manga, owner, response, path is not None)
+        )
+        owner.destroyed.connect(response.abort)
+
+        was_busy = bool(self._loads)
+        self._loads[manga.id] = owner
+        if not was_busy:
+            self.busy_changed.emit(True)
+
+    def cancel(self, manga_id: int) -> None:
+        if (owner := self._loads.pop(manga_id, None)) is None:
+            return
+
+        owner.deleteLater()
+        if not self._loads:
+            self.busy_changed.emit(False)
+
+    def cancel_except(self, manga_ids: set[int]) -> None:
+        """Stops loading the covers of every manga but the ones given"""
+        for manga_id in [key for key in self._loads if key not in manga_ids]:
+            self.cancel(manga_id)
+
+    def remove(self, manga_id: int) -> None:
+        self.cancel(manga_id)
+        self._pixmaps.pop(manga_id, None)
+        self._failed.discard(manga_id)
+
+    def clear(self) -> None:
+        for manga_id in list(self._loads):
+            self.cancel(manga_id)
+        self._pixmaps.clear()
+        self._failed.clear()
+
+    def _is_current(self, manga: Manga, owner: QObject) -> bool:
+        return self._loads.get(manga.id) is owner
+
+    def _received(
+        self, manga: Manga, owner: QObject, response: Response, from_disk: bool
+    ) -> None:
+        if not self._is_current(manga, owner):
+            return
+
+        error = response.error()
+        if error == Response.Error.NoError:
+            if from_disk:
+                data = response.read_all()
+            else:
+                try:
+                    data = manga.source.parse_thumbnail(
+                        response, manga.to_source_manga()
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to parse thumbnail for {manga.source.name}", exc_info=e
+                    )
+                    return self._fail(manga)
+
+            task = self.app.image_pipeline.process(
+                data, ImageSpec(height=ThumbnailLoader.HEIGHT), owner
+            )
+            task.finished.connect(partial(self._image_loaded, manga, owner))
+            task.failed.connect(partial(self._image_failed, manga, owner, from_disk))
+            return
+
+        if from_disk:
+            return self.load(manga, response.priority, force_network=True)
+
+        try:
+            manga.source.thumbnail_request_error(response, manga.to_source_manga())
+        except Exception as e:
+            logger.error(
+                f"Error occured while letting {manga.source.name} handle thumbnail request error",
+                exc_info=e,
+            )
+        self._fail(manga)
+
+    def _image_loaded(
+        self, manga: Manga, owner: QObject, image: QImage, _: bytes
+    ) -> None:
+        if not self._is_current(manga, owner):
+            return
+
+        self.cancel(manga.id)
+        self._pixmaps[manga.id] = QPixmap.fromImage(image)
+        while len(self._pixmaps) > self.max_count:
+            self._pixmaps.popitem(last=False)
+        self.loaded.emit(manga.id)
+
+    def _image_failed(self, manga: Manga, owner: QObject, from_disk: bool) -> None:
+        if not self._is_current(manga, owner):
+            return
+
+        if from_disk:
+            return self.load(manga, force_network=True)
+        self._fail(manga)
+
+    def _fail(self, manga: Manga) -> None:
+        self.cancel(manga.id)
+        self._failed.add(manga.id)
+        self.loaded.emit(manga.id)
@@ -4,13 +4,15 @@ from logging import getLogger
 from typing import Callable, TYPE_CHECKING
 
 from PyQt6.QtCore import pyqtSignal, QMimeData, Qt, QUrl
-from PyQt6.QtGui import QDrag, QPixmap, QMovie, QMouseEvent
+from PyQt6.QtGui import QDrag, QImage, QPixmap, QMovie, QMouseEvent
 from PyQt6.QtNetwork import QNetworkRequest
 from PyQt6.QtWidgets import QLabel, QWidget
 
 from yomu.core.downloader import Downloader
+from yomu.core.imagepipeline import ImageSpec
 from yomu.core.models import Manga
 from yomu.core.network import Request, Response
+from yomu.core.storage import ThumbnailSize
 from yomu.core import utils
 
 if TYPE_CHECKING:
@@ -31,11 +33,17 @@ class ThumbnailWidget(QLabel):
     _cancel_request = pyqtSignal()
     Status = LoadingStatus
 
-    def __init__(self, parent: QWidget) -> None:
+    def __init__(
+        self, parent: QWidget, variant: ThumbnailSize = ThumbnailSize.GRID
+    ) -> None:
         super().__init__(parent)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.status = LoadingStatus.NULL
         self.priority = QNetworkRequest.Priority.NormalPriority
+        self.variant = variant
+        # the encoded image is kept for the large variant so it can
+        # be shown full size without fetching it again
+        self.data: bytes | None = None
 
     parent: Callable[[], Parent]
     window: Callable[[], ReaderWindow]
@@ -72,9 +80,13 @@ class ThumbnailWidget(QLabel):
 
         window = self.window()
         network = window.network
-        path = Downloader.resolve_path(self.manga)
-        if not force_network and self.manga.library and os.path.exists(path):
-            request = Request(QUrl.fromLocalFile(os.path.join(path, "thumbnail.png")))
+        path = (
+            Downloader.resolve_thumbnail_path(self.manga, self.variant)
+            if not force_network and self.manga.library
+            else None
+        )
+        if path is not None:
+            request = Request(QUrl.fromLocalFile(path))
             self.status = LoadingStatus.CACHE
         else:
             if not network.is_online:
@@ -126,20 +138,27 @@ class ThumbnailWidget(QLabel):
             return self.setText("Failed to load image")
 
     def _load_image(self, data: bytes) -> None:
-        thumbnail = QPixmap()
-        if not thumbnail.loadFromData(data):
-            if self.status == LoadingStatus.CACHE:
-                return self.fetch_thumbnail(force_network=True)
-            self.status = LoadingStatus.NULL
-            return self.setText("Failed to load image")
+        if self.variant == ThumbnailSize.LARGE:
+            self.data = data
 
-        self.setPixmap(
-            thumbnail.scaledToHeight(
-                self.height(), Qt.TransformationMode.SmoothTransformation
-            )
+        task = self.window().app.image_pipeline.process(
+            data, ImageSpec(height=self.height()), self
         )
+        task.finished.connect(self._image_loaded)
+        task.failed.connect(self._image_failed)
+        self._cancel_request.connect(task.cancel)
+
+    def _image_loaded(self, image: QImage, _: bytes) -> None:
+        self.setPixmap(QPixmap.fromImage(image))
         self.status = LoadingStatus.LOADED
 
+    def _image_failed(self) -> None:
+        if self.status == LoadingStatus.CACHE:
+            return self.fetch_thumbnail(force_network=True)
+        self.status = LoadingStatus.NULL
+        self.setText("Failed to load image")
+
     def clear(self):
         super().clear()
+        self.data = None
         self._cancel_request.emit()
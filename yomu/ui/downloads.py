@@ -1,96 +1,256 @@
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Callable, TYPE_CHECKING
 
-from PyQt6.QtCore import QEvent, QObject, Qt
-from PyQt6.QtGui import QMouseEvent, QResizeEvent
-from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QMenu
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QObject, QSize, Qt, QTimer
+from PyQt6.QtGui import QContextMenuEvent, QFont, QMouseEvent, QPainter, QPalette
+from PyQt6.QtWidgets import (
+    QFrame,
+    QListView,
+    QMenu,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+)
 
 from yomu.core.models import Chapter
-from yomu.ui.components.cardlist import BaseCardItem, CardList
 from .stack import StackWidgetMixin
 
 if TYPE_CHECKING:
     from yomu.ui import ReaderWindow
 
 
-class DownloadItem(BaseCardItem):
-    def __init__(self, parent: Downloads, chapter: Chapter) -> None:
+class DownloadRole(IntEnum):
+    CHAPTER = Qt.ItemDataRole.UserRole
+    PROGRESS = Qt.ItemDataRole.UserRole + 1
+    PAUSED = Qt.ItemDataRole.UserRole + 2
+
+
+@dataclass(slots=True)
+class DownloadEntry:
+    chapter: Chapter
+    title: str
+    page: int = -1
+    total: int = 0
+    paused: bool = False
+
+
+class DownloadsModel(QAbstractListModel):
+    # Progress updates arrive once per page for every running download, so they're
+    # buffered and applied together instead of repainting on each one
+    UPDATE_INTERVAL = 100
+
+    def __init__(self, parent: QObject) -> None:
         super().__init__(parent)
-        self.installEventFilter(parent)
-        self.setFixedHeight(60)
-        self.chapter = chapter
+        self._entries: list[DownloadEntry] = []
+        self._rows: dict[int, int] = {}
+        self._pending: dict[int, tuple[int, int]] = {}
 
-        self.title_widget = QLabel(f"{chapter.manga.title} - {chapter.title}", self)
-        self.title_widget.setObjectName("Title")
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_INTERVAL)
+        self._update_timer.timeout.connect(self._apply_updates)
 
-        self.pages_widget = QLabel(self)
-        self.pages_widget.setObjectName("Pages")
-        self.pages_widget.setText("(0/0)")
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
 
-        self.progress_bar = QFrame(self)
-        self.progress_bar.setFixedSize(3, 2)
-        self.progress_bar.move(2, self.height() - 2)
-        self.progress_bar.hide()
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
 
-        layout = QHBoxLayout(self)
-        layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        layout.addWidget(self.title_widget)
-        layout.addWidget(self.pages_widget)
-        self.setLayout(layout)
+        entry = self._entries[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return entry.title
+        if role == DownloadRole.CHAPTER:
+            return entry.chapter
+        if role == DownloadRole.PROGRESS:
+            return entry.page, entry.total
+        if role == DownloadRole.PAUSED:
+            return entry.paused
+        return None
 
-    def resizeEvent(self, a0: QResizeEvent | None) -> None:
-        super().resizeEvent(a0)
+    def add_chapter(self, chapter: Chapter) -> None:
+        if (row := self._rows.get(chapter.id)) is not None:
+            # Resumed after being paused
+            entry = self._entries[row]
+            entry.paused = False
+            index = self.index(row)
+            return self.dataChanged.emit(index, index, [DownloadRole.PAUSED])
 
-        current_size = round(
-            self.progress_bar.width() * a0.size().width() / a0.oldSize().width()
+        row = len(self._entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._entries.append(
+            DownloadEntry(chapter, f"{chapter.manga.title} - {chapter.title}")
         )
-        self.progress_bar.setFixedWidth(max(current_size, 3))
+        self._rows[chapter.id] = row
+        self.endInsertRows()
+
+    def update_chapter(self, chapter: Chapter, page: int, total: int) -> None:
+        if chapter.id not in self._rows:
+            return
+
+        self._pending[chapter.id] = (page, total)
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def pause_chapter(self, chapter: Chapter) -> None:
+        if (row := self._rows.get(chapter.id)) is None:
+            return
+
+        self._entries[row].paused = True
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [DownloadRole.PAUSED])
+
+    def remove_chapter(self, chapter: Chapter) -> None:
+        self._pending.pop(chapter.id, None)
+        if (row := self._rows.pop(chapter.id, None)) is None:
+            return
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._entries[row]
+        for i in range(row, len(self._entries)):
+            self._rows[self._entries[i].chapter.id] = i
+        self.endRemoveRows()
+
+    def _apply_updates(self) -> None:
+        first, last = len(self._entries), -1
+        for chapter_id, (page, total) in self._pending.items():
+            if (row := self._rows.get(chapter_id)) is None:
+                continue
+
+            entry = self._entries[row]
+            entry.page, entry.total, entry.paused = page, total, False
+            first, last = min(first, row), max(last, row)
+        self._pending.clear()
+
+        if last >= 0:
+            self.dataChanged.emit(
+                self.index(first),
+                self.index(last),
+                [DownloadRole.PROGRESS, DownloadRole.PAUSED],
+            )
 
-    def download_update(self, page: int, total: int) -> None:
-        self.pages_widget.setText(f"({page + 1}/{total})")
-        self.progress_bar.setFixedWidth(round(self.width() * (page + 1) / total))
-        self.progress_bar.show()
 
+class DownloadDelegate(QStyledItemDelegate):
+    HEIGHT = 60
+    MARGIN = 10
+    TITLE_SIZE = 25
+    PROGRESS_HEIGHT = 2
 
-class Downloads(CardList[DownloadItem], StackWidgetMixin):
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), self.HEIGHT)
+
+    def paint(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex
+    ) -> None:
+        widget = option.widget
+        style = widget.style()
+        style.drawPrimitive(
+            QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, widget
+        )
+
+        page, total = index.data(DownloadRole.PROGRESS)
+        if index.data(DownloadRole.PAUSED):
+            pages = "(Paused)"
+        elif total:
+            pages = f"({page + 1}/{total})"
+        else:
+            pages = "(0/0)"
+
+        painter.save()
+        rect = option.rect.adjusted(self.MARGIN, 0, -self.MARGIN, 0)
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+
+        font = QFont(option.font)
+        font.setBold(True)
+        painter.setFont(font)
+        pages_width = painter.fontMetrics().horizontalAdvance(pages)
+
+        title_font = QFont(font)
+        title_font.setPixelSize(self.TITLE_SIZE)
+        painter.setFont(title_font)
+        title = painter.fontMetrics().elidedText(
+            index.data(),
+            Qt.TextElideMode.ElideRight,
+            rect.width() - pages_width - self.MARGIN,
+        )
+        title_width = painter.fontMetrics().horizontalAdvance(title)
+        painter.drawText(
+            rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, title
+        )
+
+        painter.setFont(font)
+        painter.drawText(
+            rect.adjusted(title_width + self.MARGIN, 0, 0, 0),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            pages,
+        )
+
+        if total:
+            painter.fillRect(
+                option.rect.x() + 2,
+                option.rect.bottom() - self.PROGRESS_HEIGHT + 1,
+                max(round((option.rect.width() - 4) * (page + 1) / total), 3),
+                self.PROGRESS_HEIGHT,
+                option.palette.color(QPalette.ColorRole.Highlight),
+            )
+        painter.restore()
+
+
+class Downloads(QListView, StackWidgetMixin):
     def __init__(self, window: ReaderWindow) -> None:
         super().__init__(window)
         self.downloader = window.app.downloader
 
+        # Only the rows in view get painted, so a long queue costs nothing until it's scrolled to
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setFocusPolicy(Qt.FocusPolicy.ClickFocus)
+        self.setUniformItemSizes(True)
+        self.setSpacing(5)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+
+        self.downloads_model = DownloadsModel(self)
+        self.setModel(self.downloads_model)
+        self.setItemDelegate(DownloadDelegate(self))
+
         self.downloader.download_started.connect(self.add_chapter)
         self.downloader.download_update.connect(self.update_chapter)
+        self.downloader.download_paused.connect(self.pause_chapter)
         self.downloader.download_finished.connect(self.remove_chapter)
         self.downloader.download_failed.connect(self.remove_chapter)
 
-        self.layout().setSpacing(10)
+    window: Callable[[], ReaderWindow]
 
-    def eventFilter(self, a0: QObject | None, a1: QEvent | None) -> bool:
-        if isinstance(a0, DownloadItem) and a1.type() == QEvent.Type.ContextMenu:
-            menu = QMenu(self)
-            menu.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-            action = menu.addAction("Cancel")
-            if menu.exec(a1.globalPos()) == action:
-                self.downloader.cancel_chapter(a0.chapter)
-            return True
+    def contextMenuEvent(self, e: QContextMenuEvent | None) -> None:
+        index = self.indexAt(e.pos())
+        if not index.isValid():
+            return super().contextMenuEvent(e)
 
-        return super().eventFilter(a0, a1)
+        menu = QMenu(self)
+        menu.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        action = menu.addAction("Cancel")
+        if menu.exec(e.globalPos()) == action:
+            self.downloader.cancel_chapter(index.data(DownloadRole.CHAPTER))
 
-    def mousePressEvent(self, a0: QMouseEvent) -> None:
-        if a0.button() == Qt.MouseButton.BackButton:
-            a0.ignore()
-        return super().mousePressEvent(a0)
+    def mousePressEvent(self, e: QMouseEvent | None) -> None:
+        if e.button() == Qt.MouseButton.BackButton:
+            return e.ignore()
+        return super().mousePressEvent(e)
 
     def add_chapter(self, chapter: Chapter) -> None:
-        self.add_card(DownloadItem(self, chapter))
+        self.downloads_model.add_chapter(chapter)
 
     def update_chapter(self, chapter: Chapter, page: int, total: int) -> None:
-        for widget in self:
-            if widget.chapter == chapter:
-                return widget.download_update(page, total)
+        self.downloads_model.update_chapter(chapter, page, total)
+
+    def pause_chapter(self, chapter: Chapter) -> None:
+        self.downloads_model.pause_chapter(chapter)
 
     def remove_chapter(self, chapter: Chapter) -> None:
-        for widget in self:
-            if widget.chapter == chapter:
-                return widget.deleteLater()
+        self.downloads_model.remove_chapter(chapter)
 
     def set_current_widget(self) -> None:
         super().set_current_widget()
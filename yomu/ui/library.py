@@ -1,6 +1,7 @@
 from typing import Callable, TYPE_CHECKING
 
 from PyQt6.QtCore import QEvent, QObject, Qt
+from PyQt6.QtGui import QContextMenuEvent
 from PyQt6.QtNetwork import QNetworkRequest
 from PyQt6.QtWidgets import (
     QInputDialog,
@@ -14,7 +15,7 @@ from PyQt6.QtWidgets import (
 from yomu.core.models import Category, Manga
 from yomu.core import utils as core_utils
 
-from .components.mangalist import MangaList, MangaView
+from .components.mangalist import MangaList
 from .stack import StackWidgetMixin
 
 if TYPE_CHECKING:
@@ -27,6 +28,7 @@ class Library(QWidget, StackWidgetMixin):
         super().__init__(window)
         self._manga_list = MangaList(self, window.app)
         self._manga_list.installEventFilter(self)
+        self._manga_list.viewport().installEventFilter(self)
 
         self.sql = window.app.sql
         self.current_source: Source | None = None
@@ -49,11 +51,8 @@ class Library(QWidget, StackWidgetMixin):
         window.app.category_manga_added.connect(self._category_manga_added)
         window.app.category_manga_removed.connect(self._category_manga_removed)
 
-        library = self.sql.get_library()
-        for manga in library:
-            view = self._manga_list.add_manga(manga)
-            view.installEventFilter(self)
-            view.fetch_thumbnail()
+        # Covers are only loaded once their cards are scrolled into view
+        self._manga_list.add_mangas(self.sql.get_library())
 
         self._categories = {
             category.name: category for category in self.sql.get_categories()
@@ -73,8 +72,12 @@ class Library(QWidget, StackWidgetMixin):
     window: Callable[[], ReaderWindow]
 
     def eventFilter(self, a0: QObject, a1: QEvent) -> bool:
-        if isinstance(a0, MangaView):
-            return self.mangaViewEvent(a0, a1)
+        if (
+            a0 == self._manga_list.viewport()
+            and a1.type() == QEvent.Type.ContextMenu
+            and (manga := self._manga_list.manga_at(a1.pos())) is not None
+        ):
+            return self.mangaContextMenuEvent(manga, a1)
         if a0 == self._manga_list and a1.type() == QEvent.Type.ContextMenu:
             menu = QMenu(self)
             menu.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
@@ -126,68 +129,62 @@ class Library(QWidget, StackWidgetMixin):
                     self.tab_bar.setCursor(Qt.CursorShape.ArrowCursor)
         return super().eventFilter(a0, a1)
 
-    def mangaViewEvent(self, view: MangaView, event: QEvent) -> bool:
-        if event.type() == QEvent.Type.ContextMenu:
-            menu = QMenu(self)
-            menu.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
-
-            remove_from_library = menu.addAction("Remove From Library")
-            category_menu = menu.addMenu("Add to Category")
-
-            current_index = self.tab_bar.currentIndex()
-            keys = self._categories.keys()
-            if len(keys) > 0:
-                for name in keys:
-                    _ = category_menu.addAction(name)
-                    if current_index:
-                        _.setVisible(False)
-            else:
-                category_menu.menuAction().setVisible(False)
-
-            remove_manga_from_category = menu.addAction("Remove From Category")
-            if current_index:
-                category_menu.menuAction().setVisible(False)
-            else:
-                remove_manga_from_category.setVisible(False)
-
-            triggered = menu.exec(event.globalPos())
-            if triggered == remove_from_library:
-                self.sql.set_library(view.manga, library=False)
-            elif triggered in category_menu.actions():
-                self.sql.add_manga_to_category(
-                    view.manga, self._categories.get(triggered.text())
-                )
-            elif triggered == remove_manga_from_category:
-                category = self._categories.get(
-                    self.tab_bar.tabText(self.tab_bar.currentIndex())
-                )
-                self.sql.remove_manga_from_category(view.manga, category)
-            return True
-        return False
+    def mangaContextMenuEvent(self, manga: Manga, event: QContextMenuEvent) -> bool:
+        menu = QMenu(self)
+        menu.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+        remove_from_library = menu.addAction("Remove From Library")
+        category_menu = menu.addMenu("Add to Category")
+
+        current_index = self.tab_bar.currentIndex()
+        keys = self._categories.keys()
+        if len(keys) > 0:
+            for name in keys:
+                _ = category_menu.addAction(name)
+                if current_index:
+                    _.setVisible(False)
+        else:
+            category_menu.menuAction().setVisible(False)
+
+        remove_manga_from_category = menu.addAction("Remove From Category")
+        if current_index:
+            category_menu.menuAction().setVisible(False)
+        else:
+            remove_manga_from_category.setVisible(False)
+
+        triggered = menu.exec(event.globalPos())
+        if triggered == remove_from_library:
+            self.sql.set_library(manga, library=False)
+        elif triggered in category_menu.actions():
+            self.sql.add_manga_to_category(
+                manga, self._categories.get(triggered.text())
+            )
+        elif triggered == remove_manga_from_category:
+            category = self._categories.get(
+                self.tab_bar.tabText(self.tab_bar.currentIndex())
+            )
+            self.sql.remove_manga_from_category(manga, category)
+        return True
 
     def _refresh_button_clicked(self) -> None:
         self.update_all_manga()
 
     def _library_status_changed(self, manga: Manga) -> None:
-        if manga.library:
-            for i in range(self._manga_list.count()):
-                manga_view = self.manga_view_at(i)
-                if manga_view is not None and manga_view.manga.id > manga.id:
-                    view = self._manga_list.insert_manga(i, manga)
-                    break
-            else:
-                view = self._manga_list.add_manga(manga)
-
-            view.thumbnail_widget.priority = QNetworkRequest.Priority.HighPriority
-            view.installEventFilter(self)
-            if self.current_source and self.current_source != manga.source:
-                view.hide()
-            return view.fetch_thumbnail()
-
-        for i in range(self._manga_list.count()):
-            view = self.manga_view_at(i)
-            if view is not None and view.manga == manga:
-                return view.deleteLater()
+        if not manga.library:
+            return self._manga_list.remove_manga(manga)
+
+        mangas = self._manga_list.manga_model.mangas
+        row = next(
+            (
+                i
+                for i, library_manga in enumerate(mangas)
+                if library_manga.id > manga.id
+            ),
+            len(mangas),
+        )
+        self._manga_list.insert_manga(row, manga)
+        if self.current_source and self.current_source != manga.source:
+            self._manga_list.set_manga_hidden(manga, True)
 
     def _category_created(self, category: Category):
         self._categories[category.name] = category
@@ -207,42 +204,28 @@ class Library(QWidget, StackWidgetMixin):
 
     def _category_manga_added(self, category: Category, manga: Manga) -> None:
         if self.tab_bar.tabText(self.tab_bar.currentIndex()) == category.name:
-            for i in range(self._manga_list.count()):
-                view = self.manga_view_at(i)
-                if view is not None and view.manga == manga:
-                    return view.show()
+            self._manga_list.set_manga_hidden(manga, False)
 
     def _category_manga_removed(self, category: Category, manga: Manga) -> None:
         if self.tab_bar.tabText(self.tab_bar.currentIndex()) == category.name:
-            for i in range(self._manga_list.count()):
-                view = self.manga_view_at(i)
-                if view is not None and view.manga == manga:
-                    return view.hide()
+            self._manga_list.set_manga_hidden(manga, True)
 
     def _tab_changed(self, index: int) -> None:
         if index == 0:
             for i in range(self._manga_list.count()):
-                if (view := self.manga_view_at(i)) is not None:
-                    view.show()
+                self._manga_list.setRowHidden(i, False)
             return None
 
         category = self._categories[self.tab_bar.tabText(index)]
-        mangas = self.sql.get_category_mangas(category)
-        for i in range(self._manga_list.count()):
-            view = self.manga_view_at(i)
-            if view is not None:
-                view.setVisible(view.manga in mangas)
+        mangas = set(self.sql.get_category_mangas(category))
+        for i, manga in enumerate(self._manga_list.manga_model.mangas):
+            self._manga_list.setRowHidden(i, manga not in mangas)
 
     def _set_keybinds(self, keybinds: dict[str, core_utils.Keybind]) -> None:
         for action in self.actions():
             data = keybinds.get(action.text(), {"keybinds": []})
             action.setShortcuts(data["keybinds"] if data is not None else [])
 
-    def manga_view_at(
-        self, index: int, include_hidden: bool = True
-    ) -> MangaView | None:
-        return self._manga_list.manga_view_at(index, include_hidden=include_hidden)
-
     def add_category(self) -> None:
         name, ok = QInputDialog.getText(
             self, "Category", "Category Name:", QLineEdit.EchoMode.Normal, ""
@@ -254,22 +237,19 @@ class Library(QWidget, StackWidgetMixin):
 
     def set_source(self, source: Source | None) -> None:
         show_all = source is None
-        for i in range(self._manga_list.count()):
-            if (view := self.manga_view_at(i)) is not None:
-                view.setVisible(show_all or view.manga.source == source)
+        for i, manga in enumerate(self._manga_list.manga_model.mangas):
+            self._manga_list.setRowHidden(i, not show_all and manga.source != source)
         self.current_source = source
 
     def update_all_manga(self) -> None:
         updater = self.window().app.updater
-        for i in range(self._manga_list.count()):
-            if (view := self.manga_view_at(i)) is not None:
-                manga = view.manga
-                updater.update_manga_details(
-                    manga, priority=QNetworkRequest.Priority.LowPriority
-                )
-                updater.update_manga_chapters(
-                    manga, priority=QNetworkRequest.Priority.LowPriority
-                )
+        for manga in self._manga_list.manga_model.mangas:
+            updater.update_manga_details(
+                manga, priority=QNetworkRequest.Priority.LowPriority
+            )
+            updater.update_manga_chapters(
+                manga, priority=QNetworkRequest.Priority.LowPriority
+            )
 
     def set_current_widget(self) -> None:
         super().set_current_widget()
@@ -1,18 +1,29 @@
 import os
 from datetime import datetime
-from typing import TYPE_CHECKING
-
-from PyQt6.QtCore import QEvent, Qt, pyqtSignal
-from PyQt6.QtGui import QContextMenuEvent, QMovie, QPixmap
+from enum import IntEnum
+from typing import Callable, TYPE_CHECKING
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QObject, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import (
+    QColor,
+    QContextMenuEvent,
+    QKeyEvent,
+    QMouseEvent,
+    QMovie,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QResizeEvent,
+)
 from PyQt6.QtWidgets import (
-    QHBoxLayout,
     QLabel,
+    QListView,
     QMenu,
-    QSizePolicy,
-    QVBoxLayout,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QWidget,
 )
-from yomu.ui.components.cardlist import BaseCardItem, CardList, CardSelector
 
 from yomu.core import utils
 from yomu.core.models import Chapter
@@ -21,165 +32,237 @@ if TYPE_CHECKING:
     from yomu.core.app import YomuApp
 
 
-class ChapterListItem(BaseCardItem):
-    def __init__(self, parent: ChapterList, chapter: Chapter) -> None:
+class ChapterRole(IntEnum):
+    CHAPTER = Qt.ItemDataRole.UserRole
+    UPLOADED = Qt.ItemDataRole.UserRole + 1
+    READ = Qt.ItemDataRole.UserRole + 2
+    DOWNLOADED = Qt.ItemDataRole.UserRole + 3
+    SELECTED = Qt.ItemDataRole.UserRole + 4
+
+
+class ChapterModel(QAbstractListModel):
+    def __init__(self, parent: QObject) -> None:
         super().__init__(parent)
-        self.installEventFilter(parent)
-        self.setAttribute(Qt.WidgetAttribute.WA_Hover)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.chapter = chapter
-        self.selected = False
-
-        self.setProperty("selected", False)
-        self.setProperty("read", chapter.read)
-
-        self.setContextMenuPolicy(Qt.ContextMenuPolicy.DefaultContextMenu)
-        self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
-
-        self.title_widget = QLabel(chapter.title, self)
-        self.title_widget.setObjectName("Title")
-
-        self.timestamp_widget = QLabel(
-            chapter.uploaded.strftime("%m/%d/%y")
-            if chapter.uploaded is not None
-            else datetime.now().strftime("%m/%d/%y"),
-            self,
-        )
-        self.timestamp_widget.setObjectName("Timestamp")
+        # Every column is ordered by chapter number, rows are flipped on top of that
+        self._chapters: list[Chapter] = []
+        self._titles: list[str] = []
+        self._uploaded: list[str] = []
+        self._read: list[bool] = []
+        self._downloaded: list[bool] = []
+        # The position of every chapter in the columns by id
+        self._positions: dict[int, int] = {}
+        self._selected: set[int] = set()
+        self._descending = True
 
-        self.downloaded_icon = QLabel(self)
-        self.downloaded_icon.setPixmap(
-            QPixmap(os.path.join(utils.resource_path(), "icons", "check.svg")).scaled(
-                20, 20, transformMode=Qt.TransformationMode.SmoothTransformation
-            )
-        )
-        if not chapter.downloaded:
-            self.downloaded_icon.hide()
-
-        vLayout = QVBoxLayout()
-        vLayout.addWidget(self.title_widget)
-        vLayout.addWidget(self.timestamp_widget)
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        layout.addLayout(vLayout)
-        layout.addWidget(self.downloaded_icon, alignment=Qt.AlignmentFlag.AlignRight)
-        self.setLayout(layout)
-
-    def event(self, e: QEvent) -> bool:
-        if e.type() == QEvent.Type.DynamicPropertyChange:
-            style = self.style()
-            for child in self.findChildren(QWidget):
-                style.polish(child)
-            style.polish(self)
-        return super().event(e)
-
-    def mark_as_read(self, read: bool) -> None:
-        self.chapter.read = read
-        self.setProperty("read", read)
-
-    def mark_as_downloaded(self, downloaded: bool) -> None:
-        self.chapter.downloaded = downloaded
-        self.downloaded_icon.show() if downloaded else self.downloaded_icon.hide()
-
-    def set_selected(self, selected: bool) -> None:
-        self.selected = selected
-        self.setProperty("selected", selected)
-
-
-class ChapterSelector(CardSelector["ChapterList"]):
-    def __init__(self, chapter_list: ChapterList) -> None:
-        super().__init__(chapter_list)
-        self.selected_chapters: set[ChapterListItem] = set()
+    @property
+    def chapters(self) -> list[Chapter]:
+        return self._chapters
 
     @property
-    def chapter_list(self) -> ChapterList:
-        return self.card_list
+    def descending(self) -> bool:
+        return self._descending
 
-    def eventFilter(self, chapterlist: ChapterList, a1: QEvent) -> bool:
-        if (
-            a1.type() != QEvent.Type.MouseButtonRelease
-            or a1.button() != Qt.MouseButton.LeftButton
-        ):
-            return super().eventFilter(chapterlist, a1)
+    @property
+    def selected_chapters(self) -> list[Chapter]:
+        return sorted(
+            (
+                self._chapters[self._positions[chapter_id]]
+                for chapter_id in self._selected
+            ),
+            key=lambda chapter: chapter.number,
+        )
 
-        pos = chapterlist.cursor().pos()
-        for item in filter(lambda item: isinstance(item, ChapterListItem), chapterlist):
-            if item.rect().contains(item.mapFromGlobal(pos)):
-                break
-        else:
-            return super().eventFilter(chapterlist, a1)
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._chapters)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        position = self.position(index.row())
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self._titles[position]
+        if role == ChapterRole.CHAPTER:
+            return self._chapters[position]
+        if role == ChapterRole.UPLOADED:
+            return self._uploaded[position]
+        if role == ChapterRole.READ:
+            return self._read[position]
+        if role == ChapterRole.DOWNLOADED:
+            return self._downloaded[position]
+        if role == ChapterRole.SELECTED:
+            return self._chapters[position].id in self._selected
+        return None
+
+    def position(self, row: int) -> int:
+        """The position of a row's chapter in `chapters`"""
+        return len(self._chapters) - 1 - row if self._descending else row
+
+    def row(self, chapter_id: int) -> int | None:
+        if (position := self._positions.get(chapter_id)) is None:
+            return None
+        return self.position(position)
+
+    def set_chapters(self, chapters: list[Chapter]) -> None:
+        chapters = sorted(chapters, key=lambda chapter: chapter.number)
+        now = datetime.now().strftime("%m/%d/%y")
 
-        modifiers = a1.modifiers()
-        if modifiers == Qt.KeyboardModifier.ControlModifier:
-            self.handle_ctrl_select(item)
-        elif modifiers == Qt.KeyboardModifier.ShiftModifier:
-            if self.cursor != -1:
-                self.handle_shift_select(item)
-            else:
-                self.handle_ctrl_select(item)
-        elif (
-            modifiers
-            == Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier
-        ):
-            self.handle_ctrl_shift_select()
-        return False
+        self.beginResetModel()
+        self._chapters = chapters
+        self._titles = [chapter.title for chapter in chapters]
+        self._uploaded = [
+            (
+                chapter.uploaded.strftime("%m/%d/%y")
+                if chapter.uploaded is not None
+                else now
+            )
+            for chapter in chapters
+        ]
+        self._read = [chapter.read for chapter in chapters]
+        self._downloaded = [chapter.downloaded for chapter in chapters]
+        self._positions = {chapter.id: i for i, chapter in enumerate(chapters)}
+        self._selected.clear()
+        self.endResetModel()
+
+    def set_descending(self, descending: bool) -> None:
+        if descending == self._descending:
+            return
+
+        self.beginResetModel()
+        self._descending = descending
+        self.endResetModel()
+
+    def set_read(self, chapter: Chapter) -> None:
+        if (position := self._positions.get(chapter.id)) is None:
+            return
+
+        self._chapters[position].read = self._read[position] = chapter.read
+        self._changed(position, ChapterRole.READ)
+
+    def set_downloaded(self, chapter: Chapter) -> None:
+        if (position := self._positions.get(chapter.id)) is None:
+            return
+
+        self._chapters[position].downloaded = self._downloaded[position] = (
+            chapter.downloaded
+        )
+        self._changed(position, ChapterRole.DOWNLOADED)
 
-    def handle_ctrl_select(self, item: ChapterListItem) -> None:
-        self.select_chapter(item) if not item.selected else self.deselect_chapter(item)
-        self.cursor = self.chapter_list.layout().indexOf(item)
+    def is_selected(self, position: int) -> bool:
+        return self._chapters[position].id in self._selected
 
-    def handle_shift_select(self, item: ChapterListItem) -> None:
-        layout = self.chapter_list.layout()
-        index = layout.indexOf(item)
+    def set_selected(self, first: int, last: int, selected: bool) -> None:
+        """Selects or deselects the chapters between two positions, both included"""
+        first, last = min(first, last), max(first, last)
+        ids = (self._chapters[i].id for i in range(first, last + 1))
+        if selected:
+            self._selected.update(ids)
+        else:
+            self._selected.difference_update(ids)
 
-        iterator = (
-            range(index, self.cursor + 1)
-            if index < self.cursor
-            else range(self.cursor, index + 1)
+        rows = self.position(first), self.position(last)
+        self.dataChanged.emit(
+            self.index(min(rows)), self.index(max(rows)), [ChapterRole.SELECTED]
         )
 
-        func = self.select_chapter if not item.selected else self.deselect_chapter
+    def select_all(self, selected: bool) -> None:
+        if self._chapters:
+            self.set_selected(0, len(self._chapters) - 1, selected)
 
-        for i in iterator:
-            func(layout.itemAt(i).widget())
+    def selected_count(self) -> int:
+        return len(self._selected)
 
-        self.cursor = index
+    def clear_selection(self) -> None:
+        self.select_all(False)
 
-    def handle_ctrl_shift_select(self) -> None:
-        layout = self.chapter_list.layout()
-        func = (
-            self.select_chapter
-            if len(self.selected_chapters) != layout.count() - 1
-            else self.deselect_chapter
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._chapters = []
+        self._titles, self._uploaded = [], []
+        self._read, self._downloaded = [], []
+        self._positions.clear()
+        self._selected.clear()
+        self._descending = True
+        self.endResetModel()
+
+    def _changed(self, position: int, role: ChapterRole) -> None:
+        index = self.index(self.position(position))
+        self.dataChanged.emit(index, index, [role])
+
+
+class ChapterDelegate(QStyledItemDelegate):
+    PADDING = 5
+    LEFT_MARGIN = 7
+    RIGHT_MARGIN = 7
+    LINE_SPACING = 8
+    ICON_SIZE = 20
+    # Read chapters and upload dates are dimmed
+    DIMMED = QColor("#888888")
+
+    def __init__(self, parent: QObject) -> None:
+        super().__init__(parent)
+        self._downloaded_icon = QPixmap(
+            os.path.join(utils.resource_path(), "icons", "check.svg")
+        ).scaled(
+            self.ICON_SIZE,
+            self.ICON_SIZE,
+            transformMode=Qt.TransformationMode.SmoothTransformation,
         )
 
-        for i in range(1, layout.count()):
-            func(layout.itemAt(i).widget())
-
-        self.cursor = layout.count() - 1 if self.selected_chapters else -1
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(
+            option.rect.width(),
+            self.PADDING * 2 + self.LINE_SPACING + option.fontMetrics.height() * 2,
+        )
 
-    def select_chapter(self, item: ChapterListItem) -> None:
-        item.set_selected(True)
-        self.selected_chapters.add(item)
+    def paint(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex
+    ) -> None:
+        if index.data(ChapterRole.SELECTED):
+            option = QStyleOptionViewItem(option)
+            option.state |= QStyle.StateFlag.State_Selected
 
-    def deselect_chapter(self, item: ChapterListItem) -> None:
-        item.set_selected(False)
-        self.selected_chapters.discard(item)
+        widget = option.widget
+        widget.style().drawPrimitive(
+            QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, widget
+        )
 
-    def clear_selection(self, unselect: bool = False) -> None:
-        if unselect:
-            for chapter in self.selected_chapters:
-                chapter.set_selected(False)
-            return self.selected_chapters.clear()
+        painter.save()
+        rect = option.rect.adjusted(
+            self.LEFT_MARGIN, self.PADDING, -self.RIGHT_MARGIN, -self.PADDING
+        )
+        if index.data(ChapterRole.DOWNLOADED):
+            painter.drawPixmap(
+                rect.right() - self.ICON_SIZE + 1,
+                rect.center().y() - self.ICON_SIZE // 2,
+                self._downloaded_icon,
+            )
+            rect.setRight(rect.right() - self.ICON_SIZE - self.RIGHT_MARGIN)
+
+        metrics = option.fontMetrics
+        painter.setFont(option.font)
+        painter.setPen(
+            self.DIMMED
+            if index.data(ChapterRole.READ)
+            else option.palette.color(QPalette.ColorRole.Text)
+        )
+        title = rect.adjusted(0, 0, 0, -(metrics.height() + self.LINE_SPACING))
+        painter.drawText(
+            title,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+            metrics.elidedText(index.data(), Qt.TextElideMode.ElideRight, rect.width()),
+        )
 
-        self.selected_chapters.clear()
-        self.cursor = -1
+        painter.setPen(self.DIMMED)
+        painter.drawText(
+            rect,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom,
+            index.data(ChapterRole.UPLOADED),
+        )
+        painter.restore()
 
 
-class ChapterList(CardList[ChapterListItem, ChapterSelector]):
-    selector_cls = ChapterSelector
+class ChapterList(QListView):
     items_changed = pyqtSignal()
     item_clicked = pyqtSignal(int)
     _mark_as_read_request = pyqtSignal((list, bool))
@@ -187,27 +270,38 @@ class ChapterList(CardList[ChapterListItem, ChapterSelector]):
 
     def __init__(self, parent: QWidget, app: YomuApp) -> None:
         super().__init__(parent)
-        self.setWidgetResizable(True)
-        self.setContentsMargins(0, 0, 0, 0)
-        self._chapters = []
 
-        self.sql = app.sql
+        # Only the rows in view get painted, so a manga with thousands of chapters opens
+        # as quickly as one with a few. Chapters picked with Ctrl and Shift are kept by id
+        # in the model, the list's own selection is the row moved with the arrow keys
+        self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QListView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+
+        self.chapter_model = ChapterModel(self)
+        self.setModel(self.chapter_model)
+        self.setItemDelegate(ChapterDelegate(self))
 
-        widget = self.widget()
-        widget.setContentsMargins(0, 0, 0, 0)
-        widget.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
+        self.sql = app.sql
+        # The position of the chapter Shift selects from
+        self._anchor = -1
+        self._pressed: int | None = None
 
-        self.loading_icon = QLabel(self)
+        self.loading_icon = QLabel(self.viewport())
         self.loading_icon.setObjectName("Loading")
         self.loading_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        movie = QMovie(os.path.join(utils.resource_path(), "icons", "loading.gif"))
-        self.loading_icon.setMovie(movie)
-        movie.start()
-
-        layout = self.layout()
-        layout.addWidget(self.loading_icon)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
+        self.loading_icon.setMovie(
+            QMovie(
+                os.path.join(utils.resource_path(), "icons", "loading.gif"),
+                parent=self.loading_icon,
+            )
+        )
+        self.loading_icon.movie().start()
 
         app.chapter_read_status_changed.connect(
             self._chapter_read_updated, Qt.ConnectionType.QueuedConnection
@@ -216,31 +310,92 @@ class ChapterList(CardList[ChapterListItem, ChapterSelector]):
             self._chapter_downloaded_updated, Qt.ConnectionType.QueuedConnection
         )
 
+    itemDelegate: Callable[[], ChapterDelegate]
+
     @property
     def chapters(self) -> list[Chapter]:
-        return self._chapters
+        return self.chapter_model.chapters
 
-    def eventFilter(self, a0: QWidget, a1: QEvent):
-        if not isinstance(a0, ChapterListItem):
-            return super().eventFilter(a0, a1)
+    def resizeEvent(self, e: QResizeEvent) -> None:
+        super().resizeEvent(e)
+        self.loading_icon.setGeometry(self.viewport().rect())
 
-        event_type = a1.type()
-        if (
-            event_type == QEvent.Type.MouseButtonRelease
-            and a1.button() == Qt.MouseButton.LeftButton
-            and a1.modifiers() == Qt.KeyboardModifier.NoModifier
-        ):
-            self.item_clicked.emit(self.layout().indexOf(a0) - 1)
-        if event_type == QEvent.Type.ContextMenu:
-            self._handle_context_menu(a0, a1)
+    def _position_at(self, e: QMouseEvent) -> int | None:
+        index = self.indexAt(e.position().toPoint())
+        if not index.isValid():
+            return None
+        return self.chapter_model.position(index.row())
 
-        return super().eventFilter(a0, a1)
+    def mousePressEvent(self, e: QMouseEvent) -> None:
+        if e.button() == Qt.MouseButton.BackButton:
+            return e.ignore()
 
-    def _handle_context_menu(
-        self, item: ChapterListItem, event: QContextMenuEvent
-    ) -> None:
-        self.selector.select_chapter(item)
-        chapter = item.chapter
+        # Clicks are handled on release and don't move the keyboard cursor
+        self._pressed = (
+            self._position_at(e) if e.button() == Qt.MouseButton.LeftButton else None
+        )
+
+    def mouseDoubleClickEvent(self, e: QMouseEvent) -> None:
+        self.mousePressEvent(e)
+
+    def mouseMoveEvent(self, e: QMouseEvent) -> None:
+        self.viewport().setCursor(
+            Qt.CursorShape.PointingHandCursor
+            if self.indexAt(e.position().toPoint()).isValid()
+            else Qt.CursorShape.ArrowCursor
+        )
+        return super().mouseMoveEvent(e)
+
+    def mouseReleaseEvent(self, e: QMouseEvent) -> None:
+        pressed, self._pressed = self._pressed, None
+        if e.button() != Qt.MouseButton.LeftButton:
+            return super().mouseReleaseEvent(e)
+
+        position = self._position_at(e)
+        if position is None or position != pressed:
+            return
+
+        model = self.chapter_model
+        modifiers = e.modifiers()
+        if modifiers == Qt.KeyboardModifier.NoModifier:
+            self.item_clicked.emit(position)
+        elif modifiers == Qt.KeyboardModifier.ControlModifier or (
+            modifiers == Qt.KeyboardModifier.ShiftModifier and self._anchor == -1
+        ):
+            model.set_selected(position, position, not model.is_selected(position))
+            self._anchor = position
+        elif modifiers == Qt.KeyboardModifier.ShiftModifier:
+            model.set_selected(self._anchor, position, not model.is_selected(position))
+            self._anchor = position
+        elif (
+            modifiers
+            == Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier
+        ):
+            model.select_all(model.selected_count() != model.rowCount())
+            self._anchor = model.rowCount() - 1 if model.selected_count() else -1
+
+    def keyPressEvent(self, e: QKeyEvent) -> None:
+        key = e.key()
+        index = self.currentIndex()
+        if key in (Qt.Key.Key_Enter, Qt.Key.Key_Return):
+            if index.isValid() and self.selectionModel().isSelected(index):
+                self.item_clicked.emit(self.chapter_model.position(index.row()))
+            return
+
+        if key == Qt.Key.Key_Escape and index.isValid():
+            self.clearSelection()
+            return self.setCurrentIndex(QModelIndex())
+        return super().keyPressEvent(e)
+
+    def contextMenuEvent(self, e: QContextMenuEvent) -> None:
+        index = self.indexAt(e.pos())
+        if not index.isValid():
+            return super().contextMenuEvent(e)
+
+        model = self.chapter_model
+        position = model.position(index.row())
+        model.set_selected(position, position, True)
+        chapter: Chapter = index.data(ChapterRole.CHAPTER)
 
         menu = QMenu(self)
         menu.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
@@ -261,10 +416,10 @@ class ChapterList(CardList[ChapterListItem, ChapterSelector]):
         delete_ch = menu.addAction("Delete")
         delete_ch.setVisible(chapter.downloaded)
 
-        selected_action = menu.exec(event.globalPos())
+        selected_action = menu.exec(e.globalPos())
 
         if selected_action == open_chapter:
-            self.item_clicked.emit(self.layout().indexOf(item) - 1)
+            self.item_clicked.emit(position)
         elif selected_action == mark_read:
             self._mark_as_read(True)
         elif selected_action == mark_unread:
@@ -274,74 +429,48 @@ class ChapterList(CardList[ChapterListItem, ChapterSelector]):
         elif selected_action == delete_ch:
             self._download_chapters(False)
 
-        self.selector.clear_selection(unselect=True)
+        model.clear_selection()
 
     def _mark_as_read(self, read: bool) -> None:
         self._mark_as_read_request.emit(
-            sorted(
-                filter(
-                    lambda chapter: chapter.read != read,
-                    (item.chapter for item in self.selector.selected_chapters),
-                ),
-                key=lambda chapter: chapter.number,
-            ),
+            [
+                chapter
+                for chapter in self.chapter_model.selected_chapters
+                if chapter.read != read
+            ],
             read,
         )
 
     def _download_chapters(self, download: bool) -> None:
         self._download_chapters_request.emit(
-            sorted(
-                filter(
-                    lambda chapter: chapter.downloaded != download,
-                    (item.chapter for item in self.selector.selected_chapters),
-                ),
-                key=lambda chapter: chapter.number,
-            ),
+            [
+                chapter
+                for chapter in self.chapter_model.selected_chapters
+                if chapter.downloaded != download
+            ],
             download,
         )
 
-    def _chapter_read_updated(self, chapter: Chapter):
-        layout = self.layout()
-        for i in range(1, layout.count()):
-            chapter_item: ChapterListItem = layout.itemAt(i).widget()
-            if chapter_item.chapter == chapter:
-                chapter_item.mark_as_read(chapter.read)
-                return
-
-    def _chapter_downloaded_updated(self, chapter: Chapter):
-        layout = self.layout()
-        for i in range(1, layout.count()):
-            chapter_item: ChapterListItem = layout.itemAt(i).widget()
-            if chapter_item.chapter == chapter:
-                chapter_item.mark_as_downloaded(chapter.downloaded)
-                return
+    def _chapter_read_updated(self, chapter: Chapter) -> None:
+        self.chapter_model.set_read(chapter)
 
-    def display_chapters(self, chapters: list[Chapter]) -> None:
-        self.clear()
+    def _chapter_downloaded_updated(self, chapter: Chapter) -> None:
+        self.chapter_model.set_downloaded(chapter)
 
-        chapters = sorted(chapters, key=lambda chapter: chapter.number)
-        for chapter in chapters:
-            self.add_card(ChapterListItem(self, chapter))
+    def display_chapters(self, chapters: list[Chapter]) -> None:
+        self._anchor = -1
+        self.chapter_model.set_chapters(chapters)
 
         self.loading_icon.hide()
-        self.layout().setAlignment(Qt.AlignmentFlag.AlignTop)
-        self._chapters = chapters
+        self.loading_icon.movie().stop()
         self.items_changed.emit()
 
     def flip_direction(self) -> None:
-        self.layout().setDirection(
-            QVBoxLayout.Direction.BottomToTop
-            if self.layout().direction() == QVBoxLayout.Direction.TopToBottom
-            else QVBoxLayout.Direction.TopToBottom
-        )
+        model = self.chapter_model
+        model.set_descending(not model.descending)
 
     def clear(self) -> None:
-        layout = self.layout()
-        for _ in range(layout.count() - 1):
-            layout.takeAt(1).widget().deleteLater()
-        self.selector.clear_selection()
-
-        layout.setDirection(QVBoxLayout.Direction.BottomToTop)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.verticalScrollBar().setValue(0)
+        self._anchor = -1
+        self.chapter_model.clear()
+        self.loading_icon.movie().start()
         self.loading_icon.show()
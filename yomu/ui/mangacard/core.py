@@ -3,7 +3,7 @@ from copy import copy
 from typing import Callable, TYPE_CHECKING
 
 from PyQt6.QtCore import pyqtSignal, QEvent, QMimeData, QObject, QSize, Qt, QUrl
-from PyQt6.QtGui import QDrag, QIcon, QMouseEvent, QMovie, QPixmap
+from PyQt6.QtGui import QDrag, QIcon, QImage, QMouseEvent, QMovie, QPixmap
 from PyQt6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -14,8 +14,10 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from yomu.core.imagepipeline import ImageSpec
 from yomu.core.network import Request
 from yomu.core.models import Chapter, Manga
+from yomu.core.storage import ThumbnailSize
 from yomu.core import utils
 from yomu.ui.components.thumbnail import ThumbnailWidget
 from yomu.ui.stack import StackWidgetMixin
@@ -64,7 +66,7 @@ class MangaCard(QFrame, StackWidgetMixin):
         self.details_widget.setReadOnly(True)
         self.details_widget.setOpenExternalLinks(True)
 
-        self.thumbnail_widget = Thumbnail(self)
+        self.thumbnail_widget = Thumbnail(self, ThumbnailSize.LARGE)
         self.thumbnail_widget.setObjectName("Thumbnail")
         self.thumbnail_widget.setFixedSize(QSize(195, 279) * 1.2)
         self.thumbnail_widget.installEventFilter(self)
@@ -227,7 +229,11 @@ class MangaCard(QFrame, StackWidgetMixin):
             and a1.button() == Qt.MouseButton.LeftButton
             and self.thumbnail_widget.status == ThumbnailWidget.Status.LOADED
         ):
-            DisplayThumbnail(self.window().stack, self.thumbnail_widget.pixmap()).show()
+            DisplayThumbnail(
+                self.window().stack,
+                self.thumbnail_widget.pixmap(),
+                self.thumbnail_widget.data,
+            ).show()
         return super().eventFilter(a0, a1)
 
     def mousePressEvent(self, a0: QMouseEvent) -> None:
@@ -288,7 +294,9 @@ class MangaCard(QFrame, StackWidgetMixin):
 
 
 class DisplayThumbnail(QFrame):
-    def __init__(self, parent: QWidget, pixmap: QPixmap) -> None:
+    def __init__(
+        self, parent: QWidget, pixmap: QPixmap, data: bytes | None = None
+    ) -> None:
         super().__init__(parent)
         self.setStyleSheet("DisplayThumbnail {background-color: rgba(0, 0, 0, 0.8);}")
 
@@ -311,6 +319,16 @@ class DisplayThumbnail(QFrame):
         self.resize(parent.size())
         self.raise_()
 
+        if data is not None:
+            task = parent.window().app.image_pipeline.process(
+                data, ImageSpec(height=round(parent.height() * 0.8)), self
+            )
+            task.finished.connect(self._image_loaded)
+
+    def _image_loaded(self, image: QImage, _: bytes) -> None:
+        self.label.setPixmap(QPixmap.fromImage(image))
+        self.label.setFixedSize(image.size())
+
     def eventFilter(self, a0: QObject, a1: QEvent) -> bool:
         if a0 == self.parent() and a1.type() == QEvent.Type.Resize:
             pixmap = self.label.pixmap().scaledToHeight(
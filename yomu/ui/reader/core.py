@@ -1,25 +1,40 @@
 import os
+from bisect import bisect_right
 from collections.abc import Sequence
 from copy import copy
 from enum import IntEnum
+from functools import partial
 from logging import getLogger
 from typing import Callable, TYPE_CHECKING
 
-from PyQt6.QtCore import pyqtSignal, QEvent, QMimeData, QRect, Qt, QUrl
-from PyQt6.QtGui import QContextMenuEvent, QDrag, QMouseEvent, QWheelEvent
+from PyQt6.QtCore import pyqtSignal, QEvent, QMimeData, QRect, Qt, QTimer, QUrl
+from PyQt6.QtGui import (
+    QContextMenuEvent,
+    QDrag,
+    QImage,
+    QMouseEvent,
+    QPixmap,
+    QResizeEvent,
+    QWheelEvent,
+)
 from PyQt6.QtNetwork import QNetworkRequest
-from PyQt6.QtWidgets import QMenu, QScrollArea, QScrollBar
+from PyQt6.QtWidgets import QApplication, QMenu, QScrollArea, QScrollBar
 
 from yomu.core import utils as core_utils
 from yomu.core.downloader import Downloader
 from yomu.core.models import Chapter, Page
 from yomu.core.network import Response
+from yomu.core.storage import ChapterArchive, ChapterManifest, ManifestPage
 from yomu.source import Page as SourcePage
 from yomu.ui.stack import StackWidgetMixin
 
+from .loader import PageLoader
 from .page import PageView
+from .preload import ChapterPreloader
+from .stats import ReaderStats
 from .overlay import Overlay
 from .overlay.bar import NavigationBar, PageBar
+from .overlay.hud import PerformanceHud
 from .view import *
 
 if TYPE_CHECKING:
@@ -58,6 +73,16 @@ class Reader(QScrollArea, StackWidgetMixin):
         self._status = Reader.Status.NULL
 
         self.sql = window.app.sql
+        self.page_loader = PageLoader(self)
+        self.preloader = ChapterPreloader(self)
+        # A tiled page being decoded in full so it can be dragged
+        self._dragged_page: PageView | None = None
+
+        # Pages are decoded again at their new size once resizing stops
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(300)
+        self._resize_timer.timeout.connect(self.page_loader.update)
 
         self.current_view: BaseView = WebtoonView(self)
         self.overlay = Overlay(self)
@@ -68,6 +93,13 @@ class Reader(QScrollArea, StackWidgetMixin):
         self.overlay.add_overlay(self.info_bar)
         self.overlay.add_overlay(self.page_bar)
 
+        self.stats = ReaderStats(self)
+        self.hud = PerformanceHud(self)
+        self.hud.setVisible(
+            window.app.settings.value("reader_performance_hud", False, bool)
+        )
+        window.app.settings.value_changed.connect(self._settings_changed)
+
         self._chapters: list[Chapter] = [
             Chapter(
                 id=-1,
@@ -82,14 +114,27 @@ class Reader(QScrollArea, StackWidgetMixin):
         ]
         self._current_chapter_index = 0
         self._pages: list[PageView] = []
+        # The chapters shown one after another in continuous mode, as their index
+        # in `_chapters` and the index of their first page
+        self._strip: list[tuple[int, int]] = [(0, 0)]
+        # The chapters in the strip, by id, that the downloader was told are open
+        self._open_chapters: dict[int, Chapter] = {}
+        # The archives of the downloaded chapters in the strip, by chapter id
+        self._archives: dict[int, ChapterArchive] = {}
+        self._prefetch_requested = False
+        self._preload_requested = False
+        self._append_requested = False
 
         self.setWidgetResizable(True)
         self.setWidget(self.current_view)
 
         self.verticalScrollBar().valueChanged.connect(self._value_changed)
         self.horizontalScrollBar().rangeChanged.connect(self._range_changed)
-        self.current_view.page_changed.connect(self.page_bar.set_value)
+        self.current_view.page_changed.connect(self._page_changed)
+        self.current_view.page_changed.connect(self.page_loader.update)
         self.page_bar.value_changed.connect(self._scroll_to)
+        self.preloader.preloaded.connect(self._append_next_chapter)
+        self.preloader.failed.connect(self._preload_failed)
 
         self.addAction("Change Reader Mode").triggered.connect(self.change_view)
         self.addAction("Previous Page").triggered.connect(self.previous_page)
@@ -98,9 +143,11 @@ class Reader(QScrollArea, StackWidgetMixin):
         self.addAction("Next Chapter").triggered.connect(self.next_chapter)
         self.addAction("Zoom Out").triggered.connect(self.zoom_out)
         self.addAction("Zoom In").triggered.connect(self.zoom_in)
+        self.addAction("Toggle Performance HUD").triggered.connect(self.toggle_hud)
 
         window.app.keybinds_changed.connect(self._set_keybinds)
         window.titlebar.refresh_button.released.connect(self._refresh)
+        window.closed.connect(self._close_chapters)
         self._set_keybinds(core_utils.get_keybinds())
 
     window: Callable[[], ReaderWindow]
@@ -115,6 +162,14 @@ class Reader(QScrollArea, StackWidgetMixin):
     def pages(self) -> list[PageView]:
         return self._pages
 
+    @property
+    def continuous(self) -> bool:
+        """Whether the next chapter is shown below the current one"""
+        return (
+            self.current_view.supports_continuous
+            and self.window().app.settings.value("reader_continuous", False, bool)
+        )
+
     @property
     def status(self) -> Status:
         return self._status
@@ -138,13 +193,19 @@ class Reader(QScrollArea, StackWidgetMixin):
         cls.views.pop(name, None)
 
     def mousePressEvent(self, a0: QMouseEvent) -> None:
+        self._dragged_page = None
         if a0.button() == Qt.MouseButton.BackButton:
             a0.ignore()
         return super().mousePressEvent(a0)
 
+    def resizeEvent(self, a0: QResizeEvent) -> None:
+        super().resizeEvent(a0)
+        self._resize_timer.start()
+
     def wheelEvent(self, a0: QWheelEvent) -> None:
         if a0.modifiers() == Qt.KeyboardModifier.ControlModifier:
-            self.current_view.zoom_in() if a0.angleDelta().y() > 0 else self.current_view.zoom_out()
+            anchor = a0.position().toPoint()
+            self.current_view.zoom_in(anchor) if a0.angleDelta().y() > 0 else self.current_view.zoom_out(anchor)
             return a0.ignore()
         return super().wheelEvent(a0)
 
@@ -174,7 +235,7 @@ class Reader(QScrollArea, StackWidgetMixin):
         page = self.current_view.page_at(a0.pos())
         if page is not None:
             if page.status == PageView.Status.FAILED:
-                menu.addAction("Reload").triggered.connect(page.fetch_page)
+                menu.addAction("Reload").triggered.connect(lambda: page.fetch_page())
             elif page.status == PageView.Status.LOADED:
                 copy_image = menu.addAction("Copy Image")
                 copy_image.triggered.connect(page.copy_image_to_clipboard)
@@ -206,20 +267,33 @@ class Reader(QScrollArea, StackWidgetMixin):
 
     def mouseMoveEvent(self, ev: QMouseEvent) -> None:
         page = self.current_view.page_at(ev.pos())
-        if (
-            ev.buttons() != Qt.MouseButton.LeftButton
-            or page is None
-            or (pixmap := page.pixmap()).isNull()
-        ):
+        if ev.buttons() != Qt.MouseButton.LeftButton or page is None:
             return
+        if (image := page.image()).isNull():
+            # Tiled pages are decoded in full off the gui thread. The drag starts once they are
+            if page is not self._dragged_page:
+                self._dragged_page = page
+                page.request_image(partial(self._tiled_page_decoded, page))
+            return
+        self._drag_image(page, image)
+
+    def _tiled_page_decoded(self, page: PageView, image: QImage) -> None:
+        # The button might have been let go while the page was decoding
+        dragged, self._dragged_page = self._dragged_page, None
+        held = QApplication.mouseButtons() == Qt.MouseButton.LeftButton
+        if page is dragged and held:
+            self._drag_image(page, image)
 
+    def _drag_image(self, page: PageView, image: QImage) -> None:
         mimedata = QMimeData()
-        mimedata.setImageData(pixmap.toImage())
+        mimedata.setImageData(image)
         path = os.path.join(core_utils.temp_dir_path(), "dragged-image.jpg")
-        pixmap.save(path, "JPG")
+        image.save(path, "JPG")
         mimedata.setUrls([QUrl.fromLocalFile(path)])
 
-        pixmap = pixmap.scaledToHeight(400, Qt.TransformationMode.FastTransformation)
+        pixmap = QPixmap.fromImage(
+            image.scaledToHeight(400, Qt.TransformationMode.FastTransformation)
+        )
         drag = QDrag(page)
         drag.setMimeData(mimedata)
         drag.setPixmap(pixmap)
@@ -234,34 +308,285 @@ class Reader(QScrollArea, StackWidgetMixin):
             self.overlay.hide()
 
     def _scroll_to(self, page: int) -> None:
+        self._go_to_page(self._chapter_pages().start + page)
+
+    def _go_to_page(self, page: int) -> None:
         scrollbar = self.verticalScrollBar()
         scrollbar.valueChanged.disconnect(self._value_changed)
         self.current_view.current_index = page
         scrollbar.valueChanged.connect(self._value_changed)
 
-    def _fetch_pages(self) -> None:
-        if not self.chapter.downloaded:
-            request = self.chapter.get_pages()
-            request.setPriority(QNetworkRequest.Priority.HighPriority)
-            response = self.window().network.handle_request(request)
-            self._cancel_request.connect(response.abort)
-            return response.finished.connect(self._pages_fetched)
+    def _chapter_pages(self) -> range:
+        """The indexes of the current chapter's pages"""
+        strip = self._strip
+        for i, (index, start) in enumerate(strip):
+            if index == self._current_chapter_index:
+                end = strip[i + 1][1] if i + 1 < len(strip) else len(self._pages)
+                return range(start, end)
+        return range(len(self._pages))
+
+    def chapter_page(self, index: int) -> PageView | None:
+        """The current chapter's page at an index, as counted by the page bar"""
+        pages = self._chapter_pages()
+        if 0 <= index < len(pages):
+            return self._pages[pages.start + index]
+        return None
+
+    def _page_changed(self, page: int) -> None:
+        if not self._pages:
+            return
 
-        path = Downloader.resolve_path(self.chapter)
-        pages = [
-            PageView(
-                self.current_view,
-                Page(
-                    i,
-                    chapter=self.chapter,
-                    url=os.path.join(path, f"{i}.png"),
-                    downloaded=True,
-                ),
+        position = bisect_right([start for _, start in self._strip], page) - 1
+        index, _ = self._strip[max(position, 0)]
+        if index != self._current_chapter_index:
+            self._enter_chapter(index)
+
+        pages = self._chapter_pages()
+        self.page_bar.set_value(page - pages.start)
+
+        progress = (page - pages.start + 1) * 100 / len(pages)
+        next_index = self._current_chapter_index + 1
+        if (
+            not self._preload_requested
+            and progress >= 75
+            and next_index < len(self._chapters)
+            and next_index > self._strip[-1][0]
+        ):
+            self._preload_requested = True
+            self.preloader.preload(self._chapters[next_index])
+
+        if (
+            not self._append_requested
+            and progress >= 75
+            and self._strip[-1][0] == self._current_chapter_index
+            and self.continuous
+        ):
+            self._append_requested = True
+            self._append_next_chapter()
+
+        if self._prefetch_requested:
+            return
+
+        window = self.window()
+        threshold = window.app.settings.value("smart_download_threshold", 50, int)
+        if progress < threshold:
+            return
+
+        self._prefetch_requested = True
+        window.app.downloader.prefetch_chapters(
+            self._chapters[self._current_chapter_index + 1 :]
+        )
+
+    def _enter_chapter(self, index: int) -> None:
+        # The strip was scrolled across a chapter boundary
+        if index > self._current_chapter_index:
+            self.mark_chapter_as_read()
+
+        self._current_chapter_index = index
+        chapter = self.chapter
+        self.stats.start_chapter(chapter, timed=False)
+        self.info_bar.set_title(chapter.title)
+        self.page_bar.set_total_pages(len(self._chapter_pages()) - 1)
+        self._prefetch_requested = False
+        self._preload_requested = False
+        self.sql.mark_chapter_opened(chapter)
+        self.chapter_changed.emit(chapter)
+
+        # Not done right away since the view is still handling the scroll
+        QTimer.singleShot(0, self._unload_passed_chapters)
+
+    def _preload_failed(self) -> None:
+        # Appending is tried again once another page is turned to
+        self._append_requested = False
+
+    def _append_next_chapter(self) -> None:
+        if not self._append_requested or not self.continuous:
+            return
+
+        index = self._strip[-1][0] + 1
+        if index >= len(self._chapters):
+            return
+
+        chapter = self._chapters[index]
+        if chapter.downloaded:
+            pages = self._downloaded_pages(chapter)
+        elif self.preloader.is_ready(chapter):
+            pages = self.preloader.take(chapter)
+        else:
+            # Called again once the preloader has the pages
+            return self.preloader.preload(chapter)
+
+        self._append_requested = False
+        if not pages:
+            return
+
+        views = [PageView(self.current_view, page) for page in pages]
+        self._strip.append((index, len(self._pages)))
+        self._pages = [*self._pages, *views]
+        self._update_open_chapters()
+        self.stats.watch(views)
+        self.current_view.set_page_views(views)
+        self.page_loader.set_pages(self._pages)
+
+    def _unload_passed_chapters(self) -> None:
+        # One chapter is kept above the current one so scrolling back a bit doesn't load anything
+        positions = [index for index, _ in self._strip]
+        if self._current_chapter_index not in positions:
+            return
+
+        count = positions.index(self._current_chapter_index) - 1
+        if count <= 0 or not self.current_view.supports_continuous:
+            return
+
+        removed = self._strip[count][1]
+        self.current_view.remove_page_views(removed)
+        for page in self._pages[:removed]:
+            page.deleteLater()
+        self._pages = self._pages[removed:]
+        self._strip = [(index, start - removed) for index, start in self._strip[count:]]
+        self._update_open_chapters()
+        self.page_loader.set_pages(self._pages)
+
+    def _collapse_strip(self) -> int:
+        # Views that show one chapter at a time only get the current one
+        pages = self._chapter_pages()
+        for page in self._pages[: pages.start] + self._pages[pages.stop :]:
+            page.deleteLater()
+        self._pages = self._pages[pages.start : pages.stop]
+        self._strip = [(self._current_chapter_index, 0)]
+        self._update_open_chapters()
+        self.page_loader.set_pages(self._pages)
+        return pages.start
+
+    def _update_open_chapters(self) -> None:
+        # Downloaded chapters aren't deleted while their pages are in the strip
+        chapters = {
+            chapter.id: chapter
+            for chapter in (self._chapters[index] for index, _ in self._strip)
+        }
+        if not self._pages:
+            chapters.clear()
+
+        # The archives are closed first so their files can be deleted
+        for chapter_id in self._archives.keys() - chapters.keys():
+            self._archives.pop(chapter_id).close()
+
+        downloader = self.window().app.downloader
+        for chapter_id in self._open_chapters.keys() - chapters.keys():
+            downloader.close_chapter(self._open_chapters.pop(chapter_id))
+        for chapter_id in chapters.keys() - self._open_chapters.keys():
+            self._open_chapters[chapter_id] = chapters[chapter_id]
+            downloader.open_chapter(chapters[chapter_id])
+
+    def _close_chapters(self) -> None:
+        while self._archives:
+            self._archives.popitem()[1].close()
+
+        downloader = self.window().app.downloader
+        while self._open_chapters:
+            downloader.close_chapter(self._open_chapters.popitem()[1])
+
+    @staticmethod
+    def _archive_pages(chapter: Chapter, archive: ChapterArchive) -> list[Page]:
+        return [
+            Page(
+                i,
+                chapter=chapter,
+                url=page.name,
+                downloaded=True,
+                archive=archive,
+                width=page.width,
+                height=page.height,
             )
-            for i in range(len(os.listdir(path)))
+            for i, page in enumerate(archive.manifest.pages)
         ]
 
-        self._set_pages(pages)
+    @staticmethod
+    def _folder_pages(chapter: Chapter, path: str) -> list[Page] | None:
+        manifest = ChapterManifest.load(path)
+        if manifest is not None:
+            if not manifest.verify(path):
+                return None
+            pages = manifest.pages
+        else:
+            count = len(os.listdir(path)) if os.path.isdir(path) else 0
+            pages = [ManifestPage(name=f"{i}.png") for i in range(count)]
+
+        return [
+            Page(
+                i,
+                chapter=chapter,
+                url=os.path.join(path, page.name),
+                downloaded=True,
+                width=page.width,
+                height=page.height,
+            )
+            for i, page in enumerate(pages)
+        ]
+
+    def _downloaded_pages(self, chapter: Chapter) -> list[Page] | None:
+        archive_path = Downloader.resolve_archive_path(chapter)
+        if not os.path.exists(archive_path):
+            return self._folder_pages(chapter, Downloader.resolve_path(chapter))
+
+        archive = ChapterArchive.open(archive_path)
+        if archive is None:
+            return None
+        if not archive.verify():
+            archive.close()
+            return None
+        self._keep_archive(chapter, archive)
+        return self._archive_pages(chapter, archive)
+
+    def _keep_archive(self, chapter: Chapter, archive: ChapterArchive) -> None:
+        # Pages are read from the archive until its chapter leaves the strip
+        if (previous := self._archives.get(chapter.id)) is not None:
+            previous.close()
+        self._archives[chapter.id] = archive
+
+    def _fetch_pages(self) -> None:
+        if not self.chapter.downloaded:
+            return self._fetch_source_pages()
+
+        archive_path = Downloader.resolve_archive_path(self.chapter)
+        if os.path.exists(archive_path):
+            return self._open_archive(archive_path)
+
+        pages = self._folder_pages(self.chapter, Downloader.resolve_path(self.chapter))
+        if pages is None:
+            return self._downloaded_chapter_invalid()
+        self._set_pages([PageView(self.current_view, page) for page in pages])
+
+    def _fetch_source_pages(self) -> None:
+        pages = self.preloader.take(self.chapter)
+        if pages is not None:
+            return self._set_pages(
+                [PageView(self.current_view, page) for page in pages]
+            )
+
+        request = self.chapter.get_pages()
+        request.setPriority(QNetworkRequest.Priority.HighPriority)
+        response = self.window().network.handle_request(request)
+        self._cancel_request.connect(response.abort)
+        response.finished.connect(self._pages_fetched)
+
+    def _downloaded_chapter_invalid(self) -> None:
+        logger.warning(f"Downloaded chapter {self.chapter.title} is incomplete")
+        if self.window().network.is_online:
+            return self._fetch_source_pages()
+        self.display_message("The downloaded chapter is incomplete or damaged")
+
+    def _open_archive(self, path: str) -> None:
+        archive = ChapterArchive.open(path)
+        if archive is None:
+            return self.display_message("Failed to open the downloaded chapter")
+        if not archive.verify():
+            archive.close()
+            return self._downloaded_chapter_invalid()
+
+        self._keep_archive(self.chapter, archive)
+        pages = self._archive_pages(self.chapter, archive)
+        self._set_pages([PageView(self.current_view, page) for page in pages])
 
     def _pages_fetched(self) -> None:
         response: Response = self.sender()
@@ -307,9 +632,13 @@ class Reader(QScrollArea, StackWidgetMixin):
 
     def _set_pages(self, pages: list[PageView]) -> None:
         self._pages = pages
+        self._strip = [(self._current_chapter_index, 0)]
+        self._update_open_chapters()
+        self.stats.watch(pages)
         self.current_view.set_page_views(pages)
         self.page_bar.set_total_pages(self.current_view.page_count - 1)
         self.current_view.current_index = 0
+        self.page_loader.set_pages(pages)
         self.status = Reader.Status.NULL
 
     def _set_keybinds(self, keybinds: dict[str, core_utils.Keybind]) -> None:
@@ -323,8 +652,10 @@ class Reader(QScrollArea, StackWidgetMixin):
 
         self._cancel_request.emit()
 
+        self.page_loader.clear()
         self.current_view.clear()
         self._pages = []
+        self._append_requested = False
         self.page_bar.set_total_pages(0)
 
         self._fetch_pages()
@@ -337,6 +668,7 @@ class Reader(QScrollArea, StackWidgetMixin):
     def setWidget(self, w: BaseView) -> None:
         super().setWidget(w)
         self.overlay.raise_()
+        self.hud.raise_()
 
     def display_message(self, message: str) -> None:
         window = self.window()
@@ -350,6 +682,9 @@ class Reader(QScrollArea, StackWidgetMixin):
             return
 
         current_index = self.current_view.current_index
+        if len(self._strip) > 1 and not all_views[name].supports_continuous:
+            current_index -= self._collapse_strip()
+
         try:
             self.current_view.unload()
         except Exception as e:
@@ -358,7 +693,8 @@ class Reader(QScrollArea, StackWidgetMixin):
             )
 
         self.current_view = all_views[name](self)
-        self.current_view.page_changed.connect(self.page_bar.set_value)
+        self.current_view.page_changed.connect(self._page_changed)
+        self.current_view.page_changed.connect(self.page_loader.update)
 
         self.current_view.set_page_views(self.pages)
         self.setWidget(self.current_view)
@@ -383,12 +719,19 @@ class Reader(QScrollArea, StackWidgetMixin):
             self._cancel_request.emit()
 
         self.status = Reader.Status.LOADING
+        self.stats.start_chapter(chapter)
         self.info_bar.set_title(chapter.title)
         self.page_bar.reset()
+        self._prefetch_requested = False
+        self._preload_requested = False
+        self._append_requested = False
+        self.sql.mark_chapter_opened(chapter)
 
+        self.page_loader.clear()
         for page in self._pages:
             page.deleteLater()
         self._pages = []
+        self._update_open_chapters()
         self.current_view.clear()
 
         self.chapter_changed.emit(chapter)
@@ -410,23 +753,36 @@ class Reader(QScrollArea, StackWidgetMixin):
         self._set_chapter(chapters[index])
 
     def previous_page(self) -> None:
-        if self.current_view.page > 0:
+        page = self.current_view.page
+        if page > self._chapter_pages().start:
             self.page_bar.previous_page()
+        elif page > 0:
+            self._go_to_page(page - 1)
 
     def next_page(self) -> None:
-        if self.current_view.page < self.current_view.page_count - 1:
+        page = self.current_view.page
+        if page < self._chapter_pages().stop - 1:
             self.page_bar.next_page()
+        elif page < self.current_view.page_count - 1:
+            self._go_to_page(page + 1)
+
+    def _go_to_chapter(self, index: int) -> None:
+        # Chapters already in the continuous strip are scrolled to instead of reopened
+        for chapter_index, start in self._strip:
+            if chapter_index == index and len(self._strip) > 1:
+                return self._go_to_page(start)
+
+        self._current_chapter_index = index
+        self._set_chapter(self._chapters[index])
 
     def previous_chapter(self) -> None:
         if self._current_chapter_index > 0:
-            self._current_chapter_index -= 1
-            self._set_chapter(self._chapters[self._current_chapter_index])
+            self._go_to_chapter(self._current_chapter_index - 1)
 
     def next_chapter(self) -> None:
         self.mark_chapter_as_read()
         if self._current_chapter_index < len(self._chapters) - 1:
-            self._current_chapter_index += 1
-            self._set_chapter(self._chapters[self._current_chapter_index])
+            self._go_to_chapter(self._current_chapter_index + 1)
 
     def zoom_out(self) -> None:
         self.current_view.zoom_out()
@@ -434,6 +790,15 @@ class Reader(QScrollArea, StackWidgetMixin):
     def zoom_in(self) -> None:
         self.current_view.zoom_in()
 
+    def toggle_hud(self) -> None:
+        self.window().app.settings.setValue(
+            "reader_performance_hud", self.hud.isHidden()
+        )
+
+    def _settings_changed(self, key: str, value: object) -> None:
+        if key == "reader_performance_hud":
+            self.hud.setVisible(bool(value))
+
     def mark_chapter_as_read(self) -> None:
         if not self.chapter.read:
             self.sql.mark_chapters_read_status([self.chapter], read=True)
@@ -441,3 +806,7 @@ class Reader(QScrollArea, StackWidgetMixin):
     def set_current_widget(self) -> None:
         super().set_current_widget()
         self.window().setWindowTitle(self.chapter.manga.title)
+
+    def clear_widget(self) -> None:
+        super().clear_widget()
+        self.stats.finish()
@@ -0,0 +1,128 @@
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QObject, QTimer
+
+from yomu.core.network import Request
+
+from .page import PageView
+
+if TYPE_CHECKING:
+    from .core import Reader
+
+
+class PageLoader(QObject):
+    """
+    Decides which pages of the current chapter get fetched and in what order.
+
+    Pages shown by the view are fetched first, followed by the next `lookahead` pages.
+    The pages up to `cancel_distance` away are fetched in the background, closest first, with
+    at most `background_requests` of them loading at once. Pages still loading that end up
+    further away from the ones on screen are cancelled. Loaded pages that are
+    wanted get decoded again if the view now shows them at another size.
+    """
+
+    lookahead = 3
+    background_requests = 2
+    cancel_distance = 10
+
+    def __init__(self, reader: Reader) -> None:
+        super().__init__(reader)
+        self.reader = reader
+        self._pages: list[PageView] = []
+        self._indices: dict[PageView, int] = {}
+        # Only the pages in flight are looked at when cancelling so scrolling long chapters stays cheap
+        self._loading: set[PageView] = set()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._schedule)
+
+    def set_pages(self, pages: list[PageView]) -> None:
+        # Continuous views hand over the same pages again along with the next chapter's
+        known = set(map(id, self._pages))
+        self._pages = pages
+        self._indices = {page: i for i, page in enumerate(pages)}
+        self._loading = {page for page in self._loading if page in self._indices}
+        for page in pages:
+            if id(page) not in known:
+                page.status_changed.connect(self._page_status_changed)
+                if page.status == PageView.Status.LOADING:
+                    self._loading.add(page)
+        self.update()
+
+    def clear(self) -> None:
+        self._timer.stop()
+        self._pages = []
+        self._indices = {}
+        self._loading = set()
+
+    def update(self) -> None:
+        # Scrolling changes the visible pages many times per frame so the work is done once the events settle
+        if self._pages:
+            self._timer.start()
+
+    def _page_status_changed(self, status: PageView.Status) -> None:
+        page = self.sender()
+        if status == PageView.Status.LOADING:
+            if page in self._indices:
+                self._loading.add(page)
+        else:
+            self._loading.discard(page)
+            self.update()
+
+    def _schedule(self) -> None:
+        pages = self._pages
+        view = self.reader.current_view
+        visible = view.visible_pages()
+        if not pages or not visible:
+            return
+
+        loadable = view.loadable_pages()
+        first, last = visible[0], visible[-1]
+        ahead = range(last + 1, min(last + 1 + self.lookahead, len(pages)))
+        ahead = [i for i in ahead if i in loadable]
+
+        def distance(index: int) -> int:
+            # Pages behind the reader are less likely to be needed than the ones ahead
+            if index > last:
+                return index - last
+            return (first - index) * 2
+
+        wanted: dict[int, Request.Priority] = {}
+        for i in visible:
+            wanted[i] = Request.Priority.HighPriority
+        for i in ahead:
+            wanted[i] = Request.Priority.NormalPriority
+
+        # Only the pages that wouldn't be cancelled right away are background candidates
+        behind = range(max(first - self.cancel_distance // 2, 0), first)
+        after = range(last + 1, min(last + 1 + self.cancel_distance, len(pages)))
+        background = sorted(
+            (
+                i
+                for i in (*behind, *after)
+                if i in loadable
+                and i not in wanted
+                and pages[i].status in (PageView.Status.NULL, PageView.Status.LOADING)
+            ),
+            key=distance,
+        )
+        for i in background[: self.background_requests]:
+            wanted[i] = Request.Priority.LowPriority
+
+        for page in tuple(self._loading):
+            i = self._indices[page]
+            if i not in wanted and (
+                i not in loadable or distance(i) > self.cancel_distance
+            ):
+                page.release()
+
+        for i, priority in wanted.items():
+            page = pages[i]
+            if page.status == PageView.Status.NULL:
+                page.fetch_page(priority)
+            elif page.status == PageView.Status.LOADING:
+                page.set_priority(priority)
+            else:
+                page.rescale()
@@ -1,10 +1,27 @@
 import os
 from abc import ABC, ABCMeta, abstractmethod
+from functools import partial
 from typing import Callable, TYPE_CHECKING
 
-from PyQt6.QtCore import pyqtSignal, QEvent, QObject, QSignalBlocker, QSize, Qt
-from PyQt6.QtGui import QIcon, QPixmap
-from PyQt6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QSlider
+from PyQt6.QtCore import (
+    pyqtSignal,
+    QEvent,
+    QObject,
+    QPoint,
+    QSignalBlocker,
+    QSize,
+    Qt,
+)
+from PyQt6.QtGui import QIcon, QImage, QMouseEvent, QPixmap
+from PyQt6.QtWidgets import (
+    QFrame,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QSlider,
+    QStyle,
+    QStyleOptionSlider,
+)
 
 from yomu.core import utils
 
@@ -102,6 +119,32 @@ class PageSlider(QFrame):
             self.slider.setMaximum(a0)
             self.page_num.setText(f"{self.slider.value() + 1}/{a0 + 1}")
 
+    def value_at(self, pos: QPoint) -> int:
+        """The value the slider would have if its handle was moved to a position"""
+        slider = self.slider
+        option = QStyleOptionSlider()
+        slider.initStyleOption(option)
+        style = slider.style()
+        groove = style.subControlRect(
+            QStyle.ComplexControl.CC_Slider,
+            option,
+            QStyle.SubControl.SC_SliderGroove,
+            slider,
+        )
+        handle = style.subControlRect(
+            QStyle.ComplexControl.CC_Slider,
+            option,
+            QStyle.SubControl.SC_SliderHandle,
+            slider,
+        )
+        return QStyle.sliderValueFromPosition(
+            slider.minimum(),
+            slider.maximum(),
+            pos.x() - groove.x() - handle.width() // 2,
+            groove.width() - handle.width(),
+            option.upsideDown,
+        )
+
     def _value_changed(self, value: int) -> None:
         self.page_num.setText(f"{value + 1}/{self.slider.maximum() + 1}")
         self.value_changed.emit(value)
@@ -128,15 +171,43 @@ class PageSlider(QFrame):
             self.page_num.setText(f"0/0")
 
 
+class PagePreview(QLabel):
+    """Shows the preview of the page under the mouse above the page slider"""
+
+    HEIGHT = 180
+
+    def __init__(self, parent: PageBar) -> None:
+        super().__init__(parent, Qt.WindowType.ToolTip)
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.index = -1
+
+    def set_preview(self, index: int, pixmap: QPixmap | None) -> None:
+        self.index = index
+        if pixmap is None:
+            self.setText(f"Page {index + 1}")
+        else:
+            self.setPixmap(
+                pixmap.scaledToHeight(
+                    self.HEIGHT, Qt.TransformationMode.SmoothTransformation
+                )
+            )
+        self.adjustSize()
+
+
 class PageBar(BaseBar):
     value_changed = pyqtSignal(int)
 
     def __init__(self, reader: Reader) -> None:
         super().__init__(reader.overlay)
         self.setFixedHeight(60)
+        self.reader = reader
 
         self.slider_widget = PageSlider(self)
         self.slider_widget.value_changed.connect(self.value_changed.emit)
+        self.slider_widget.slider.setMouseTracking(True)
+        self.slider_widget.slider.installEventFilter(self)
+
+        self.preview = PagePreview(self)
 
         self.previous_button.pressed.connect(self.previous_page)
         self.next_button.pressed.connect(self.next_page)
@@ -155,6 +226,45 @@ class PageBar(BaseBar):
 
         self.setGeometry(x, y, width, height)
 
+    def eventFilter(self, a0: QObject, a1: QEvent) -> bool:
+        if a0 is self.slider_widget.slider:
+            if a1.type() == QEvent.Type.MouseMove:
+                self._show_preview(a1)
+            elif a1.type() == QEvent.Type.Leave:
+                self.preview.hide()
+        return super().eventFilter(a0, a1)
+
+    def hideEvent(self, a0) -> None:
+        self.preview.hide()
+        super().hideEvent(a0)
+
+    def _show_preview(self, event: QMouseEvent) -> None:
+        # Scrubbing through the chapter shows the pages' previews so the right one can be found without loading them
+        slider = self.slider_widget.slider
+        pos = event.position().toPoint()
+        index = self.slider_widget.value_at(pos)
+        page_view = self.reader.chapter_page(index)
+        if page_view is None:
+            return self.preview.hide()
+
+        if index != self.preview.index:
+            cache = self.reader.window().app.preview_cache
+            self.preview.set_preview(index, cache.get(page_view.page))
+            if self.preview.pixmap().isNull():
+                task = cache.load(page_view.page, self.preview, create=True)
+                if task is not None:
+                    task.finished.connect(partial(self._preview_loaded, index))
+
+        point = slider.mapToGlobal(QPoint(pos.x(), 0))
+        self.preview.move(
+            point.x() - self.preview.width() // 2, point.y() - self.preview.height() - 8
+        )
+        self.preview.show()
+
+    def _preview_loaded(self, index: int, image: QImage, _: bytes) -> None:
+        if index == self.preview.index:
+            self.preview.set_preview(index, QPixmap.fromImage(image))
+
     def set_total_pages(self, a0: int) -> None:
         self.slider_widget.set_total_pages(a0)
 
@@ -169,3 +279,5 @@ class PageBar(BaseBar):
 
     def reset(self) -> None:
         self.slider_widget.reset()
+        self.preview.index = -1
+        self.preview.hide()
@@ -0,0 +1,104 @@
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QSize, Qt, QTimer
+from PyQt6.QtGui import QHideEvent, QShowEvent
+from PyQt6.QtWidgets import QLabel
+
+from ..page import PageView
+
+if TYPE_CHECKING:
+    from yomu.ui.reader.core import Reader
+
+
+class PerformanceHud(QLabel):
+    """
+    Shows the reader's `ReaderStats` in the top right corner. It's kept outside the overlay
+    so it stays visible while scrolling
+    """
+
+    MARGIN = 10
+
+    def __init__(self, reader: Reader) -> None:
+        super().__init__(reader.viewport())
+        self.reader = reader
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setTextFormat(Qt.TextFormat.PlainText)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(500)
+        self._timer.timeout.connect(self.refresh)
+
+        reader.overlay.resized.connect(self._overlay_resized)
+        self.hide()
+
+    @staticmethod
+    def _ms(value: float | None) -> str:
+        return "-" if value is None else f"{value:.0f} ms"
+
+    def _page_line(self, name: str, page: PageView | None) -> str:
+        if page is None or not page.timings.source:
+            return f"{name}: -"
+
+        timings = page.timings
+        return (
+            f"{name}: {timings.source}, queued {self._ms(timings.queued)}, "
+            f"network {self._ms(timings.network)}, parse {self._ms(timings.parse)}, "
+            f"decode {self._ms(timings.decode)}"
+        )
+
+    def refresh(self) -> None:
+        reader = self.reader
+        stats = reader.stats
+        app = reader.window().app
+        pages = reader.pages
+
+        current = None
+        if 0 <= (index := reader.current_view.page) < len(pages):
+            current = pages[index]
+        loading = sum(1 for page in pages if page.status == PageView.Status.LOADING)
+        chapter = reader.chapter
+        source = chapter.source if chapter.manga is not None else None
+        waiting = reader.window().network.queued_requests(source)
+        in_use = sum(page.pixmap_bytes for page in pages) / 1024 / 1024
+        cache = app.page_cache
+
+        average_frame = stats.average_frame
+        frames = (
+            "-"
+            if average_frame is None
+            else f"{average_frame:.1f} ms avg, {stats.max_frame:.1f} ms max, "
+            f"{stats.dropped_frames} dropped"
+        )
+
+        lines = [
+            f"First page: {self._ms(stats.first_page)}",
+            self._page_line("Current page", current),
+            f"Average: network {self._ms(stats.average('network'))}, "
+            f"parse {self._ms(stats.average('parse'))}, "
+            f"decode {self._ms(stats.average('decode'))}",
+            f"Queue: {waiting} waiting, {loading} loading",
+            f"Pixmaps: {in_use:.1f} MB shown, "
+            f"{cache.size / 1024 / 1024:.1f}/{cache.max_size / 1024 / 1024:.0f} MB cached",
+            f"Frames: {frames}",
+        ]
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        self._place()
+
+    def _place(self) -> None:
+        parent = self.parentWidget()
+        self.move(parent.width() - self.width() - self.MARGIN, self.MARGIN)
+
+    def _overlay_resized(self, _: QSize) -> None:
+        if self.isVisible():
+            self._place()
+
+    def showEvent(self, a0: QShowEvent) -> None:
+        super().showEvent(a0)
+        self.raise_()
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, a0: QHideEvent) -> None:
+        super().hideEvent(a0)
+        self._timer.stop()
@@ -1,16 +1,29 @@
 import os
+import time
+from dataclasses import replace
 from enum import IntEnum
+from functools import partial
 from logging import getLogger
 from typing import Callable, TYPE_CHECKING
 
-from PyQt6.QtCore import pyqtSignal, Qt, QUrl
-from PyQt6.QtGui import QMovie, QPixmap
+from PyQt6.QtCore import pyqtSignal, QRect, QRectF, QSize, Qt, QUrl
+from PyQt6.QtGui import QImage, QMovie, QPainter, QPaintEvent, QPixmap
 from PyQt6.QtWidgets import QApplication, QLabel
 
+from yomu.core.imagepipeline import (
+    ImageInfo,
+    ImageSpec,
+    ImageTask,
+    probe_image,
+    read_image_size,
+)
 from yomu.core.models import Page
+from yomu.core.pagecache import PageCache
 from yomu.core.network import Request, Response
 from yomu.core import utils
 
+from .stats import PageTimings
+
 if TYPE_CHECKING:
     from yomu.ui import ReaderWindow
 
@@ -23,18 +36,51 @@ class PageView(QLabel):
     class Status(IntEnum):
         NULL, LOADING, LOADED, FAILED = range(4)
 
+    # Images taller than two tiles once scaled are decoded one tile at a time
+    TILE_HEIGHT = 2048
+    # How much of an image is looked at for its size while it's downloading
+    HEADER_SIZE = 64 * 1024
+
     _cancel_request = pyqtSignal()
     status_changed = pyqtSignal(Status)
+    size_changed = pyqtSignal(QSize)
     finished = pyqtSignal()
+    # Emitted the first time a page is painted after it's loaded, not after it's rescaled
+    painted = pyqtSignal()
 
     def __init__(self, parent: BaseView, page: Page) -> None:
         super().__init__(parent)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.page = page
+        # Known before the image is fetched for downloaded pages, otherwise read from its header
+        self._image_size = QSize(page.width, page.height)
+        self.priority = Request.Priority.HighPriority
+        self.fast_scaling = False
+        self._response: Response | None = None
+        # The size the current image was decoded for and whether it's being decoded again
+        self._decoded_size = QSize()
+        self._rescaling = False
+        # The encoded image of a tiled page, its format and size before scaling and the rows on screen
+        self._tile_data: bytes | memoryview | None = None
+        self._source_info: ImageInfo | None = None
+        self._tiles: dict[int, QPixmap] = {}
+        self._tile_tasks: dict[int, ImageTask] = {}
+        self._exposed: QRect | None = None
+        # The decode of a tiled page's whole image. Formats that can't decode part of an image
+        # have the tiles near the screen cut from it, the image itself isn't kept
+        self._image_task: ImageTask | None = None
+        self._image_callbacks: list[Callable[[QImage], None]] = []
+        # A small version of the page shown instead of the loading animation until it loads
+        self._preview: QPixmap | None = None
+        # How long the page took to show, the timings of the current load and whether they're kept
+        self.timings = PageTimings()
+        self._timings = PageTimings()
+        self._timed = False
+        self._started = self._mark = 0.0
+        self._painted = True
         self.status = PageView.Status.NULL
 
-        self.fetch_page()
         self.show()
 
     window: Callable[[], ReaderWindow]
@@ -48,48 +94,236 @@ class PageView(QLabel):
         self._status = status
         if status in (PageView.Status.NULL, PageView.Status.LOADING):
             self.setScaledContents(False)
-            movie = QMovie(os.path.join(utils.resource_path(), "icons", "loading.gif"))
-            self.setMovie(movie)
-            movie.start()
+            # Only pages that are loading animate, a long chapter would otherwise run a timer per page
+            if self._preview is not None or status == PageView.Status.NULL:
+                self.clear()
+            else:
+                movie = QMovie(
+                    os.path.join(utils.resource_path(), "icons", "loading.gif")
+                )
+                self.setMovie(movie)
+                movie.start()
         elif status == PageView.Status.FAILED:
             self.setText("Failed to load image")
 
         self.status_changed.emit(status)
 
-    def fetch_page(self) -> None:
+    @property
+    def image_size(self) -> QSize:
+        """The image's size, empty until it's known. Until the image is decoded only its aspect ratio is right"""
+        return self._image_size
+
+    @image_size.setter
+    def image_size(self, size: QSize) -> None:
+        if size != self._image_size:
+            self._image_size = size
+            self.size_changed.emit(size)
+
+    @property
+    def tiled(self) -> bool:
+        return self._tile_data is not None
+
+    @property
+    def pixmap_bytes(self) -> int:
+        if self.tiled:
+            return sum(PageCache.pixmap_size(tile) for tile in self._tiles.values())
+
+        pixmap = self.pixmap()
+        if pixmap.isNull():
+            return 0
+        return PageCache.pixmap_size(pixmap)
+
+    @property
+    def target_size(self) -> QSize:
+        """The size the page should be decoded to, see `BaseView.page_size`"""
+        return self.window().reader.current_view.page_size()
+
+    @property
+    def estimated_bytes(self) -> int:
+        # What the page will take once decoded. Pages that were never loaded are assumed to be square
+        size, image_size = self.target_size, self.image_size
+        if image_size.isEmpty():
+            length = max(size.width(), size.height())
+            return length * length * 4
+        if size.width() > 0:
+            height = size.width() * image_size.height() / image_size.width()
+            return size.width() * round(height) * 4
+        width = size.height() * image_size.width() / image_size.height()
+        return round(width) * size.height() * 4
+
+    @staticmethod
+    def image_spec(size: QSize) -> ImageSpec:
+        # Pages are never scaled up, the view does that when painting them
+        return ImageSpec(
+            width=size.width() if size.width() > 0 else None,
+            height=size.height() if size.height() > 0 else None,
+            upscale=False,
+        )
+
+    def fetch_page(
+        self, priority: Request.Priority = Request.Priority.HighPriority
+    ) -> None:
         if self.status not in (PageView.Status.NULL, PageView.Status.FAILED):
             return
 
+        self.priority = priority
+        self._request_image()
+
+    def rescale(self) -> None:
+        """
+        Decodes the page again if the view shows it at another size than it was decoded for.
+        The current image is shown until the new one is ready
+        """
+        if (
+            self.status != PageView.Status.LOADED
+            or self._rescaling
+            or self.fast_scaling
+        ):
+            return
+
+        size, decoded = self.target_size, self._decoded_size
+        if size == decoded:
+            return
+
+        # Images smaller than the size they were decoded for are already at their full resolution
+        image_size = self.image_size
+        if size.width() > 0 and decoded.width() > 0:
+            if image_size.width() < decoded.width() <= size.width():
+                return
+        elif size.height() > 0 and decoded.height() > 0:
+            if image_size.height() < decoded.height() <= size.height():
+                return
+
+        if self.tiled:
+            self._decoded_size = size
+            return self._set_tiles(self._tile_data, self._source_info)
+
+        self._rescaling = True
+        self._request_image()
+
+    def _request_image(self) -> None:
+        window = self.window()
+        self._decoded_size = size = self.target_size
+        self._timings = PageTimings(source="memory")
+        self._timed = not self._rescaling
+        self._started = self._mark = time.perf_counter()
+
+        pixmap = window.app.page_cache.get(PageCache.key(self.page, size))
+        if pixmap is not None:
+            return self._set_pixmap(pixmap)
+
+        # Pages decoded before are read back from disk instead of being decoded again
+        if (task := window.app.bitmap_cache.load(self.page, size, self)) is not None:
+            self._timings.source = "disk"
+            task.finished.connect(self._bitmap_loaded)
+            task.failed.connect(self._fetch_image)
+            self._cancel_request.connect(task.cancel)
+            if not self._rescaling:
+                self.status = PageView.Status.LOADING
+                self._load_preview()
+            return
+
+        self._fetch_image()
+
+    def _fetch_image(self) -> None:
         window = self.window()
+        self._mark = time.perf_counter()
+        if self.page.archive is not None:
+            self._timings.source = "archive"
+            if (data := self.page.archive.read(self.page.url)) is None:
+                return self._fail()
+
+            if not self._rescaling:
+                self.status = PageView.Status.LOADING
+                self._load_preview()
+            return self._load_image(data)
+
         if not self.page.downloaded:
             if not window.network.is_online:
-                self.status = PageView.Status.FAILED
-                return
+                return self._fail()
 
             try:
                 request = self.page.get()
             except Exception:
-                self.status = PageView.Status.FAILED
-                return
-            request.setPriority(Request.Priority.HighPriority)
+                return self._fail()
+            request.setPriority(self.priority)
             request.setAttribute(
                 Request.Attribute.CacheLoadControlAttribute,
                 Request.CacheLoadControl.PreferCache,
             )
+            self._timings.source = "network"
 
         else:
             request = Request(QUrl.fromLocalFile(self.page.url))
+            self._timings.source = "file"
 
-        response = window.network.handle_request(request)
+        response = self._response = window.network.handle_request(request)
+        if not response.is_sent():
+            # Held back by the source's rate limit
+            response.started.connect(lambda: self._lap("queued"))
+        if self.image_size.isEmpty():
+            response.ready_read.connect(self._read_header)
         response.finished.connect(self._page_fetched)
-        self._cancel_request.connect(response.abort)
-        self.status = PageView.Status.LOADING
+        self._cancel_request.connect(response.deleteLater)
+        if not self._rescaling:
+            self.status = PageView.Status.LOADING
+            self._load_preview()
+
+    def _load_preview(self) -> None:
+        if self._preview is not None:
+            return
+
+        cache = self.window().app.preview_cache
+        if (pixmap := cache.get(self.page)) is not None:
+            return self._set_preview(pixmap)
+        if (task := cache.load(self.page, self)) is not None:
+            task.finished.connect(
+                lambda image, _: self._set_preview(QPixmap.fromImage(image))
+            )
+
+    def _set_preview(self, pixmap: QPixmap) -> None:
+        self._preview = pixmap
+        if self.image_size.isEmpty():
+            self.image_size = pixmap.size()
+        if self.status in (PageView.Status.NULL, PageView.Status.LOADING):
+            self.clear()
+            self.update()
+
+    def set_priority(self, priority: Request.Priority) -> None:
+        """Moves a page that's still waiting on its source's rate limit to another priority"""
+        response = self._response
+        if (
+            priority == self.priority
+            or self.status != PageView.Status.LOADING
+            or response is None
+            or response.is_sent()
+        ):
+            return
+
+        self.release()
+        self.fetch_page(priority)
+
+    def _read_header(self) -> None:
+        response: Response = self.sender()
+        data = response.peek(PageView.HEADER_SIZE)
+        size = read_image_size(data.data())
+        if size is None and data.size() < PageView.HEADER_SIZE:
+            return
+
+        response.ready_read.disconnect(self._read_header)
+        if size is not None and self.image_size.isEmpty():
+            self.image_size = size
 
     def _page_fetched(self) -> None:
         response: Response = self.sender()
         source = self.page.source
+        self._response = None
+
+        if response.error() == Response.Error.OperationCanceledError:
+            return
 
         if response.error() == Response.Error.NoError:
+            self._lap("network")
             if self.page.downloaded:
                 data = response.read_all()
             else:
@@ -97,8 +331,8 @@ class PageView(QLabel):
                     data = source.parse_page(response, self.page.to_source_page())
                 except Exception as e:
                     logger.error("Failed to parse page", exc_info=e)
-                    self.status = PageView.Status.FAILED
-                    return
+                    return self._fail()
+                self._lap("parse")
 
             self._load_image(data)
         else:
@@ -109,24 +343,264 @@ class PageView(QLabel):
                     f"Error occured while letting {source.name} handle page request error",
                     exc_info=e,
                 )
-            self.status = PageView.Status.FAILED
+            self._fail()
+
+    def _load_image(self, data: bytes | memoryview) -> None:
+        spec = PageView.image_spec(self._decoded_size)
+        if (info := probe_image(data)) is not None:
+            if self.image_size.isEmpty():
+                self.image_size = info.size
+            if spec.scaled_size(info.size).height() > PageView.TILE_HEIGHT * 2:
+                return self._set_tiles(data, info)
 
-    def _load_image(self, data: bytes) -> None:
-        thumbnail = QPixmap()
-        if not thumbnail.loadFromData(data):
-            self.status = PageView.Status.FAILED
+        task = self.window().app.image_pipeline.process(data, spec, self)
+        task.finished.connect(self._image_loaded)
+        task.failed.connect(self._image_failed)
+        self._cancel_request.connect(task.cancel)
+
+    def _lap(self, step: str) -> None:
+        # Records the time since the previous step of loading the page
+        now = time.perf_counter()
+        setattr(self._timings, step, (now - self._mark) * 1000)
+        self._mark = now
+
+    def _finish_timing(self) -> None:
+        if not self._timed:
             return
 
-        self.setScaledContents(True)
-        self.setPixmap(
-            thumbnail.scaledToWidth(900, Qt.TransformationMode.SmoothTransformation)
+        self._timed = False
+        self._timings.total = (time.perf_counter() - self._started) * 1000
+        self.timings = self._timings
+        self._painted = False
+
+    def _image_loaded(self, image: QImage, _: bytes) -> None:
+        self._lap("decode")
+        app = self.window().app
+        app.bitmap_cache.put(self.page, self._decoded_size, image)
+        app.preview_cache.add(self.page, image)
+        self._show_image(image)
+
+    def _bitmap_loaded(self, image: QImage, _: bytes) -> None:
+        self._lap("decode")
+        self._show_image(image)
+
+    def _show_image(self, image: QImage) -> None:
+        pixmap = QPixmap.fromImage(image)
+        self.window().app.page_cache.put(
+            PageCache.key(self.page, self._decoded_size), pixmap
         )
+        self._set_pixmap(pixmap)
+
+    def _set_pixmap(self, pixmap: QPixmap) -> None:
+        self._rescaling = False
+        self._clear_tiles()
+        self.setScaledContents(True)
+        self.setPixmap(pixmap)
+        self.image_size = pixmap.size()
+        self._finish_timing()
+
+        self.status = PageView.Status.LOADED
+        self.finished.emit()
+
+    def _image_failed(self) -> None:
+        self._fail()
+
+    def _set_tiles(self, data: bytes | memoryview, info: ImageInfo) -> None:
+        # A single pixmap of a very tall image can be larger than what the gpu accepts,
+        # so the image is kept encoded and only the tiles near the screen are decoded
+        self._rescaling = False
+        self._clear_tiles()
+        self._tile_data, self._source_info = data, info
+        self.window().app.preview_cache.add(self.page, data)
+        spec = PageView.image_spec(self._decoded_size)
+        self.image_size = spec.scaled_size(info.size)
+        self._finish_timing()
 
+        self.clear()
+        self.setScaledContents(True)
         self.status = PageView.Status.LOADED
+        self.update_tiles()
         self.finished.emit()
 
+    def _clear_tiles(self) -> None:
+        for task in self._tile_tasks.values():
+            task.cancel()
+        self._tile_tasks.clear()
+        self._tiles.clear()
+        self._tile_data = None
+
+        if self._image_task is not None:
+            self._image_task.cancel()
+        self._image_task = None
+        self._image_callbacks.clear()
+
+    def _decode_image(self) -> None:
+        if self._image_task is not None:
+            return
+
+        task = self.window().app.image_pipeline.process(
+            self._tile_data, PageView.image_spec(self._decoded_size), self
+        )
+        task.finished.connect(self._tiled_image_loaded)
+        task.failed.connect(self._tiled_image_failed)
+        self._image_task = task
+
+    def _tiled_image_loaded(self, image: QImage, _: bytes) -> None:
+        self._image_task = None
+        self.image_size = image.size()
+        callbacks, self._image_callbacks = self._image_callbacks, []
+        for callback in callbacks:
+            callback(image)
+
+        if not self._source_info.partial_decode:
+            for i, clip in self._missing_tiles():
+                self._tiles[i] = QPixmap.fromImage(image.copy(clip))
+            self.update()
+
+    def _tiled_image_failed(self) -> None:
+        self._image_task = None
+        self._image_callbacks.clear()
+
+    def set_exposed(self, rect: QRect | None) -> None:
+        """
+        Sets the part of the page that's on or near the screen. Only the tiles of a tiled page
+        that overlap it are kept. None exposes the whole page
+        """
+        self._exposed = rect
+        self.update_tiles()
+
+    def _wanted_tiles(self) -> range:
+        size = self.image_size
+        count = -(-size.height() // PageView.TILE_HEIGHT)
+        if self._exposed is None or self.height() <= 0:
+            return range(count)
+
+        scale = size.height() / self.height()
+        first = int(self._exposed.top() * scale) // PageView.TILE_HEIGHT
+        last = int(self._exposed.bottom() * scale) // PageView.TILE_HEIGHT
+        return range(max(first, 0), min(last, count - 1) + 1)
+
+    def _missing_tiles(self) -> list[tuple[int, QRect]]:
+        # The wanted tiles that aren't decoded yet and the part of the image they show
+        size = self.image_size
+        missing = []
+        for i in self._wanted_tiles():
+            if i in self._tiles or i in self._tile_tasks:
+                continue
+            top = i * PageView.TILE_HEIGHT
+            clip = QRect(
+                0, top, size.width(), min(PageView.TILE_HEIGHT, size.height() - top)
+            )
+            missing.append((i, clip))
+        return missing
+
+    def update_tiles(self) -> None:
+        if not self.tiled or self.status != PageView.Status.LOADED:
+            return
+
+        wanted = self._wanted_tiles()
+        for i in [i for i in self._tiles if i not in wanted]:
+            del self._tiles[i]
+        for i in [i for i in self._tile_tasks if i not in wanted]:
+            self._tile_tasks.pop(i).cancel()
+
+        missing = self._missing_tiles()
+        if missing and not self._source_info.partial_decode:
+            # Decoding each tile would decode the whole image every time, so the missing
+            # tiles are all cut from a single decode
+            return self._decode_image()
+
+        pipeline = self.window().app.image_pipeline
+        spec = PageView.image_spec(self._decoded_size)
+        for i, clip in missing:
+            task = pipeline.process(self._tile_data, replace(spec, clip=clip), self)
+            task.finished.connect(partial(self._tile_loaded, i))
+            task.failed.connect(partial(self._tile_tasks.pop, i, None))
+            self._tile_tasks[i] = task
+
+    def _tile_loaded(self, index: int, image: QImage, _: bytes) -> None:
+        self._tile_tasks.pop(index, None)
+        self._tiles[index] = QPixmap.fromImage(image)
+        self.update()
+
+    def _fail(self) -> None:
+        if self._rescaling:
+            # Keep showing the image it was decoded for
+            self._rescaling = False
+            return
+        self.status = PageView.Status.FAILED
+
+    def release(self) -> None:
+        """Frees the decoded image or stops it from loading. `fetch_page` loads it again"""
+        if self.status == PageView.Status.LOADING or self._rescaling:
+            self._cancel_request.emit()
+            self._response = None
+            self._rescaling = False
+        if self.status not in (PageView.Status.LOADING, PageView.Status.LOADED):
+            return
+
+        self._clear_tiles()
+        self.clear()
+        self.status = PageView.Status.NULL
+
+    def paintEvent(self, a0: QPaintEvent | None) -> None:
+        if self.status == PageView.Status.FAILED or (
+            self.status != PageView.Status.LOADED and self._preview is None
+        ):
+            return super().paintEvent(a0)
+        if self.status != PageView.Status.LOADED:
+            painter = QPainter(self)
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            return painter.drawPixmap(self.contentsRect(), self._preview)
+
+        if not self._painted:
+            self._painted = True
+            self.painted.emit()
+
+        # The image is decoded at the size it's shown at so this only scales while zooming or resizing
+        painter = QPainter(self)
+        painter.setRenderHint(
+            QPainter.RenderHint.SmoothPixmapTransform, not self.fast_scaling
+        )
+        rect = self.contentsRect()
+        if not self.tiled:
+            return painter.drawPixmap(rect, self.pixmap())
+
+        scale = rect.height() / self.image_size.height()
+        for i, tile in self._tiles.items():
+            target = QRectF(
+                rect.x(),
+                rect.y() + i * PageView.TILE_HEIGHT * scale,
+                rect.width(),
+                tile.height() * scale,
+            )
+            painter.drawPixmap(target, tile, QRectF(tile.rect()))
+
+    def image(self) -> QImage:
+        """The page's image. Null for tiled pages, which aren't kept in full, see `request_image`"""
+        if not self.tiled:
+            return self.pixmap().toImage()
+        return QImage()
+
+    def request_image(self, callback: Callable[[QImage], None] | None = None) -> None:
+        """
+        Calls `callback` with the page's image once it's loaded. Tiled pages are decoded in
+        full on the image pipeline first and the image is only kept by the callback
+        """
+        if self.status != PageView.Status.LOADED:
+            return
+
+        if not (image := self.image()).isNull():
+            if callback is not None:
+                callback(image)
+            return
+
+        if callback is not None:
+            self._image_callbacks.append(callback)
+        self._decode_image()
+
     def copy_image_to_clipboard(self) -> None:
-        QApplication.clipboard().setPixmap(self.pixmap())
+        self.request_image(QApplication.clipboard().setImage)
 
     def deleteLater(self) -> None:
         self._cancel_request.emit()
@@ -0,0 +1,176 @@
+from collections.abc import Sequence
+from functools import partial
+from logging import getLogger
+from typing import Callable, TYPE_CHECKING
+
+from PyQt6.QtCore import pyqtSignal, QObject, QSize
+from PyQt6.QtGui import QImage, QPixmap
+
+from yomu.core.models import Chapter, Page
+from yomu.core.network import Request, Response
+from yomu.core.pagecache import PageCache
+from yomu.source import Page as SourcePage
+
+from .page import PageView
+
+if TYPE_CHECKING:
+    from .core import Reader
+
+logger = getLogger(__name__)
+
+
+class ChapterPreloader(QObject):
+    """
+    Fetches the page list and first few pages of the chapter after the one being read so
+    switching to it doesn't wait on the source. Pages are decoded into the app's `PageCache`.
+    `preloaded` is emitted once the page list is ready to be taken and `failed` if it can't be
+    fetched, after which the chapter is no longer being preloaded.
+    """
+
+    page_count = 3
+
+    preloaded = pyqtSignal(Chapter)
+    failed = pyqtSignal(Chapter)
+
+    def __init__(self, reader: Reader) -> None:
+        super().__init__(reader)
+        self.reader = reader
+        self._chapter: Chapter | None = None
+        self._pages: list[Page] | None = None
+        self._responses: list[Response] = []
+        self._owner: QObject | None = None
+
+    def is_preloading(self, chapter: Chapter) -> bool:
+        return self._chapter is not None and self._chapter.id == chapter.id
+
+    def is_ready(self, chapter: Chapter) -> bool:
+        return self.is_preloading(chapter) and self._pages is not None
+
+    def preload(self, chapter: Chapter) -> None:
+        if self.is_preloading(chapter) or chapter.downloaded:
+            return
+
+        self.clear()
+        network = self.reader.window().network
+        if not network.is_online:
+            return self.failed.emit(chapter)
+
+        self._chapter = chapter
+        self._owner = QObject(self)
+        try:
+            request = chapter.get_pages()
+        except Exception as e:
+            logger.error("Failed to create chapter pages request", exc_info=e)
+            return self._fail()
+
+        request.setPriority(Request.Priority.LowPriority)
+        self._send(request, self._pages_fetched)
+
+    def take(self, chapter: Chapter) -> list[Page] | None:
+        """
+        Returns the chapter's pages if they were preloaded. Pages still being fetched keep
+        going so they end up in the cache. Preloading anything else is cancelled
+        """
+        if not self.is_ready(chapter):
+            self.clear()
+            return None
+
+        pages = self._pages
+        self._chapter = self._pages = None
+        return pages
+
+    def clear(self) -> None:
+        for response in self._responses:
+            response.deleteLater()
+        self._responses.clear()
+        if self._owner is not None:
+            self._owner.deleteLater()
+            self._owner = None
+        self._chapter = self._pages = None
+
+    def _send(self, request: Request, callback: Callable[[Response], None]) -> None:
+        response = self.reader.window().network.handle_request(request)
+        response.finished.connect(lambda: callback(response))
+        self._responses.append(response)
+
+    def _fail(self) -> None:
+        chapter = self._chapter
+        self.clear()
+        self.failed.emit(chapter)
+
+    def _finished(self, response: Response) -> bool:
+        try:
+            self._responses.remove(response)
+        except ValueError:
+            return False
+        return response.error() == Response.Error.NoError
+
+    def _pages_fetched(self, response: Response) -> None:
+        # Responses of a preload that was cleared are ignored
+        if response not in self._responses:
+            return
+        if not self._finished(response):
+            return self._fail()
+
+        chapter = self._chapter
+        try:
+            pages = chapter.source.parse_chapter_pages(
+                response, chapter.to_source_chapter()
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to parse chapter for {chapter.source.name}", exc_info=e
+            )
+            return self._fail()
+
+        if (
+            not isinstance(pages, Sequence)
+            or not pages
+            or not all(isinstance(page, SourcePage) for page in pages)
+        ):
+            return self._fail()
+
+        self._pages = [
+            Page.from_source_page(chapter, page)
+            for page in sorted(pages, key=lambda page: page.number)
+        ]
+
+        cache = self.reader.window().app.page_cache
+        size = self.reader.current_view.page_size()
+        for page in self._pages[: self.page_count]:
+            if cache.get(PageCache.key(page, size)) is not None:
+                continue
+            try:
+                request = page.get()
+            except Exception:
+                continue
+
+            request.setPriority(Request.Priority.LowPriority)
+            request.setAttribute(
+                Request.Attribute.CacheLoadControlAttribute,
+                Request.CacheLoadControl.PreferCache,
+            )
+            self._send(request, partial(self._page_fetched, page, size))
+
+        self.preloaded.emit(chapter)
+
+    def _page_fetched(self, page: Page, size: QSize, response: Response) -> None:
+        if not self._finished(response):
+            return
+
+        try:
+            data = page.source.parse_page(response, page.to_source_page())
+        except Exception as e:
+            logger.error("Failed to parse page", exc_info=e)
+            return
+
+        app = self.reader.window().app
+        task = app.image_pipeline.process(
+            data, PageView.image_spec(size), self._owner, priority=-1
+        )
+        task.finished.connect(partial(self._image_loaded, page, size))
+
+    def _image_loaded(self, page: Page, size: QSize, image: QImage, _: bytes) -> None:
+        self.reader.window().app.page_cache.put(
+            PageCache.key(page, size), QPixmap.fromImage(image)
+        )
@@ -0,0 +1,222 @@
+import time
+from collections import deque
+from dataclasses import dataclass, fields
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QElapsedTimer, QEvent, QObject, QTimer
+
+if TYPE_CHECKING:
+    from yomu.core.models import Chapter
+
+    from .core import Reader
+    from .page import PageView
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class PageTimings:
+    """
+    How long each step of showing a page took in milliseconds. Steps the page didn't go
+    through are None
+
+    Attributes
+    ----------
+    source : str
+        Where the page came from. Either memory, disk, archive, file or network
+    queued : float | None
+        The time the request waited on the source's rate limit
+    network : float | None
+        The time the request took once it was sent
+    parse : float | None
+        The time the source took to parse the response
+    decode : float | None
+        The time the image took to decode, or to be read back from the disk cache
+    total : float | None
+        The time from the page being requested to it being ready to show
+    """
+
+    source: str = ""
+    queued: float | None = None
+    network: float | None = None
+    parse: float | None = None
+    decode: float | None = None
+    total: float | None = None
+
+
+class ReaderStats(QObject):
+    """
+    Keeps track of how quickly the reader shows the current chapter: the time from opening
+    it to its first page being painted, the timings of every page it painted and the time
+    between frames while scrolling. A summary is logged when the reader moves on to another
+    chapter.
+    """
+
+    # Scrolling is considered to be over once the scroll bars stay still for this long
+    scroll_timeout = 100
+    # How many of the latest frame intervals are kept
+    recent_frames = 120
+
+    def __init__(self, reader: Reader) -> None:
+        super().__init__(reader)
+        self.reader = reader
+        self.chapter: Chapter | None = None
+        self.first_page: int | None = None
+        self.pages: list[PageTimings] = []
+        self.frames: deque[float] = deque(maxlen=self.recent_frames)
+
+        self._opened = QElapsedTimer()
+        self._last_frame: float | None = None
+        self._frame_count = 0
+        self._frame_total = 0.0
+        self._frame_max = 0.0
+        self._dropped_frames = 0
+
+        self._scroll_timer = QTimer(self)
+        self._scroll_timer.setSingleShot(True)
+        self._scroll_timer.setInterval(self.scroll_timeout)
+        self._scroll_timer.timeout.connect(self._scroll_stopped)
+
+        reader.verticalScrollBar().valueChanged.connect(self._scrolled)
+        reader.horizontalScrollBar().valueChanged.connect(self._scrolled)
+
+    @property
+    def dropped_frames(self) -> int:
+        return self._dropped_frames
+
+    @property
+    def max_frame(self) -> float:
+        return self._frame_max
+
+    @property
+    def average_frame(self) -> float | None:
+        if self._frame_count == 0:
+            return None
+        return self._frame_total / self._frame_count
+
+    def average(self, step: str) -> float | None:
+        """
+        Averages one step of the pages painted so far
+
+        Parameters
+        ----------
+        step : str
+            The name of a `PageTimings` attribute
+
+        Returns
+        -------
+        float | None
+            The average in milliseconds, or None if no page went through the step
+        """
+        values = [
+            value for page in self.pages if (value := getattr(page, step)) is not None
+        ]
+        if not values:
+            return None
+        return sum(values) / len(values)
+
+    def start_chapter(self, chapter: Chapter, *, timed: bool = True) -> None:
+        """
+        Logs the summary of the previous chapter and starts over
+
+        Parameters
+        ----------
+        chapter : Chapter
+            The chapter being read
+        timed : bool
+            Whether the time to the first page is measured. Chapters scrolled into in
+            continuous mode were loaded ahead of time
+        """
+        self.finish()
+        self.chapter = chapter
+        self.first_page = None
+        self.pages = []
+        self.frames.clear()
+        self._frame_count = 0
+        self._frame_total = self._frame_max = 0.0
+        self._dropped_frames = 0
+        if timed:
+            self._opened.start()
+        else:
+            self._opened.invalidate()
+
+    def finish(self) -> None:
+        if self.chapter is not None and (self.pages or self._frame_count):
+            logger.info(self.summary())
+        self.chapter = None
+
+    def watch(self, pages: list[PageView]) -> None:
+        for page in pages:
+            page.painted.connect(self._page_painted)
+
+    def summary(self) -> str:
+        chapter = self.chapter
+        title = chapter.title
+        if chapter.manga is not None:
+            title = f"{chapter.manga.title} - {title}"
+
+        parts = [title]
+        if self.first_page is not None:
+            parts.append(f"first page in {self.first_page} ms")
+
+        if self.pages:
+            sources: dict[str, int] = {}
+            for page in self.pages:
+                sources[page.source] = sources.get(page.source, 0) + 1
+            steps = ", ".join(
+                f"{field.name} {average:.0f} ms"
+                for field in fields(PageTimings)
+                if field.name != "source"
+                and (average := self.average(field.name)) is not None
+            )
+            loaded = ", ".join(
+                f"{count} from {source}" for source, count in sources.items()
+            )
+            parts.append(f"{len(self.pages)} pages ({loaded}) averaging {steps}")
+
+        if (average := self.average_frame) is not None:
+            parts.append(
+                f"{self._frame_count} frames averaging {average:.1f} ms, "
+                f"longest {self._frame_max:.1f} ms, {self._dropped_frames} dropped"
+            )
+        return "; ".join(parts)
+
+    def _page_painted(self) -> None:
+        page: PageView = self.sender()
+        if self.chapter is None or page.page.chapter.id != self.chapter.id:
+            return
+
+        if self.first_page is None and self._opened.isValid():
+            self.first_page = self._opened.elapsed()
+        self.pages.append(page.timings)
+
+    def _scrolled(self) -> None:
+        # Frames are only watched while scrolling so reading doesn't pay for it
+        if not self._scroll_timer.isActive():
+            self._last_frame = None
+            self.reader.window().installEventFilter(self)
+        self._scroll_timer.start()
+
+    def _scroll_stopped(self) -> None:
+        self.reader.window().removeEventFilter(self)
+
+    def _add_frame(self, interval: float) -> None:
+        self.frames.append(interval)
+        self._frame_count += 1
+        self._frame_total += interval
+        self._frame_max = max(self._frame_max, interval)
+
+        screen = self.reader.screen()
+        rate = screen.refreshRate() if screen is not None else 0
+        period = 1000 / (rate if rate > 0 else 60)
+        self._dropped_frames += max(round(interval / period) - 1, 0)
+
+    def eventFilter(self, a0: QObject, a1: QEvent) -> bool:
+        # The window repaints everything that changed once per frame
+        if a1.type() == QEvent.Type.UpdateRequest:
+            now = time.perf_counter()
+            if self._last_frame is not None:
+                self._add_frame((now - self._last_frame) * 1000)
+            self._last_frame = now
+        return super().eventFilter(a0, a1)
@@ -1,7 +1,7 @@
 from abc import ABC, ABCMeta, abstractmethod
 from typing import Callable, TYPE_CHECKING
 
-from PyQt6.QtCore import pyqtSignal, QPoint
+from PyQt6.QtCore import pyqtSignal, QPoint, QSize
 from PyQt6.QtWidgets import QMenu, QWidget
 
 
@@ -27,6 +27,8 @@ class BaseView(QWidget, ABC, metaclass=ViewMeta):
         Human-readable name of the view mode, defaults to class name if not set.
     supports_zoom : bool
         Whether this view supports zoom in/out operations. Defaults to False.
+    supports_continuous : bool
+        Whether this view can show the next chapter below the current one. Defaults to False.
     page_changed : pyqtSignal
         Signal emitted when the current page index changes, passing the new index.
     zoomed : pyqtSignal
@@ -37,6 +39,7 @@ class BaseView(QWidget, ABC, metaclass=ViewMeta):
 
     name: str
     supports_zoom: bool = False
+    supports_continuous: bool = False
 
     page_changed = pyqtSignal(int)
     zoomed = pyqtSignal()
@@ -125,12 +128,61 @@ class BaseView(QWidget, ABC, metaclass=ViewMeta):
         """
         return len(self.reader.pages)
 
+    def visible_pages(self) -> range:
+        """
+        Get the pages currently shown on screen.
+
+        The page loader fetches these before any other page. Views that show more than
+        one page at a time should override this.
+
+        Returns
+        -------
+        range
+            The indexes of the visible pages. Empty if no page is set.
+        """
+        if self._current_index < 0:
+            return range(0)
+        return range(self._current_index, self._current_index + 1)
+
+    def loadable_pages(self) -> range:
+        """
+        Get the pages that may be loaded in the background.
+
+        Views that limit how many decoded pages they keep should override this so pages
+        aren't fetched only to be released again.
+
+        Returns
+        -------
+        range
+            The indexes of the pages that may be loaded.
+        """
+        return range(self.page_count)
+
+    def page_size(self) -> QSize:
+        """
+        Get the size pages are decoded to.
+
+        Pages are decoded straight to the size they're shown at so no time or memory is spent
+        on pixels that are scaled away. Views that don't fit pages to the viewport's width
+        should override this.
+
+        Returns
+        -------
+        QSize
+            The size in device pixels. Either the width or the height is -1, in which case it
+            follows the page's aspect ratio.
+        """
+        width = self.reader.viewport().width() * self.devicePixelRatioF()
+        return QSize(round(width), -1)
+
     @abstractmethod
     def set_page_views(self, pages: list[PageView]) -> None:
         """
         Display a list of page views in this view.
 
         Subclasses must implement this to render the provided pages according to their specific layout strategy.
+        Views that support continuous reading get called again with the next chapter's pages, which go
+        after the ones already shown.
 
         Parameters
         ----------
@@ -138,6 +190,19 @@ class BaseView(QWidget, ABC, metaclass=ViewMeta):
             A list of PageView objects to display.
         """
 
+    def remove_page_views(self, count: int) -> None:
+        """
+        Remove the first pages from the view, keeping the pages on screen where they are.
+
+        Only called if supports_continuous is True, once the reader is far enough past a chapter.
+        The removed page views are deleted by the reader.
+
+        Parameters
+        ----------
+        count : int
+            The number of pages to remove.
+        """
+
     @abstractmethod
     def clear(self) -> None:
         """
@@ -146,20 +211,32 @@ class BaseView(QWidget, ABC, metaclass=ViewMeta):
         Subclasses must implement this to perform cleanup of displayed pages.
         """
 
-    def zoom_out(self) -> None:
+    def zoom_out(self, anchor: QPoint | None = None) -> None:
         """
         Handle a zoom out request from the user.
 
         Only called if supports_zoom is True. Subclasses should override this
         to implement zoom out functionality and emit the zoomed signal when complete.
+
+        Parameters
+        ----------
+        anchor : QPoint | None
+            The position in the reader's viewport that should stay in place, usually the cursor.
+            None if the zoom didn't come from the mouse.
         """
 
-    def zoom_in(self) -> None:
+    def zoom_in(self, anchor: QPoint | None = None) -> None:
         """
         Handle a zoom in request from the user.
 
         Only called if supports_zoom is True. Subclasses should override this
         to implement zoom in functionality and emit the zoomed signal when complete.
+
+        Parameters
+        ----------
+        anchor : QPoint | None
+            The position in the reader's viewport that should stay in place, usually the cursor.
+            None if the zoom didn't come from the mouse.
         """
 
     @abstractmethod
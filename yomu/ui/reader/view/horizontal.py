@@ -1,6 +1,7 @@
-from typing import TYPE_CHECKING
+from bisect import bisect_left, bisect_right
+from typing import Callable, TYPE_CHECKING
 
-from PyQt6.QtCore import QEvent, QPoint, QRect, Qt
+from PyQt6.QtCore import QEvent, QPoint, QRect, QSize, Qt
 from PyQt6.QtWidgets import QHBoxLayout, QWidget
 
 from yomu.ui.components.iterator import LayoutIterator
@@ -22,27 +23,67 @@ class HorizontalPage(QWidget):
         layout.addWidget(page)
         self.setLayout(layout)
 
+        # Pages off screen are hidden so their size changes have to be passed on by hand
+        page.size_changed.connect(parent.layout().invalidate)
+
     @property
     def status(self) -> PageView.Status:
         return self.page_view.status
 
     @property
     def aspect_ratio(self) -> float:
-        if self.status != PageView.Status.LOADED:
+        # Known before the page loads for most pages so the layout doesn't shift as they do
+        size = self.page_view.image_size
+        if size.isEmpty():
             return 1.0
-        size = self.page_view.pixmap().size()
         return size.width() / size.height()
 
 
 class HorizontalLayout(QHBoxLayout):
+    def __init__(self, parent: HorizontalView) -> None:
+        super().__init__(parent)
+        # Where each page starts followed by where the last one ends
+        self.offsets = [0]
+        # The pages given a geometry by the last layout pass, the rest are hidden
+        self._placed = range(0)
+
     def setGeometry(self, a0: QRect) -> None:
         left, height = 0, self.parentWidget().height()
+        offsets = [0]
         for i in range(self.count()):
             page: HorizontalPage = self.itemAt(i).widget()
-            width = round(height * page.aspect_ratio)
-            page.setGeometry(left, 0, width, height)
-            left += width
+            left += round(height * page.aspect_ratio)
+            offsets.append(left)
+        self.offsets = offsets
         self.parentWidget().setFixedWidth(left)
+        self.place_pages()
+
+    def place_pages(self) -> None:
+        """Gives the pages within a screen of the viewport their geometry and hides the others"""
+        view: HorizontalView = self.parentWidget()
+        left = view.reader.horizontalScrollBar().value()
+        width = view.reader.viewport().width()
+        placed = self.pages_between(left - width, left + width * 2)
+
+        for i in self._placed:
+            if i not in placed and i < self.count():
+                self.itemAt(i).widget().hide()
+
+        offsets, height = self.offsets, view.height()
+        for i in placed:
+            page = self.itemAt(i).widget()
+            page.setGeometry(offsets[i], 0, offsets[i + 1] - offsets[i], height)
+            page.show()
+        self._placed = placed
+
+    def pages_between(self, left: int, right: int) -> range:
+        offsets = self.offsets
+        if len(offsets) != self.count() + 1 or right <= 0 or left >= offsets[-1]:
+            return range(0)
+
+        first = max(bisect_right(offsets, left) - 1, 0)
+        last = min(bisect_left(offsets, right) - 1, self.count() - 1)
+        return range(first, last + 1)
 
 
 class HorizontalView(BaseView, LayoutIterator[HorizontalPage]):
@@ -64,6 +105,8 @@ class HorizontalView(BaseView, LayoutIterator[HorizontalPage]):
             reader.height() - (scrollbar.height() if scrollbar.isVisible() else 0)
         )
 
+    layout: Callable[[], HorizontalLayout]
+
     def eventFilter(self, a0: QWidget, a1: QEvent) -> bool:
         if a0 == self.reader and a1.type() == QEvent.Type.Resize:
             scrollbar = a0.horizontalScrollBar()
@@ -80,16 +123,12 @@ class HorizontalView(BaseView, LayoutIterator[HorizontalPage]):
         if not layout.count() or self.current_index < 0:
             return
 
-        current_page: HorizontalPage = layout.itemAt(self.current_index).widget()
-        for i in range(layout.count()):
-            widget: HorizontalPage = layout.itemAt(i).widget()
-            if (
-                not widget.visibleRegion().isEmpty()
-                and self.current_index != i
-                and current_page.visibleRegion().isEmpty()
-            ):
-                self.current_index = i
-                break
+        layout.place_pages()
+        self.reader.page_loader.update()
+
+        visible = self.visible_pages()
+        if self.current_index not in visible:
+            self.current_index = visible[0]
 
         scrollBar = self.reader.horizontalScrollBar()
         if (
@@ -102,14 +141,28 @@ class HorizontalView(BaseView, LayoutIterator[HorizontalPage]):
         super().set_current_index(page)
         if page > -1:
             scrollbar = self.reader.horizontalScrollBar()
-            widget = self.layout().itemAt(page).widget()
-            if not (widget.x() < scrollbar.value() < (widget.x() + widget.width())):
-                scrollbar.setValue(widget.x())
+            offsets = self.layout().offsets
+            if len(offsets) > page + 1 and not (
+                offsets[page] < scrollbar.value() < offsets[page + 1]
+            ):
+                scrollbar.setValue(offsets[page])
+
+    def visible_pages(self) -> range:
+        left = self.reader.horizontalScrollBar().value()
+        right = left + self.reader.viewport().width()
+        # The pages haven't been laid out yet if none of them are visible
+        return self.layout().pages_between(left, right) or super().visible_pages()
+
+    def page_size(self) -> QSize:
+        return QSize(-1, round(self.height() * self.devicePixelRatioF()))
 
     def set_page_views(self, views: list[PageView]) -> None:
         layout = self.layout()
         for view in views:
-            layout.addWidget(HorizontalPage(self, view))
+            page = HorizontalPage(self, view)
+            # Shown once the layout places it
+            page.hide()
+            layout.addWidget(page)
 
     def clear(self) -> None:
         layout = self.layout()
@@ -118,7 +171,9 @@ class HorizontalView(BaseView, LayoutIterator[HorizontalPage]):
 
     def page_at(self, pos: QPoint) -> PageView | None:
         pos = self.mapFromParent(pos)
-        for page_widget in self:
+        layout = self.layout()
+        if pages := layout.pages_between(pos.x(), pos.x() + 1):
+            page_widget = layout.itemAt(pages[0]).widget()
             if page_widget.geometry().contains(pos):
                 return page_widget.page_view
 
@@ -37,25 +37,46 @@ class AnimationGroup(QParallelAnimationGroup):
 
 
 class PageWidget(QWidget):
-    def __init__(self, parent: SinglePageView, page_view: PageView) -> None:
+    def __init__(self, parent: SinglePageView) -> None:
         super().__init__(parent)
-        self.page_view = page_view
+        self.page_view: PageView | None = None
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
-        layout.addWidget(page_view)
         self.setLayout(layout)
 
+    def set_page_view(self, page_view: PageView | None) -> None:
+        if (old := self.page_view) is not None:
+            # Pages without a widget are kept hidden by the view
+            self.layout().removeWidget(old)
+            old.setParent(self.parentWidget())
+            old.hide()
+
+        self.page_view = page_view
+        if page_view is not None:
+            self.layout().addWidget(page_view)
+            page_view.show()
+
     @property
     def page_status(self) -> PageView.Status:
+        if self.page_view is None:
+            return PageView.Status.NULL
         return self.page_view.status
 
     def image_size(self) -> QSize:
-        return self.page_view.pixmap().size()
+        if self.page_view is None:
+            return QSize()
+        return self.page_view.image_size
 
 
 class StackLayout(QStackedLayout):
+    """
+    Only the current page and the ones next to it get a `PageWidget`. The widgets are reused
+    as the reader moves through the chapter, and the ones next to the current page are kept
+    at the geometry they'll be shown at so turning the page doesn't wait on anything.
+    """
+
     def __init__(
         self,
         view: SinglePageView,
@@ -63,20 +84,83 @@ class StackLayout(QStackedLayout):
         animation_direction: AnimationDirection,
     ) -> None:
         super().__init__(view)
+        self.view = view
         self.reader = view.reader
         self.fit_direction = fit_direction
         self.animation_direction = animation_direction
         self._animation = None
 
+        self.pages: list[PageView] = []
+        self.ring: dict[int, PageWidget] = {}
+        self.current_page = -1
+
         self.setContentsMargins(0, 0, 0, 0)
         self.setSpacing(0)
 
     currentWidget: Callable[[], PageWidget | None]
 
     def page_widget_at(self, index: int) -> PageWidget | None:
-        if (item := self.itemAt(index)) is not None:
-            return item.widget()
-        return None
+        return self.ring.get(index)
+
+    def set_pages(self, pages: list[PageView]) -> None:
+        self.pages = pages
+        for page in pages:
+            page.setParent(self.view)
+            page.hide()
+            # Pages next to the current one are hidden, so their size changes are passed on by hand
+            page.status_changed.connect(self.update)
+            page.size_changed.connect(self.update)
+
+    def clear_pages(self) -> None:
+        if self._animation:
+            self._animation.stop()
+        for widget in self.ring.values():
+            self.removeWidget(widget)
+            widget.deleteLater()
+        for page in self.pages:
+            page.deleteLater()
+        self.ring.clear()
+        self.pages = []
+        self.current_page = -1
+
+    def show_page(self, index: int) -> None:
+        if self._animation:
+            self._animation.stop()
+
+        previous, self.current_page = self.current_page, index
+        self._fill_ring(previous)
+        self._slide_to_widget(self.ring[index], index > previous)
+        self._place_neighbours()
+
+    def _fill_ring(self, keep: int = -1) -> None:
+        # The page being turned away from keeps its widget until the animation is done
+        index, count = self.current_page, len(self.pages)
+        wanted = [i for i in (index - 1, index, index + 1, keep) if 0 <= i < count]
+
+        free = [self.ring.pop(i) for i in list(self.ring) if i not in wanted]
+        for i in wanted:
+            if i in self.ring:
+                continue
+            if free:
+                widget = free.pop()
+            else:
+                widget = PageWidget(self.view)
+                self.addWidget(widget)
+            widget.set_page_view(self.pages[i])
+            self.ring[i] = widget
+
+        for widget in free:
+            widget.set_page_view(None)
+            self.removeWidget(widget)
+            widget.deleteLater()
+
+    def _place_neighbours(self) -> None:
+        current = self.currentWidget()
+        if self._animation is not None:
+            return
+        for widget in self.ring.values():
+            if widget is not current:
+                widget.setGeometry(self.calculate_target_geometry(widget))
 
     def fit_to_width(self, image_size: QSize) -> QRect:
         reader_size = self.reader.size()
@@ -101,23 +185,21 @@ class StackLayout(QStackedLayout):
         return QRect(0, 0, width, height)
 
     def calculate_target_geometry(self, widget: PageWidget) -> QRect:
-        if widget.page_status == PageView.Status.LOADED:
-            image_size = widget.image_size()
+        # Pages whose size is known are fitted before they load so they don't move once they do
+        image_size = widget.image_size()
+        if not image_size.isEmpty():
             if self.fit_direction == FitDirection.Width:
                 return self.fit_to_width(image_size)
             else:
                 return self.fit_to_height(image_size)
         return QRect(QPoint(0, 0), self.reader.size())
 
-    def _slide_to_widget(self, index: int) -> None:
-        if self._animation:
-            self._animation.stop()
-
-        current_index = self.currentIndex()
-        if current_index == index:
-            return QStackedLayout.setCurrentIndex(self, index)
+    def _slide_to_widget(self, new_page: PageWidget, is_next_page: bool) -> None:
+        current_page = self.currentWidget()
+        if current_page is None or current_page is new_page:
+            QStackedLayout.setCurrentWidget(self, new_page)
+            return self._fill_ring()
 
-        is_next_page = index > current_index
         animation_direction = (
             is_next_page
             and self.animation_direction == AnimationDirection.LEFT_TO_RIGHT
@@ -126,9 +208,6 @@ class StackLayout(QStackedLayout):
             and self.animation_direction == AnimationDirection.RIGHT_TO_LEFT
         )
 
-        current_page = self.currentWidget()
-        new_page = self.page_widget_at(index)
-
         reader_width = self.reader.width()
 
         current_page_animation = QPropertyAnimation(current_page, b"geometry")
@@ -163,27 +242,21 @@ class StackLayout(QStackedLayout):
         self._animation.addAnimation(new_page_animation)
 
         def on_animation_finished():
-            QStackedLayout.setCurrentIndex(self, index)
+            QStackedLayout.setCurrentWidget(self, new_page)
             self._animation = None
+            self._fill_ring()
+            self._place_neighbours()
 
         new_page.show()
         self._animation.finished.connect(on_animation_finished)
         self._animation.start(QParallelAnimationGroup.DeletionPolicy.DeleteWhenStopped)
 
-    def setCurrentIndex(self, index: int) -> None:
-        self._slide_to_widget(index)
-
-    def setCurrentWidget(self, w: QWidget | None) -> None:
-        index = self.indexOf(w)
-        if index != -1:
-            self._slide_to_widget(index)
-
     def setGeometry(self, rect: QRect) -> None:
         current_widget = self.currentWidget()
         view: SinglePageView = self.parentWidget()
         if current_widget is not None:
-            if current_widget.page_status == PageView.Status.LOADED:
-                image_size = current_widget.image_size()
+            image_size = current_widget.image_size()
+            if not image_size.isEmpty():
                 if self.fit_direction == FitDirection.Width:
                     rect = self.fit_to_width(image_size)
                     view.setFixedSize(
@@ -204,6 +277,7 @@ class StackLayout(QStackedLayout):
         else:
             view.setFixedSize(self.reader.size())
         super().setGeometry(rect)
+        self._place_neighbours()
 
 
 class SinglePageView(BaseView):
@@ -226,16 +300,20 @@ class SinglePageView(BaseView):
     def set_current_index(self, page: int) -> None:
         super().set_current_index(page)
         if page > -1:
-            self.layout().setCurrentIndex(page)
+            self.layout().show_page(page)
             self.reader.verticalScrollBar().setValue(0)
             if self.page_count > 0 and page == self.page_count - 1:
                 self.reader.mark_chapter_as_read()
 
+    def page_size(self) -> QSize:
+        size = self.reader.size() * self.devicePixelRatioF()
+        if self.fit_direction == FitDirection.Width:
+            return QSize(size.width(), -1)
+        return QSize(-1, size.height())
+
     def set_page_views(self, views: list[PageView]) -> None:
-        layout = self.layout()
         with QSignalBlocker(self):
-            for view in views:
-                layout.addWidget(PageWidget(self, view))
+            self.layout().set_pages(views)
 
     def page_at(self, pos: QPoint) -> PageView | None:
         page_widget = self.layout().currentWidget()
@@ -243,10 +321,8 @@ class SinglePageView(BaseView):
             return page_widget.page_view
 
     def clear(self) -> None:
-        layout = self.layout()
         with QSignalBlocker(self):
-            while layout.count():
-                layout.takeAt(0).widget().deleteLater()
+            self.layout().clear_pages()
         self._current_index = -1
 
 
@@ -1,7 +1,9 @@
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from typing import Callable, TYPE_CHECKING
 
-from PyQt6.QtCore import QPoint, QSizeF, Qt
-from PyQt6.QtWidgets import QVBoxLayout, QWidget
+from PyQt6.QtCore import QPoint, QRect, QSize, QSizeF, QTimer
+from PyQt6.QtWidgets import QSizePolicy, QVBoxLayout, QWidget
 
 from yomu.ui.components.iterator import LayoutIterator
 from yomu.ui.reader.page import PageView
@@ -15,129 +17,343 @@ if TYPE_CHECKING:
 class WebtoonPage(QWidget):
     def __init__(self, parent: WebtoonView, page: PageView):
         super().__init__(parent)
+        self.view = parent
         self.page_view = page
-        self.scale = 1
+        # The page's size when the view isn't zoomed
+        self.base_size = QSizeF()
 
+        # The view sizes the page so the image doesn't get a say in it
+        page.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
         layout.addWidget(page)
         self.setLayout(layout)
 
-        page.status_changed.connect(self._status_changed)
-        self._status_changed(page.status)
+        page.size_changed.connect(self._size_changed)
+        page.finished.connect(parent.schedule_resident_pages)
+        self._size_changed(page.image_size)
 
-    def _status_changed(self, status: PageView.Status) -> None:
-        if status in (PageView.Status.NULL, PageView.Status.LOADING):
-            size = (QSizeF(922, 922) * self.scale).toSize()
-            return self.setFixedSize(size)
-        if status == PageView.Status.LOADED:
-            size = self.page_view.pixmap().size()
+    def _size_changed(self, size: QSize) -> None:
+        # Pages are square until their size is known, which is usually from the image's header before it's decoded.
+        # Released pages keep the size of their image so the layout doesn't jump around
+        width = WebtoonView.PAGE_WIDTH
+        if size.isEmpty():
+            base_size = QSizeF(width, width)
+        else:
+            base_size = QSizeF(width, width * size.height() / size.width())
 
-            height = 922 * size.height() / size.width()
-            new_size = QSizeF(922, height).toSize()
+        # The decoded image is scaled so its aspect ratio can be off by a fraction of a pixel
+        if round(base_size.height()) != round(self.base_size.height()):
+            self.base_size = base_size
+            self.view.invalidate_offsets()
 
-            self.setFixedSize(new_size * self.scale)
 
-    def scale_page(self, factor: float) -> None:
-        self.setFixedSize(self.size() * factor)
-        self.scale *= factor
+class WebtoonLayout(QVBoxLayout):
+    def __init__(self, parent: WebtoonView) -> None:
+        super().__init__(parent)
+        self.view = parent
+        self.setContentsMargins(0, 0, 0, 0)
+        self.setSpacing(0)
+        self.setSizeConstraint(QVBoxLayout.SizeConstraint.SetNoConstraint)
+        self._placed: tuple[QRect, list[int], int] | None = None
+
+    def setGeometry(self, a0: QRect) -> None:
+        # Pages are placed straight from the view's offsets in a single pass
+        view = self.view
+        pages, offsets = view.page_offsets()
+        width = view.page_width()
+        # Loading a page asks for a layout too, there's nothing to move unless the offsets changed
+        placed = (QRect(a0), offsets, width)
+        if placed == self._placed:
+            return
+        self._placed = placed
+        view.setMinimumWidth(width)
+        view.setFixedHeight(offsets[-1])
+
+        x = max((a0.width() - width) // 2, 0)
+        for page, top, bottom in zip(pages, offsets, offsets[1:]):
+            page.setGeometry(x, top, width, bottom - top)
 
 
 class WebtoonView(BaseView, LayoutIterator[WebtoonPage]):
     name = "Webtoon"
     supports_zoom = True
+    supports_continuous = True
+    resident_screens = 2
+    PAGE_WIDTH = 922
+    zoom_step = 1.25
+    max_zoom_level = 5
 
     def __init__(self, reader: Reader) -> None:
         super().__init__(reader)
-        layout = QVBoxLayout(self)
-        layout.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        self.setLayout(layout)
+        self.setLayout(WebtoonLayout(self))
 
         self._loading = True
-        self.scale_factor = 1
+        self._visible = range(0)
+        self._resident = range(0)
+        self._offsets: tuple[list[WebtoonPage], list[int]] | None = None
+        self.zoom_level = 0
+
+        # Pages are scaled with a fast transformation while zooming and decoded again at their new size once it stops
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(300)
+        self._zoom_timer.timeout.connect(self._zoom_finished)
+
+        # Scrolling moves the viewport many times per frame so the resident pages are worked out once the events settle
+        self._resident_timer = QTimer(self)
+        self._resident_timer.setSingleShot(True)
+        self._resident_timer.setInterval(0)
+        self._resident_timer.timeout.connect(self.update_resident_pages)
 
         scrollbar = reader.verticalScrollBar()
         scrollbar.valueChanged.connect(self.mark_chapter_as_read)
         scrollbar.valueChanged.connect(self._set_surrent_page)
+        scrollbar.valueChanged.connect(self.schedule_resident_pages)
 
         self.zoomed.connect(self._set_surrent_page)
+        self.zoomed.connect(self.schedule_resident_pages)
+        self.zoomed.connect(self._zoom_started)
         self.page_changed.connect(self._set_surrent_page)
 
-    layout: Callable[[], QVBoxLayout]
+    layout: Callable[[], WebtoonLayout]
+
+    @property
+    def scale_factor(self) -> float:
+        return self.zoom_step**self.zoom_level
 
     def set_current_index(self, page: int) -> None:
         super().set_current_index(page)
         if page > -1:
             scrollbar = self.reader.verticalScrollBar()
-            widget = self.layout().itemAt(page).widget()
-            if not (widget.y() < scrollbar.value() < (widget.y() + widget.height())):
-                scrollbar.setValue(widget.y())
+            _, offsets = self.page_offsets()
+            if not (offsets[page] < scrollbar.value() < offsets[page + 1]):
+                scrollbar.setValue(offsets[page])
+
+    def page_offsets(self) -> tuple[list[WebtoonPage], list[int]]:
+        """
+        The pages and where each of them starts, followed by where the last one ends.
+        The offsets are worked out from the page sizes and the zoom so they're right even before the layout places the pages.
+        """
+        if self._offsets is None:
+            pages, scale = list(self), self.scale_factor
+            heights = (round(page.base_size.height() * scale) for page in pages)
+            self._offsets = pages, [0, *accumulate(heights)]
+        return self._offsets
+
+    def invalidate_offsets(self) -> None:
+        self._offsets = None
+        self.layout().invalidate()
+
+    def page_width(self) -> int:
+        return round(WebtoonView.PAGE_WIDTH * self.scale_factor)
+
+    def pages_between(self, top: int, bottom: int) -> range:
+        pages, offsets = self.page_offsets()
+        if not pages or bottom <= 0 or top >= offsets[-1]:
+            return range(0)
+
+        first = max(bisect_right(offsets, top) - 1, 0)
+        last = min(bisect_left(offsets, bottom) - 1, len(pages) - 1)
+        return range(first, last + 1)
 
     def _set_surrent_page(self) -> None:
-        layout = self.layout()
-        if not layout.count() or self.current_index < 0:
+        if self.current_index < 0:
             return
 
-        current_page: PageView = layout.itemAt(self.current_index).widget()
-        for i in range(layout.count()):
-            widget: PageView = layout.itemAt(i).widget()
-            if (
-                not widget.visibleRegion().isEmpty()
-                and self.current_index != i
-                and current_page.visibleRegion().isEmpty()
-            ):
-                self.current_index = i
-                break
+        top = self.reader.verticalScrollBar().value()
+        visible = self.pages_between(top, top + self.reader.viewport().height())
+        if visible and self.current_index not in visible:
+            self.current_index = visible[0]
 
     def set_page_views(self, views: list[PageView]) -> None:
         self._loading = True
 
         layout = self.layout()
+        start = layout.count()
         for view in views:
             webtoon_page = WebtoonPage(self, view)
             layout.addWidget(webtoon_page)
+        self.invalidate_offsets()
+
+        # The pages might have been loaded by another view so they're checked once
+        resident = self._resident
+        self._resident = range(resident.start if resident else start, layout.count())
+        self._loading = False
+        self.update_resident_pages()
+
+    def remove_page_views(self, count: int) -> None:
+        _, offsets = self.page_offsets()
+        scrollbar = self.reader.verticalScrollBar()
+        value = scrollbar.value() - offsets[count]
 
+        self._loading = True
+        layout = self.layout()
+        for _ in range(count):
+            layout.takeAt(0).widget().deleteLater()
+        self.invalidate_offsets()
+        layout.setGeometry(self.rect())
+        resident = self._resident
+        self._resident = range(
+            max(resident.start - count, 0), max(resident.stop - count, 0)
+        )
+
+        # The same page stays on screen, it just has a lower index now
+        self._current_index = max(self._current_index - count, -1)
+        scrollbar.setValue(value)
         self._loading = False
-        self.scale_pages(self.scale_factor)
+        self.update_resident_pages()
+
+    @property
+    def memory_budget(self) -> int:
+        budget = self.window().app.settings.value("reader_memory_budget", 512, int)
+        return budget * 1024 * 1024
+
+    def schedule_resident_pages(self) -> None:
+        self._resident_timer.start()
+
+    def update_resident_pages(self) -> None:
+        """
+        Works out which pages may keep their decoded images: the ones within `resident_screens`
+        screens of the viewport, closest first, until `memory_budget` is used up. Visible pages
+        are always kept. The other pages are released and the page loader fetches the missing ones.
+        Only the pages around the viewport are looked at so scrolling doesn't depend on the page count.
+        """
+        self._resident_timer.stop()
+        pages, offsets = self.page_offsets()
+        if self._loading or not pages:
+            return
 
-    def scale_pages(self, scale_factor: float) -> None:
+        height = self.reader.viewport().height()
+        top = self.reader.verticalScrollBar().value()
+        bottom = top + height
+        margin = height * self.resident_screens
+
+        def cost(index: int) -> int:
+            page_view = pages[index].page_view
+            return page_view.pixmap_bytes or page_view.estimated_bytes
+
+        visible = self.pages_between(top, bottom)
+        used = sum(cost(i) for i in visible)
+        if visible:
+            above, below = visible[0] - 1, visible[-1] + 1
+        else:
+            above = below = min(bisect_right(offsets, top), len(pages))
+            above -= 1
+
+        # Grow the visible pages towards whichever neighbour is closer until one is too far or too big
+        budget = self.memory_budget
+        while True:
+            up = top - offsets[above + 1] if above >= 0 else margin
+            down = offsets[below] - bottom if below < len(pages) else margin
+            if min(up, down) >= margin:
+                break
+
+            index = above if up <= down else below
+            used += cost(index)
+            if used > budget:
+                break
+            if index == above:
+                above -= 1
+            else:
+                below += 1
+
+        # Pages are only loaded while they're resident so only the ones leaving are released
+        resident, previous = range(above + 1, below), self._resident
+        for i in range(previous.start, min(previous.stop, len(pages))):
+            if i not in resident:
+                pages[i].page_view.release()
+
+        self._visible, self._resident = visible, resident
+        for i in resident:
+            page = pages[i]
+            if page.page_view.tiled:
+                # Tall pages only decode the tiles within a screen of the viewport
+                exposed = QRect(0, top - offsets[i] - height, page.width(), height * 3)
+                page.page_view.set_exposed(exposed)
+
+        self.reader.page_loader.update()
+
+    def visible_pages(self) -> range:
+        return self._visible
+
+    def loadable_pages(self) -> range:
+        return self._resident
+
+    def page_size(self) -> QSize:
+        return QSize(round(self.page_width() * self.devicePixelRatioF()), -1)
+
+    def _zoom_started(self) -> None:
+        for page in self:
+            page.page_view.fast_scaling = True
+        self._zoom_timer.start()
+
+    def _zoom_finished(self) -> None:
         for page in self:
-            page.scale_page(scale_factor)
+            page.page_view.fast_scaling = False
+            page.page_view.update()
+        self.reader.page_loader.update()
 
     def page_at(self, pos: QPoint) -> PageView | None:
         pos = self.mapFromParent(pos)
-        for page_widget in self:
-            if page_widget.geometry().contains(pos):
+        pages, offsets = self.page_offsets()
+        index = bisect_right(offsets, pos.y()) - 1
+        if 0 <= index < len(pages):
+            page_widget = pages[index]
+            if page_widget.x() <= pos.x() < page_widget.x() + page_widget.width():
                 return page_widget.page_view
 
-    def zoom_out(self):
-        factor = 0.8
-        if self.scale_factor <= factor**5:
-            return
+    def zoom_out(self, anchor: QPoint | None = None) -> None:
+        self.zoom(self.zoom_level - 1, anchor)
 
-        scrollbar = self.reader.verticalScrollBar()
-        value = int(scrollbar.value() / 1.25)
+    def zoom_in(self, anchor: QPoint | None = None) -> None:
+        self.zoom(self.zoom_level + 1, anchor)
 
-        self.scale_pages(factor)
-        self.scale_factor *= factor
-        scrollbar.setValue(value)
-
-        self.zoomed.emit()
-
-    def zoom_in(self) -> None:
-        factor = 1.25
-        if self.scale_factor >= factor**5:
+    def zoom(self, level: int, anchor: QPoint | None = None) -> None:
+        """
+        Scales every page to `zoom_step` to the power of `level`. The point of the page under
+        `anchor`, a position in the viewport, stays where it is. Defaults to the viewport's center
+        """
+        if abs(level) > self.max_zoom_level or level == self.zoom_level:
             return
 
-        scrollbar = self.reader.verticalScrollBar()
-        value = int(scrollbar.value() * 1.25)
-
-        self.scale_pages(factor)
-        self.scale_factor *= factor
-        scrollbar.setValue(value)
+        reader, viewport = self.reader, self.reader.viewport()
+        vertical, horizontal = reader.verticalScrollBar(), reader.horizontalScrollBar()
+        if anchor is None:
+            anchor = viewport.rect().center()
+
+        # Where the anchor is relative to the page under it
+        pages, offsets = self.page_offsets()
+        y = vertical.value() + anchor.y()
+        index = min(max(bisect_right(offsets, y) - 1, 0), len(pages) - 1)
+        if pages:
+            height = offsets[index + 1] - offsets[index]
+            dy = (y - offsets[index]) / max(height, 1)
+            dx = (horizontal.value() + anchor.x() - pages[index].x()) / max(
+                pages[index].width(), 1
+            )
+
+        # The offsets are dropped without invalidating the layout since it's done right here
+        self.zoom_level = level
+        self._offsets = None
+        pages, offsets = self.page_offsets()
+        width = self.page_width()
+
+        # Size the view for the new scale before laying the pages out so it's only done once
+        layout = self.layout()
+        layout.setEnabled(False)
+        self.setMinimumWidth(width)
+        self.setFixedHeight(offsets[-1])
+        self.resize(max(viewport.width(), width), offsets[-1])
+        layout.setEnabled(True)
+        layout.setGeometry(self.rect())
+
+        if pages:
+            height = offsets[index + 1] - offsets[index]
+            vertical.setValue(round(offsets[index] + dy * height - anchor.y()))
+            x = pages[index].x() + dx * pages[index].width()
+            horizontal.setValue(round(x - anchor.x()))
 
         self.zoomed.emit()
 
@@ -149,10 +365,19 @@ class WebtoonView(BaseView, LayoutIterator[WebtoonPage]):
         ):
             self.reader.mark_chapter_as_read()
 
+    def unload(self) -> None:
+        for page in self:
+            page.page_view.set_exposed(None)
+
     def clear(self) -> None:
         self._loading = True
 
         layout = self.layout()
         while layout.count():
             layout.takeAt(0).widget().deleteLater()
+        self.invalidate_offsets()
+        self._zoom_timer.stop()
+        self._resident_timer.stop()
         self._current_index = -1
+        self._visible = range(0)
+        self._resident = range(0)
@@ -1,8 +1,8 @@
 from logging import getLogger
 from typing import Callable, TYPE_CHECKING
 
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QCloseEvent, QMouseEvent
+from PyQt6.QtCore import QLocale, Qt, pyqtSignal
+from PyQt6.QtGui import QCloseEvent, QMouseEvent, QShowEvent
 from PyQt6.QtWidgets import (
     QComboBox,
     QCheckBox,
@@ -11,18 +11,23 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QHeaderView,
     QLabel,
+    QSpinBox,
     QTabWidget,
     QTableWidgetItem,
     QTableWidget,
+    QTreeWidget,
+    QTreeWidgetItem,
     QVBoxLayout,
     QWidget,
 )
 
 from yomu.core import utils
+from yomu.core.storage import PageFormat, StorageBackend
 from .reader import Reader
 
 if TYPE_CHECKING:
     from yomu.core.extensionmanager import ExtensionInfo, ExtensionManager
+    from yomu.core.sql import Sql
     from yomu.source import Source
     from .window import ReaderWindow
 
@@ -43,6 +48,46 @@ class BoolOption(QCheckBox):
         self.value_changed.emit(self.key, state == Qt.CheckState.Checked)
 
 
+class IntOption(QSpinBox):
+    value_changed = pyqtSignal((str, object))
+
+    def __init__(
+        self,
+        key: str,
+        value: int,
+        minimum: int,
+        maximum: int,
+        *,
+        suffix: str = "",
+        special_value_text: str = "",
+    ) -> None:
+        super().__init__()
+        self.key = key
+        self.setRange(minimum, maximum)
+        self.setSuffix(suffix)
+        self.setSpecialValueText(special_value_text)
+        self.setValue(value)
+        self.valueChanged.connect(self._value_changed)
+
+    def _value_changed(self, value: int) -> None:
+        self.value_changed.emit(self.key, value)
+
+
+class ChoiceOption(QComboBox):
+    value_changed = pyqtSignal((str, object))
+
+    def __init__(self, key: str, choices: dict[str, object], value: object) -> None:
+        super().__init__()
+        self.key = key
+        for name, data in choices.items():
+            self.addItem(name, data)
+        self.setCurrentIndex(max(self.findData(value), 0))
+        self.currentIndexChanged.connect(self._current_index_changed)
+
+    def _current_index_changed(self, index: int) -> None:
+        self.value_changed.emit(self.key, self.itemData(index))
+
+
 class Keybinds(QTableWidget):
     def __init__(self, parent: Settings) -> None:
         super().__init__(parent)
@@ -76,6 +121,43 @@ class Keybinds(QTableWidget):
                 row += 1
 
 
+class StorageUsage(QTreeWidget):
+    def __init__(self, parent: Settings, sql: Sql) -> None:
+        super().__init__(parent)
+        self.sql = sql
+        self.setContentsMargins(0, 0, 0, 0)
+        self.setColumnCount(2)
+        self.setHeaderLabels(("Name", "Size"))
+        self.header().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.header().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        self.header().setStretchLastSection(False)
+
+    def showEvent(self, a0: QShowEvent | None) -> None:
+        self.refresh()
+        super().showEvent(a0)
+
+    def refresh(self) -> None:
+        self.clear()
+        locale = QLocale()
+
+        total = QTreeWidgetItem(
+            ("Total", locale.formattedDataSize(self.sql.get_download_usage()))
+        )
+        self.addTopLevelItem(total)
+
+        source_items: dict[int, QTreeWidgetItem] = {}
+        for source, size in self.sql.get_source_download_usage().items():
+            item = QTreeWidgetItem((source.name, locale.formattedDataSize(size)))
+            source_items[source.id] = item
+            self.addTopLevelItem(item)
+
+        for manga, size in self.sql.get_manga_download_usage().items():
+            if (parent := source_items.get(manga.source.id)) is not None:
+                parent.addChild(
+                    QTreeWidgetItem((manga.title, locale.formattedDataSize(size)))
+                )
+
+
 class Settings(QDialog):
     def __init__(self, window: ReaderWindow) -> None:
         super().__init__(window)
@@ -90,6 +172,8 @@ class Settings(QDialog):
         widget = QFrame(tab_view)
         layout = QVBoxLayout(widget)
         layout.addWidget(self._create_general_settings())
+        layout.addWidget(self._create_download_settings())
+        layout.addWidget(self._create_smart_download_settings())
         layout.addWidget(
             self._create_library_settings(window.app.source_manager.sources)
         )
@@ -109,6 +193,9 @@ class Settings(QDialog):
         window.app.keybinds_changed.connect(keybinds_table.set_keybindings)
         tab_view.addTab(keybinds_table, "Keybinds")
 
+        storage_usage = StorageUsage(self, window.app.sql)
+        tab_view.addTab(storage_usage, "Storage")
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -147,6 +234,188 @@ class Settings(QDialog):
         general_group_layout.addWidget(delete_after_read_label)
         return general_settings_group
 
+    def _create_download_settings(self) -> QGroupBox:
+        download_settings_group = QGroupBox(QWidget.tr("Downloads"), self)
+        download_group_layout = QVBoxLayout(download_settings_group)
+
+        key = "download_storage"
+        storage = ChoiceOption(
+            key,
+            {
+                "Folder": StorageBackend.FOLDER.value,
+                "Archive (CBZ)": StorageBackend.ARCHIVE.value,
+            },
+            self.settings.value(key, StorageBackend.FOLDER.value, int),
+        )
+        storage.value_changed.connect(self._option_changed)
+
+        storage_label = QLabel()
+        storage_label.setWordWrap(True)
+        storage_label.setText(
+            "Save each chapter as a folder of pages or as a single cbz archive. Only affects new downloads"
+        )
+
+        key = "download_format"
+        page_format = ChoiceOption(
+            key,
+            {
+                "Original": PageFormat.ORIGINAL.value,
+                "JPEG": PageFormat.JPEG.value,
+                "WebP": PageFormat.WEBP.value,
+            },
+            self.settings.value(key, PageFormat.ORIGINAL.value, int),
+        )
+        page_format.value_changed.connect(self._option_changed)
+
+        page_format_label = QLabel()
+        page_format_label.setWordWrap(True)
+        page_format_label.setText(
+            "Format downloaded pages are saved as. Original keeps the image sent by the source"
+        )
+
+        key = "download_quality"
+        quality = IntOption(
+            key,
+            self.settings.value(key, 90, int),
+            1,
+            100,
+            suffix="%",
+        )
+        quality.value_changed.connect(self._option_changed)
+
+        quality_label = QLabel()
+        quality_label.setWordWrap(True)
+        quality_label.setText("Quality used when saving pages as JPEG or WebP")
+
+        key = "download_max_width"
+        max_width = IntOption(
+            key,
+            self.settings.value(key, 0, int),
+            0,
+            10000,
+            suffix=" px",
+            special_value_text="Original Width",
+        )
+        max_width.value_changed.connect(self._option_changed)
+
+        max_width_label = QLabel()
+        max_width_label.setWordWrap(True)
+        max_width_label.setText("Pages wider than this are scaled down before saving")
+
+        key = "download_quota"
+        quota = IntOption(
+            key,
+            self.settings.value(key, 0, int),
+            0,
+            1024 * 1024,
+            suffix=" MB",
+            special_value_text="Unlimited",
+        )
+        quota.value_changed.connect(self._option_changed)
+
+        quota_label = QLabel()
+        quota_label.setWordWrap(True)
+        quota_label.setText(
+            "Chapters read the longest time ago are deleted once downloads use more space than this"
+        )
+
+        download_group_layout.addWidget(storage)
+        download_group_layout.addWidget(storage_label)
+        download_group_layout.addSpacing(10)
+        download_group_layout.addWidget(page_format)
+        download_group_layout.addWidget(page_format_label)
+        download_group_layout.addSpacing(10)
+        download_group_layout.addWidget(quality)
+        download_group_layout.addWidget(quality_label)
+        download_group_layout.addSpacing(10)
+        download_group_layout.addWidget(max_width)
+        download_group_layout.addWidget(max_width_label)
+        download_group_layout.addSpacing(10)
+        download_group_layout.addWidget(quota)
+        download_group_layout.addWidget(quota_label)
+        return download_settings_group
+
+    def _create_smart_download_settings(self) -> QGroupBox:
+        smart_download_group = QGroupBox(QWidget.tr("Smart Download"), self)
+        smart_download_layout = QVBoxLayout(smart_download_group)
+
+        key = "smart_download"
+        enabled = BoolOption(
+            key, "Prefetch Upcoming Chapters", self.settings.value(key, False, bool)
+        )
+        enabled.value_changed.connect(self._option_changed)
+
+        enabled_label = QLabel()
+        enabled_label.setWordWrap(True)
+        enabled_label.setText(
+            "Download the next chapters in the background while reading. Prefetched chapters are deleted once read"
+        )
+
+        key = "smart_download_metered"
+        metered = BoolOption(
+            key, "Prefetch on Metered Networks", self.settings.value(key, False, bool)
+        )
+        metered.value_changed.connect(self._option_changed)
+
+        key = "smart_download_chapters"
+        chapters = IntOption(
+            key, self.settings.value(key, 2, int), 1, 10, suffix=" chapter(s)"
+        )
+        chapters.value_changed.connect(self._option_changed)
+
+        chapters_label = QLabel()
+        chapters_label.setWordWrap(True)
+        chapters_label.setText("Number of chapters to prefetch")
+
+        key = "smart_download_threshold"
+        threshold = IntOption(
+            key, self.settings.value(key, 50, int), 0, 100, suffix="%"
+        )
+        threshold.value_changed.connect(self._option_changed)
+
+        threshold_label = QLabel()
+        threshold_label.setWordWrap(True)
+        threshold_label.setText("Start prefetching once this much of a chapter is read")
+
+        key = "smart_download_ttl"
+        ttl = IntOption(key, self.settings.value(key, 72, int), 1, 720, suffix=" h")
+        ttl.value_changed.connect(self._option_changed)
+
+        ttl_label = QLabel()
+        ttl_label.setWordWrap(True)
+        ttl_label.setText(
+            "Delete prefetched chapters that aren't opened within this time"
+        )
+
+        key = "smart_download_min_free_space"
+        min_free_space = IntOption(
+            key, self.settings.value(key, 1024, int), 0, 1024 * 1024, suffix=" MB"
+        )
+        min_free_space.value_changed.connect(self._option_changed)
+
+        min_free_space_label = QLabel()
+        min_free_space_label.setWordWrap(True)
+        min_free_space_label.setText(
+            "Don't prefetch when the disk has less free space than this"
+        )
+
+        smart_download_layout.addWidget(enabled)
+        smart_download_layout.addWidget(enabled_label)
+        smart_download_layout.addWidget(metered)
+        smart_download_layout.addSpacing(10)
+        smart_download_layout.addWidget(chapters)
+        smart_download_layout.addWidget(chapters_label)
+        smart_download_layout.addSpacing(10)
+        smart_download_layout.addWidget(threshold)
+        smart_download_layout.addWidget(threshold_label)
+        smart_download_layout.addSpacing(10)
+        smart_download_layout.addWidget(ttl)
+        smart_download_layout.addWidget(ttl_label)
+        smart_download_layout.addSpacing(10)
+        smart_download_layout.addWidget(min_free_space)
+        smart_download_layout.addWidget(min_free_space_label)
+        return smart_download_group
+
     def _library_source_changed(self, index: int) -> None:
         combo_box: QComboBox = self.sender()
         source: Source | None = combo_box.itemData(index)
@@ -185,8 +454,68 @@ class Settings(QDialog):
         combo_box_label = QLabel()
         combo_box_label.setText("Set this window's current reader mode")
 
+        key = "reader_continuous"
+        continuous = BoolOption(
+            key, "Continuous Webtoon", self.settings.value(key, False, bool)
+        )
+        continuous.value_changed.connect(self._option_changed)
+
+        continuous_label = QLabel()
+        continuous_label.setWordWrap(True)
+        continuous_label.setText(
+            "Show the next chapter below the current one in webtoon mode instead of stopping at the end"
+        )
+
+        key = "reader_memory_budget"
+        memory_budget = IntOption(
+            key, self.settings.value(key, 512, int), 64, 8192, suffix=" MB"
+        )
+        memory_budget.value_changed.connect(self._option_changed)
+
+        memory_budget_label = QLabel()
+        memory_budget_label.setWordWrap(True)
+        memory_budget_label.setText(
+            "Memory the webtoon reader can use for pages near the one being read. Pages further away are loaded again when scrolled back to"
+        )
+
+        key = "page_cache_size"
+        page_cache = IntOption(
+            key, self.settings.value(key, 256, int), 0, 8192, suffix=" MB"
+        )
+        page_cache.value_changed.connect(self._option_changed)
+
+        page_cache_label = QLabel()
+        page_cache_label.setWordWrap(True)
+        page_cache_label.setText(
+            "Recently read pages are kept in memory so going back to them doesn't load them again"
+        )
+
+        key = "bitmap_cache_size"
+        bitmap_cache = IntOption(
+            key, self.settings.value(key, 0, int), 0, 64 * 1024, suffix=" MB"
+        )
+        bitmap_cache.value_changed.connect(self._option_changed)
+
+        bitmap_cache_label = QLabel()
+        bitmap_cache_label.setWordWrap(True)
+        bitmap_cache_label.setText(
+            "Decoded pages are saved to disk so reopening a recently read chapter doesn't decode them again. 0 turns it off"
+        )
+
         reader_group_layout.addWidget(combo_box)
         reader_group_layout.addWidget(combo_box_label)
+        reader_group_layout.addSpacing(10)
+        reader_group_layout.addWidget(continuous)
+        reader_group_layout.addWidget(continuous_label)
+        reader_group_layout.addSpacing(10)
+        reader_group_layout.addWidget(memory_budget)
+        reader_group_layout.addWidget(memory_budget_label)
+        reader_group_layout.addSpacing(10)
+        reader_group_layout.addWidget(page_cache)
+        reader_group_layout.addWidget(page_cache_label)
+        reader_group_layout.addSpacing(10)
+        reader_group_layout.addWidget(bitmap_cache)
+        reader_group_layout.addWidget(bitmap_cache_label)
         return reader_settings_group
 
     def _create_extension_settings(
@@ -237,7 +566,7 @@ class Settings(QDialog):
 
         return settings
 
-    def _option_changed(self, key: str, new_value: bool) -> None:
+    def _option_changed(self, key: str, new_value: object) -> None:
         self.settings.setValue(key, new_value)
 
     def closeEvent(self, a0: QCloseEvent | None) -> None:
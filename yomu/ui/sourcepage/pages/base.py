@@ -56,8 +56,7 @@ class BasePage(QWidget):
 
     def insert_mangas(self, sourceMangas: list[SourceManga]) -> None:
         mangas = self.sql.add_and_get_mangas(self.parent().source, sourceMangas)
-        for manga in mangas:
-            self._manga_list.add_manga(manga).fetch_thumbnail()
+        self._manga_list.add_mangas(mangas)
 
     def set_current_widget(self) -> None: ...
 